@@ -10,6 +10,7 @@ from core.visualization.plotly_charts import (
     fundamentals_trend,
     indices_comparison,
     peer_comparison,
+    plotlyjs_url,
     price_candlestick,
     relative_performance,
     recommendation_waterfall,
@@ -23,6 +24,11 @@ from core.visualization.chart_explanations import build_chart_insights
 bp = Blueprint("routes", __name__)
 logger = get_logger(__name__)
 
+
+@bp.app_context_processor
+def _plotlyjs():
+    return {"plotlyjs_url": plotlyjs_url()}
+
 # Popular stock tickers for autocomplete suggestions
 POPULAR_TICKERS = {
     # Tech Giants
@@ -199,10 +205,10 @@ def index():
 
             logger.info(f"Generating charts for {ticker}")
             charts = {
-                "price": price_candlestick(snapshot.price_history, analysis.technicals),
-                "volume": volume_chart(snapshot.price_history),
-                "relative": relative_performance(snapshot.price_history, benchmark_prices),
-                "volatility": rolling_volatility(snapshot.price_history),
+                "price": price_candlestick(snapshot.price_history, analysis.technicals, ticker),
+                "volume": volume_chart(snapshot.price_history, ticker),
+                "relative": relative_performance(snapshot.price_history, benchmark_prices, ticker),
+                "volatility": rolling_volatility(snapshot.price_history, ticker),
                 "fundamentals": fundamentals_trend(
                     analysis.fundamentals.time_series, "Fundamental Trends"
                 ),
@@ -482,18 +488,18 @@ def get_chart_data():
         if chart_type == "price":
             # Get technicals for price chart
             from core.analytics.technicals import build_technical_indicators
-            technicals = build_technical_indicators(price_history)
-            chart_html = price_candlestick(price_history, technicals)
+            technicals = build_technical_indicators(price_history, ticker, interval)
+            chart_html = price_candlestick(price_history, technicals, ticker)
         elif chart_type == "volume":
-            chart_html = volume_chart(price_history)
+            chart_html = volume_chart(price_history, ticker)
         elif chart_type == "relative":
-            chart_html = relative_performance(price_history, benchmark_history)
+            chart_html = relative_performance(price_history, benchmark_history, ticker)
         elif chart_type == "volatility":
-            # Rolling volatility needs at least 20 data points
-            if len(price_history) < 20:
-                chart_html = "<div style='padding: 40px; text-align: center; color: #64748b;'>Not enough data for volatility calculation (need 20+ days)</div>"
+            # Rolling volatility needs 20 daily returns, i.e. at least 21 data points
+            if len(price_history) < 21:
+                chart_html = "<div style='padding: 40px; text-align: center; color: #64748b;'>Not enough data for volatility calculation (need 21+ days)</div>"
             else:
-                chart_html = rolling_volatility(price_history)
+                chart_html = rolling_volatility(price_history, ticker)
         elif chart_type == "indices":
             # Major indices comparison chart
             indices = {
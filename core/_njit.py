@@ -0,0 +1,19 @@
+"""
+Optional numba JIT.
+
+`njit` compiles the decorated function when numba is installed and is a
+no-op decorator otherwise, so kernels can be written once and still run
+without the dependency. Check HAS_NUMBA to pick a vectorized fallback
+where an interpreted loop would be too slow.
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
@@ -0,0 +1,71 @@
+"""
+Numeric kernels for batch scoring.
+
+numba is optional: with it the weighted aggregation is compiled to machine
+code (cached on disk after the first call); without it an equivalent NumPy
+implementation is used. Both accumulate factors in column order so totals
+match ScoringService.score() exactly.
+"""
+
+import numpy as np
+
+from core._njit import HAS_NUMBA, njit
+
+# Rating codes in the totals returned by weighted_score_batch
+INVEST, WATCH, AVOID = 0, 1, 2
+
+
+def _weighted_score_loop(factor_scores, weights, invest_threshold, watch_threshold):
+    """
+    Per-factor contributions, weighted totals and rating codes for an
+    (N, K) factor matrix, in a single pass over the factors.
+    
+    Args:
+        factor_scores: (N, K) float array of factor scores
+        weights: (N, K) float array of per-row factor weights
+        invest_threshold: minimum total for INVEST
+        watch_threshold: minimum total for WATCH
+    
+    Returns:
+        (N, 2) float array of (total clamped to 0-100, rating code) and
+        (N, K) float array of factor_scores * weights
+    """
+    n, k = factor_scores.shape
+    out = np.empty((n, 2))
+    contributions = np.empty((n, k))
+    for i in range(n):
+        total = 0.0
+        for j in range(k):
+            contribution = factor_scores[i, j] * weights[i, j]
+            contributions[i, j] = contribution
+            total += contribution
+        total = min(max(total, 0.0), 100.0)
+        out[i, 0] = total
+        if total >= invest_threshold:
+            out[i, 1] = INVEST
+        elif total >= watch_threshold:
+            out[i, 1] = WATCH
+        else:
+            out[i, 1] = AVOID
+    return out, contributions
+
+
+def _weighted_score_numpy(factor_scores, weights, invest_threshold, watch_threshold):
+    """Column-at-a-time NumPy equivalent of _weighted_score_loop."""
+    n, k = factor_scores.shape
+    contributions = np.multiply(factor_scores, weights)
+    total = np.zeros(n)
+    for j in range(k):
+        total += contributions[:, j]
+    np.clip(total, 0, 100, out=total)
+    out = np.empty((n, 2))
+    out[:, 0] = total
+    out[:, 1] = np.where(total >= invest_threshold, INVEST, np.where(total >= watch_threshold, WATCH, AVOID))
+    return out, contributions
+
+
+if HAS_NUMBA:
+    # No fastmath: reassociating the sum would break parity with score()
+    weighted_score_batch = njit(cache=True)(_weighted_score_loop)
+else:
+    weighted_score_batch = _weighted_score_numpy
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
+import hashlib
 from typing import Dict, List, Optional
 
 
@@ -13,7 +15,7 @@ class PriceAnalytics:
     current: Optional[float] = None  # Current price for timing calculations
 
 
-@dataclass
+@dataclass(frozen=True)
 class TechnicalIndicators:
     ma_20: Optional[float]
     ma_50: Optional[float]
@@ -73,6 +75,43 @@ class AnalysisPack:
     earnings: EarningsSummary
     recommendation: Optional["Recommendation"]
 
+    def content_digest(self) -> str:
+        """Digest of every input ScoringService reads; equal digests score identically."""
+        fundamentals = self.fundamentals
+        sentiment = self.sentiment
+        key = (
+            self.price,
+            self.technicals,
+            fundamentals.valuation,
+            fundamentals.profitability,
+            fundamentals.growth,
+            self.risk,
+            self.peers.percentile_ranks if self.peers else None,
+            sentiment.headline_score,
+            sentiment.headline_volume,
+            sentiment.positive_count,
+            sentiment.negative_count,
+            sentiment.overall_sentiment,
+        )
+        return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+@dataclass(slots=True, frozen=True)
+class Fmt:
+    """A display number that is only formatted when rendered; value stays raw for JSON/CLI."""
+    value: Optional[float]
+    spec: str = ".1f"
+    scale: float = 1
+    suffix: str = ""
+
+    def __str__(self) -> str:
+        if self.value is None:
+            return "N/A"
+        return f"{self.value * self.scale:{self.spec}}{self.suffix}"
+
+    def __float__(self) -> float:
+        return float(self.value)
+
 
 @dataclass
 class Recommendation:
@@ -84,9 +123,19 @@ class Recommendation:
     risks: List[str]
     triggers: List[str]
     rating_description: str = ""
-    factor_details: Dict[str, Dict] = None
     factor_scores: Dict[str, float] = None
     timing_signal: str = "Fair"  # Excellent, Good, Fair, Poor
     timing_score: float = 50.0
     timing_description: str = ""
-    is_etf: bool = False
\ No newline at end of file
+    is_etf: bool = False
+    factor_inputs: Dict[str, Dict] = field(default=None, repr=False)
+
+    @cached_property
+    def factor_details(self) -> Optional[Dict[str, Dict]]:
+        # Formatting is deferred so bulk scoring that only reads the
+        # rating and score never builds the display strings
+        if self.factor_inputs is None:
+            return None
+        from core.scoring_service import format_factor_details
+
+        return format_factor_details(self.factor_inputs)
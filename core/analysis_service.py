@@ -19,7 +19,9 @@ class AnalysisService:
             snapshot.context.benchmark, start, end, interval
         )
         price = build_price_analytics(snapshot.price_history, benchmark_prices)
-        technicals = build_technical_indicators(snapshot.price_history)
+        technicals = build_technical_indicators(
+            snapshot.price_frame, snapshot.context.ticker, interval
+        )
         fundamentals = build_fundamental_analytics(
             snapshot.fundamentals, snapshot.financial_statements
         )
@@ -25,7 +25,10 @@ def build_price_analytics(price_history, benchmark_history=None):
             current=None,
         )
 
-    df = pd.DataFrame([point.__dict__ for point in price_history])
+    df = pd.DataFrame(
+        [(point.date, point.close) for point in price_history],
+        columns=["date", "close"],
+    )
     df["date"] = pd.to_datetime(df["date"])
     df = df.set_index("date").sort_index()
     returns = df["close"].pct_change().dropna()
@@ -48,7 +51,10 @@ def build_price_analytics(price_history, benchmark_history=None):
     beta = None
     correlation = None
     if benchmark_history:
-        bench_df = pd.DataFrame([point.__dict__ for point in benchmark_history])
+        bench_df = pd.DataFrame(
+            [(point.date, point.close) for point in benchmark_history],
+            columns=["date", "close"],
+        )
         bench_df["date"] = pd.to_datetime(bench_df["date"])
         bench_df = bench_df.set_index("date").sort_index()
         combined = pd.concat(
@@ -1,6 +1,10 @@
+from types import MappingProxyType
+
+import numpy as np
 import pandas as pd
 
 from core.analysis_models import TechnicalIndicators
+from core.models import PriceFrame
 
 
 TREND_WINDOWS = {
@@ -12,13 +16,28 @@ TREND_WINDOWS = {
     "5y": 252 * 5,
 }
 
+# Shared read-only result for empty histories; callers never mutate trends
+_NEUTRAL_TRENDS = MappingProxyType({key: "neutral" for key in TREND_WINDOWS})
+
+# Indicator results keyed by ticker, interval and a hash of the full close
+# series, so a revised bar anywhere in the history misses the cache
+_INDICATOR_CACHE = {}
+_INDICATOR_CACHE_SIZE = 512
+
+
+def _rsi(close, window=14):
+    if len(close) < window:
+        return float("nan")
+    delta = np.diff(close, prepend=close[0])
+    gain = np.where(delta > 0, delta, 0.0)[-window:].mean()
+    loss = np.where(delta < 0, -delta, 0.0)[-window:].mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = np.float64(gain) / loss
+        return 100 - (100 / (1 + rs))
 
-def _rsi(series, window=14):
-    delta = series.diff()
-    gain = delta.where(delta > 0, 0).rolling(window=window).mean()
-    loss = -delta.where(delta < 0, 0).rolling(window=window).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
+
+def _ema(values, span):
+    return pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy()
 
 
 def _trend_label(change):
@@ -31,7 +50,7 @@ def _trend_label(change):
     return "neutral"
 
 
-def build_technical_indicators(price_history):
+def build_technical_indicators(price_history, ticker=None, interval=None):
     if not price_history:
         return TechnicalIndicators(
             ma_20=None,
@@ -42,45 +61,53 @@ def build_technical_indicators(price_history):
             macd_signal=None,
             bollinger_upper=None,
             bollinger_lower=None,
-            trend_by_horizon={key: "neutral" for key in TREND_WINDOWS},
+            trend_by_horizon=_NEUTRAL_TRENDS,
         )
 
-    df = pd.DataFrame([point.__dict__ for point in price_history])
-    df["date"] = pd.to_datetime(df["date"])
-    df = df.set_index("date").sort_index()
-    close = df["close"]
-
-    ma_20 = close.rolling(window=20).mean().iloc[-1] if len(close) >= 20 else None
-    ma_50 = close.rolling(window=50).mean().iloc[-1] if len(close) >= 50 else None
-    ma_200 = close.rolling(window=200).mean().iloc[-1] if len(close) >= 200 else None
-
-    rsi_series = _rsi(close)
-    rsi_14 = rsi_series.iloc[-1] if not rsi_series.empty else None
-
-    ema_12 = close.ewm(span=12, adjust=False).mean()
-    ema_26 = close.ewm(span=26, adjust=False).mean()
-    macd_series = ema_12 - ema_26
-    macd = macd_series.iloc[-1] if not macd_series.empty else None
-    signal_series = macd_series.ewm(span=9, adjust=False).mean()
-    macd_signal = signal_series.iloc[-1] if not signal_series.empty else None
-
-    rolling_mean = close.rolling(window=20).mean()
-    rolling_std = close.rolling(window=20).std()
-    bollinger_upper = (
-        (rolling_mean + (2 * rolling_std)).iloc[-1]
-        if len(close) >= 20
-        else None
-    )
-    bollinger_lower = (
-        (rolling_mean - (2 * rolling_std)).iloc[-1]
-        if len(close) >= 20
-        else None
-    )
+    if not isinstance(price_history, PriceFrame):
+        price_history = PriceFrame.from_points(price_history)
+
+    # Every close goes into the key: providers revise past bars, and intraday
+    # histories change as the session runs. Results are frozen, so a cached
+    # one can be handed to every caller
+    close = price_history.close
+    key = (ticker, interval, len(close), hash(close.tobytes()))
+    cached = _INDICATOR_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    indicators = _compute_indicators(close)
+    if len(_INDICATOR_CACHE) >= _INDICATOR_CACHE_SIZE:
+        _INDICATOR_CACHE.pop(next(iter(_INDICATOR_CACHE), None), None)
+    _INDICATOR_CACHE[key] = indicators
+    return indicators
+
+
+def _compute_indicators(close):
+    count = len(close)
+
+    # The 20-day mean feeds both MA 20 and the Bollinger bands
+    if count >= 20:
+        tail_20 = close[-20:]
+        ma_20 = tail_20.mean()
+        std_20 = tail_20.std(ddof=1)
+        bollinger_upper = ma_20 + (2 * std_20)
+        bollinger_lower = ma_20 - (2 * std_20)
+    else:
+        ma_20 = bollinger_upper = bollinger_lower = None
+    ma_50 = close[-50:].mean() if count >= 50 else None
+    ma_200 = close[-200:].mean() if count >= 200 else None
+
+    rsi_14 = _rsi(close)
+
+    macd_series = _ema(close, 12) - _ema(close, 26)
+    macd = macd_series[-1]
+    macd_signal = _ema(macd_series, 9)[-1]
 
     trend_by_horizon = {}
     for horizon, window in TREND_WINDOWS.items():
-        if len(close) > window:
-            change = (close.iloc[-1] / close.iloc[-window - 1]) - 1
+        if count > window:
+            change = (close[-1] / close[-window - 1]) - 1
         else:
             change = None
         trend_by_horizon[horizon] = _trend_label(change)
@@ -94,5 +121,5 @@ def build_technical_indicators(price_history):
         macd_signal=macd_signal,
         bollinger_upper=bollinger_upper,
         bollinger_lower=bollinger_lower,
-        trend_by_horizon=trend_by_horizon,
+        trend_by_horizon=MappingProxyType(trend_by_horizon),
     )
@@ -1,10 +1,19 @@
 import hashlib
 import os
 import pickle
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timezone
 
 from core.config import CACHE_DIR
 
+NS_PER_SECOND = 1_000_000_000
+
+
+def _to_datetime(stored_at_ns):
+    """Convert an epoch-ns timestamp to the naive UTC datetime callers expect."""
+    stamp = datetime.fromtimestamp(stored_at_ns / NS_PER_SECOND, tz=timezone.utc)
+    return stamp.replace(tzinfo=None)
+
 
 class MemoryCache:
     """Lightweight in-memory cache for low-memory environments."""
@@ -24,26 +33,25 @@ class MemoryCache:
         if stored_at is None:
             return None, None
         
-        expires_at = stored_at + timedelta(seconds=ttl_seconds)
-        if datetime.utcnow() > expires_at:
+        if time.time_ns() > stored_at + ttl_seconds * NS_PER_SECOND:
             del self._store[key]
             return None, None
         
-        return payload.get("data"), stored_at
+        return payload.get("data"), _to_datetime(stored_at)
     
     def set(self, key, data):
         # Evict oldest if at capacity
         if len(self._store) >= self.MAX_SIZE:
             oldest_key = min(self._store.keys(), 
-                           key=lambda k: self._store[k].get("stored_at", datetime.min))
+                           key=lambda k: self._store[k].get("stored_at", 0))
             del self._store[oldest_key]
         
         payload = {
-            "stored_at": datetime.utcnow(),
+            "stored_at": time.time_ns(),
             "data": data,
         }
         self._store[key] = payload
-        return payload["stored_at"]
+        return _to_datetime(payload["stored_at"])
 
 
 class DiskCache:
@@ -67,19 +75,19 @@ class DiskCache:
             return None, None
 
         stored_at = payload.get("stored_at")
-        if stored_at is None:
+        # Entries written before stored_at became epoch-ns are treated as stale
+        if not isinstance(stored_at, int):
             return None, None
 
-        expires_at = stored_at + timedelta(seconds=ttl_seconds)
-        if datetime.utcnow() > expires_at:
+        if time.time_ns() > stored_at + ttl_seconds * NS_PER_SECOND:
             return None, None
 
-        return payload.get("data"), stored_at
+        return payload.get("data"), _to_datetime(stored_at)
 
     def set(self, key, data):
         path = self._path_for_key(key)
         payload = {
-            "stored_at": datetime.utcnow(),
+            "stored_at": time.time_ns(),
             "data": data,
         }
         try:
@@ -87,7 +95,7 @@ class DiskCache:
                 pickle.dump(payload, handle)
         except Exception:
             pass  # Fail silently on disk issues
-        return payload["stored_at"]
+        return _to_datetime(payload["stored_at"])
 
 
 def get_cache():
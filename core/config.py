@@ -1,4 +1,5 @@
 import os
+from types import MappingProxyType
 
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -9,7 +10,7 @@ DEFAULT_BENCHMARK = "SPY"
 # Finnhub API key for news (free tier: 60 calls/min)
 FINNHUB_API_KEY = os.environ.get("FINNHUB_API_KEY", "d5l1bthr01qt47mg4io0d5l1bthr01qt47mg4iog")
 
-SECTOR_ETF_MAP = {
+SECTOR_ETF_MAP = MappingProxyType({
     "Technology": "XLK",
     "Healthcare": "XLV",
     "Financial Services": "XLF",
@@ -21,7 +22,7 @@ SECTOR_ETF_MAP = {
     "Real Estate": "XLRE",
     "Basic Materials": "XLB",
     "Communication Services": "XLC",
-}
+})
 
 HORIZON_MAP = {
     "1d": 1,
@@ -1,24 +1,29 @@
-from datetime import datetime
-
 from core.cache import get_cache
 from core.config import TTL_SECONDS
 from core.logging import get_logger
 from core.models import DataQualityReport, DataSnapshot
+from core.providers.base import RateLimitError
 
+_FUNDAMENTAL_KEYS = ("market_cap", "pe_ratio", "roe", "debt_to_equity", "revenue_growth")
+_FUNDAMENTAL_WARNINGS = tuple(
+    f"Missing fundamentals field: {key}" for key in _FUNDAMENTAL_KEYS
+)
 
 class DataService:
     def __init__(self, provider, cache=None, logger=None):
         self.provider = provider
         self.cache = cache or get_cache()
         self.logger = logger or get_logger()
+        self._key_prefix = type(provider).__name__ + ":"
 
     def _cache_key(self, name, *parts):
-        joined = "|".join(str(part) for part in parts)
-        return f"{self.provider.__class__.__name__}:{name}:{joined}"
+        return self._key_prefix + name + ":" + "|".join(map(str, parts))
 
     def _fetch_cached(self, name, ttl, fetcher, *parts):
         key = self._cache_key(name, *parts)
         cached, stored_at = self.cache.get(key, ttl)
+        # Empty results are cached for the full TTL like any other payload,
+        # so a ticker with no news or earnings isn't re-fetched every request
         if cached is not None:
             return cached, stored_at
         data = fetcher()
@@ -36,15 +41,12 @@ class DataService:
             ticker,
         )
 
-        prices, last_updated["prices"] = self._fetch_cached(
-            "prices",
-            TTL_SECONDS["prices"],
-            lambda: self.provider.get_price_history(ticker, start, end, interval),
-            ticker,
-            start,
-            end,
-            interval,
-        )
+        # The benchmark comes down with the ticker in one batch request and
+        # is cached under the same key get_benchmark_prices reads
+        symbols = [ticker, context.benchmark] if context.benchmark else [ticker]
+        prices, last_updated["prices"] = self._price_histories(
+            symbols, start, end, interval, required=(ticker,)
+        )[ticker]
         price_section = completeness.section("prices")
         price_section.add(bool(prices), "Price history missing or empty.")
 
@@ -55,11 +57,8 @@ class DataService:
             ticker,
         )
         fundamentals_section = completeness.section("fundamentals")
-        for key in ["market_cap", "pe_ratio", "roe", "debt_to_equity", "revenue_growth"]:
-            fundamentals_section.add(
-                fundamentals.get(key) is not None,
-                f"Missing fundamentals field: {key}",
-            )
+        for key, warning in zip(_FUNDAMENTAL_KEYS, _FUNDAMENTAL_WARNINGS):
+            fundamentals_section.add(fundamentals.get(key) is not None, warning)
 
         financials, last_updated["financials"] = self._fetch_cached(
             "financials",
@@ -139,29 +138,116 @@ class DataService:
         )
 
     def get_peer_fundamentals(self, tickers, limit=5):
+        peers = tickers[:limit]
+        ttl = TTL_SECONDS["fundamentals"]
+
+        # One cache lookup per peer; only the misses reach the provider
         results = {}
-        for peer in tickers[:limit]:
-            data, _stored_at = self._fetch_cached(
-                "peer_fundamentals",
-                TTL_SECONDS["fundamentals"],
-                lambda peer=peer: self.provider.get_fundamentals(peer),
-                peer,
-            )
+        missing = []
+        for peer in peers:
+            cached, _stored_at = self.cache.get(self._cache_key("peer_fundamentals", peer), ttl)
+            results[peer] = cached
+            if cached is None:
+                missing.append(peer)
+
+        # Providers that support batch fetches load every missing peer's info
+        # concurrently instead of one network round-trip after another
+        infos = {}
+        fetch_many = getattr(self.provider, "fetch_many", None)
+        if fetch_many is not None and len(missing) > 1:
+            fetched = fetch_many(missing, attrs=("info",))
+            infos = {peer: fetched.get((peer, "info")) for peer in missing}
+
+        for peer in missing:
+            info = infos.get(peer)
+            # A peer whose batch lookup failed gets the single-ticker fetch
+            # and its retries rather than cached empty fundamentals
+            if info:
+                data = self.provider.get_fundamentals(peer, info=info)
+            else:
+                data = self.provider.get_fundamentals(peer)
+            self.cache.set(self._cache_key("peer_fundamentals", peer), data)
             results[peer] = data
         return results
 
     def get_benchmark_prices(self, benchmark, start, end, interval):
-        prices, _stored_at = self._fetch_cached(
-            "benchmark_prices",
-            TTL_SECONDS["prices"],
-            lambda: self.provider.get_price_history(benchmark, start, end, interval),
-            benchmark,
-            start,
-            end,
-            interval,
-        )
+        # A throttled benchmark only costs the comparison charts, not the page
+        try:
+            prices, _stored_at = self._fetch_cached(
+                "prices",
+                TTL_SECONDS["prices"],
+                lambda: self.provider.get_price_history(benchmark, start, end, interval),
+                benchmark,
+                start,
+                end,
+                interval,
+            )
+        except RateLimitError as e:
+            self.logger.warning("prices: %s", e)
+            return []
         return prices
 
+    def get_price_histories(self, tickers, start, end, interval):
+        return {
+            ticker: prices
+            for ticker, (prices, _stored_at) in self._price_histories(tickers, start, end, interval).items()
+        }
+
+    def _price_histories(self, tickers, start, end, interval, required=()):
+        """Ticker -> (prices, stored_at), batching every uncached ticker.
+
+        A rate-limited ticker outside required comes back empty, and
+        uncached, instead of failing the whole call.
+        """
+        ttl = TTL_SECONDS["prices"]
+        tickers = list(dict.fromkeys(tickers))
+
+        # Providers that support multi-symbol downloads fetch every uncached
+        # ticker in one request; the rest go through the per-ticker path
+        batch = {}
+        throttled = set()
+        get_many = getattr(self.provider, "get_price_histories", None)
+        if get_many is not None:
+            missing = [
+                ticker
+                for ticker in tickers
+                if self.cache.get(self._cache_key("prices", ticker, start, end, interval), ttl)[0] is None
+            ]
+            if len(missing) > 1:
+                try:
+                    batch = get_many(missing, start, end, interval)
+                except RateLimitError as e:
+                    if any(ticker in required for ticker in missing):
+                        raise
+                    self.logger.warning("prices: %s", e)
+                    throttled.update(missing)
+
+        results = {}
+        for ticker in tickers:
+            if ticker in throttled:
+                results[ticker] = [], None
+                continue
+            try:
+                results[ticker] = self._fetch_cached(
+                    "prices",
+                    ttl,
+                    lambda ticker=ticker: (
+                        batch[ticker]
+                        if ticker in batch
+                        else self.provider.get_price_history(ticker, start, end, interval)
+                    ),
+                    ticker,
+                    start,
+                    end,
+                    interval,
+                )
+            except RateLimitError as e:
+                if ticker in required:
+                    raise
+                self.logger.warning("prices: %s", e)
+                results[ticker] = [], None
+        return results
+
     def _log_warnings(self, completeness):
         for section in completeness.sections.values():
             for warning in section.warnings:
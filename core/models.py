@@ -1,9 +1,12 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, List, Optional
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TickerContext:
     ticker: str
     company_name: str
@@ -16,7 +19,7 @@ class TickerContext:
     quote_type: Optional[str] = None  # EQUITY, ETF, MUTUALFUND, INDEX, etc.
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PricePoint:
     date: str
     open: float
@@ -27,6 +30,44 @@ class PricePoint:
 
 
 @dataclass
+class PriceFrame:
+    """Column-oriented price history, sorted by date."""
+
+    date: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_points(cls, points):
+        count = len(points)
+        frame = cls(
+            date=np.array([p.date for p in points], dtype=str),
+            open=np.fromiter((p.open for p in points), dtype=np.float64, count=count),
+            high=np.fromiter((p.high for p in points), dtype=np.float64, count=count),
+            low=np.fromiter((p.low for p in points), dtype=np.float64, count=count),
+            close=np.fromiter((p.close for p in points), dtype=np.float64, count=count),
+            volume=np.fromiter((p.volume for p in points), dtype=np.float64, count=count),
+        )
+        if count > 1 and not np.all(frame.date[:-1] <= frame.date[1:]):
+            order = np.argsort(frame.date, kind="stable")
+            frame = cls(
+                date=frame.date[order],
+                open=frame.open[order],
+                high=frame.high[order],
+                low=frame.low[order],
+                close=frame.close[order],
+                volume=frame.volume[order],
+            )
+        return frame
+
+    def __len__(self):
+        return len(self.close)
+
+
+@dataclass(slots=True, frozen=True)
 class NewsItem:
     title: str
     publisher: Optional[str]
@@ -34,7 +75,7 @@ class NewsItem:
     published_at: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SocialPost:
     source: str
     title: str
@@ -96,3 +137,7 @@ class DataSnapshot:
     earnings: Dict[str, object]
     last_updated: Dict[str, Optional[datetime]]
     completeness: DataQualityReport
+
+    @cached_property
+    def price_frame(self):
+        return PriceFrame.from_points(self.price_history)
@@ -4,6 +4,10 @@ from typing import Dict, List
 from core.models import NewsItem, PricePoint, SocialPost, TickerContext
 
 
+class RateLimitError(Exception):
+    """The upstream throttled a request; the data may exist, so don't cache the miss."""
+
+
 class DataProvider(ABC):
     @abstractmethod
     def get_ticker_context(self, ticker) -> TickerContext:
@@ -1,92 +1,262 @@
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 import logging
+import random
 import time
+from types import MappingProxyType
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import yfinance as yf
+import numpy as np
 import pandas as pd
 
 from core.config import DEFAULT_BENCHMARK, SECTOR_ETF_MAP, FINNHUB_API_KEY
 from core.models import NewsItem, PricePoint, SocialPost, TickerContext
-from core.providers.base import DataProvider
+from core.providers.base import DataProvider, RateLimitError
 
 logger = logging.getLogger("research_terminal")
 
 FINNHUB_NEWS_URL = "https://finnhub.io/api/v1/company-news"
 
 
+def _build_finnhub_session():
+    """Create a pooled keep-alive session so Finnhub calls reuse connections."""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "Accept-Encoding": "gzip",
+        "User-Agent": "stock-analyzer/1.0",
+    })
+    return session
+
+
+_FINNHUB_SESSION = _build_finnhub_session()
+
+
+def _finnhub_params(ticker, start, end):
+    """Build company-news query params, defaulting to the last 30 days."""
+    try:
+        end_date = datetime.strptime(end, "%Y-%m-%d") if isinstance(end, str) else datetime.utcnow()
+        start_date = datetime.strptime(start, "%Y-%m-%d") if isinstance(start, str) else (end_date - timedelta(days=30))
+    except (ValueError, TypeError):
+        end_date = datetime.utcnow()
+        start_date = end_date - timedelta(days=30)
+    return {
+        "symbol": ticker,
+        "from": start_date.strftime("%Y-%m-%d"),
+        "to": end_date.strftime("%Y-%m-%d"),
+        "token": FINNHUB_API_KEY,
+    }
+
+
+def _utc_isoformat(ts):
+    """Epoch seconds as a naive UTC ISO timestamp, the format news items carry."""
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _parse_finnhub_news(data):
+    if not isinstance(data, list):
+        return []
+    items = []
+    for article in data[:100]:  # Limit to 100 articles
+        ts = article.get("datetime")
+        # Finnhub sends epoch seconds; anything else is treated as unknown
+        published_at = _utc_isoformat(ts) if ts and isinstance(ts, (int, float)) else None
+        items.append(
+            NewsItem(
+                title=article.get("headline") or "Untitled",
+                publisher=article.get("source"),
+                url=article.get("url"),
+                published_at=published_at,
+            )
+        )
+    return items
+
+
 # Fallback peers by industry/sector when yfinance doesn't provide them
-INDUSTRY_PEERS = {
+INDUSTRY_PEERS = MappingProxyType({
     # Tech - Software
-    "Software—Infrastructure": ["MSFT", "ORCL", "CRM", "NOW", "ADBE", "INTU"],
-    "Software—Application": ["MSFT", "CRM", "ADBE", "INTU", "WDAY", "TEAM"],
+    "Software—Infrastructure": ("MSFT", "ORCL", "CRM", "NOW", "ADBE", "INTU"),
+    "Software—Application": ("MSFT", "CRM", "ADBE", "INTU", "WDAY", "TEAM"),
     # Tech - Hardware/Semiconductors
-    "Semiconductors": ["NVDA", "AMD", "INTC", "AVGO", "QCOM", "TXN", "MU"],
-    "Consumer Electronics": ["AAPL", "SONY", "DELL", "HPQ", "LOGI"],
-    "Computer Hardware": ["AAPL", "DELL", "HPQ", "LNVGY"],
+    "Semiconductors": ("NVDA", "AMD", "INTC", "AVGO", "QCOM", "TXN", "MU"),
+    "Consumer Electronics": ("AAPL", "SONY", "DELL", "HPQ", "LOGI"),
+    "Computer Hardware": ("AAPL", "DELL", "HPQ", "LNVGY"),
     # Finance
-    "Banks—Diversified": ["JPM", "BAC", "WFC", "C", "GS", "MS"],
-    "Banks—Regional": ["USB", "PNC", "TFC", "FITB", "KEY"],
-    "Asset Management": ["BLK", "BX", "KKR", "APO", "TROW"],
-    "Insurance—Diversified": ["BRK-B", "AIG", "MET", "PRU", "ALL"],
+    "Banks—Diversified": ("JPM", "BAC", "WFC", "C", "GS", "MS"),
+    "Banks—Regional": ("USB", "PNC", "TFC", "FITB", "KEY"),
+    "Asset Management": ("BLK", "BX", "KKR", "APO", "TROW"),
+    "Insurance—Diversified": ("BRK-B", "AIG", "MET", "PRU", "ALL"),
     # Healthcare
-    "Drug Manufacturers—General": ["JNJ", "PFE", "MRK", "ABBV", "LLY", "BMY"],
-    "Biotechnology": ["AMGN", "GILD", "REGN", "VRTX", "BIIB", "MRNA"],
-    "Medical Devices": ["MDT", "ABT", "SYK", "BSX", "EW", "ISRG"],
+    "Drug Manufacturers—General": ("JNJ", "PFE", "MRK", "ABBV", "LLY", "BMY"),
+    "Biotechnology": ("AMGN", "GILD", "REGN", "VRTX", "BIIB", "MRNA"),
+    "Medical Devices": ("MDT", "ABT", "SYK", "BSX", "EW", "ISRG"),
     # Consumer
-    "Internet Retail": ["AMZN", "EBAY", "ETSY", "W", "CHWY"],
-    "Specialty Retail": ["HD", "LOW", "TJX", "ROST", "BBY"],
-    "Restaurants": ["MCD", "SBUX", "CMG", "DRI", "YUM", "DENN"],
-    "Beverages—Non-Alcoholic": ["KO", "PEP", "MNST", "KDP"],
+    "Internet Retail": ("AMZN", "EBAY", "ETSY", "W", "CHWY"),
+    "Specialty Retail": ("HD", "LOW", "TJX", "ROST", "BBY"),
+    "Restaurants": ("MCD", "SBUX", "CMG", "DRI", "YUM", "DENN"),
+    "Beverages—Non-Alcoholic": ("KO", "PEP", "MNST", "KDP"),
     # Industrial
-    "Aerospace & Defense": ["BA", "LMT", "RTX", "NOC", "GD", "HII"],
-    "Auto Manufacturers": ["TSLA", "F", "GM", "TM", "HMC", "RIVN"],
+    "Aerospace & Defense": ("BA", "LMT", "RTX", "NOC", "GD", "HII"),
+    "Auto Manufacturers": ("TSLA", "F", "GM", "TM", "HMC", "RIVN"),
     # Energy
-    "Oil & Gas Integrated": ["XOM", "CVX", "SHEL", "BP", "TTE", "COP"],
+    "Oil & Gas Integrated": ("XOM", "CVX", "SHEL", "BP", "TTE", "COP"),
     # Communication
-    "Internet Content & Information": ["GOOGL", "META", "SNAP", "PINS", "TWTR"],
-    "Entertainment": ["NFLX", "DIS", "WBD", "PARA", "CMCSA"],
-    "Telecom Services": ["T", "VZ", "TMUS"],
-}
-
-SECTOR_LEADERS = {
-    "Technology": ["AAPL", "MSFT", "NVDA", "GOOGL", "META", "AVGO", "CRM", "AMD", "ADBE", "ORCL"],
-    "Healthcare": ["UNH", "JNJ", "LLY", "PFE", "ABBV", "MRK", "TMO", "ABT", "DHR", "AMGN"],
-    "Financial Services": ["JPM", "V", "MA", "BAC", "WFC", "GS", "MS", "BLK", "SPGI", "AXP"],
-    "Consumer Cyclical": ["AMZN", "TSLA", "HD", "MCD", "NKE", "SBUX", "LOW", "TJX", "BKNG", "CMG"],
-    "Consumer Defensive": ["WMT", "PG", "COST", "KO", "PEP", "PM", "MDLZ", "MO", "CL", "KHC"],
-    "Industrials": ["CAT", "UNP", "HON", "UPS", "BA", "RTX", "DE", "LMT", "GE", "MMM"],
-    "Energy": ["XOM", "CVX", "COP", "SLB", "EOG", "MPC", "PXD", "VLO", "PSX", "OXY"],
-    "Utilities": ["NEE", "DUK", "SO", "D", "AEP", "SRE", "XEL", "ED", "EXC", "WEC"],
-    "Real Estate": ["PLD", "AMT", "EQIX", "CCI", "PSA", "O", "SPG", "WELL", "DLR", "AVB"],
-    "Basic Materials": ["LIN", "APD", "SHW", "ECL", "FCX", "NEM", "NUE", "DOW", "DD", "PPG"],
-    "Communication Services": ["GOOGL", "META", "NFLX", "DIS", "CMCSA", "VZ", "T", "TMUS", "CHTR", "EA"],
-}
+    "Internet Content & Information": ("GOOGL", "META", "SNAP", "PINS", "TWTR"),
+    "Entertainment": ("NFLX", "DIS", "WBD", "PARA", "CMCSA"),
+    "Telecom Services": ("T", "VZ", "TMUS"),
+})
+
+SECTOR_LEADERS = MappingProxyType({
+    "Technology": ("AAPL", "MSFT", "NVDA", "GOOGL", "META", "AVGO", "CRM", "AMD", "ADBE", "ORCL"),
+    "Healthcare": ("UNH", "JNJ", "LLY", "PFE", "ABBV", "MRK", "TMO", "ABT", "DHR", "AMGN"),
+    "Financial Services": ("JPM", "V", "MA", "BAC", "WFC", "GS", "MS", "BLK", "SPGI", "AXP"),
+    "Consumer Cyclical": ("AMZN", "TSLA", "HD", "MCD", "NKE", "SBUX", "LOW", "TJX", "BKNG", "CMG"),
+    "Consumer Defensive": ("WMT", "PG", "COST", "KO", "PEP", "PM", "MDLZ", "MO", "CL", "KHC"),
+    "Industrials": ("CAT", "UNP", "HON", "UPS", "BA", "RTX", "DE", "LMT", "GE", "MMM"),
+    "Energy": ("XOM", "CVX", "COP", "SLB", "EOG", "MPC", "PXD", "VLO", "PSX", "OXY"),
+    "Utilities": ("NEE", "DUK", "SO", "D", "AEP", "SRE", "XEL", "ED", "EXC", "WEC"),
+    "Real Estate": ("PLD", "AMT", "EQIX", "CCI", "PSA", "O", "SPG", "WELL", "DLR", "AVB"),
+    "Basic Materials": ("LIN", "APD", "SHW", "ECL", "FCX", "NEM", "NUE", "DOW", "DD", "PPG"),
+    "Communication Services": ("GOOGL", "META", "NFLX", "DIS", "CMCSA", "VZ", "T", "TMUS", "CHTR", "EA"),
+})
+
+
+@lru_cache(maxsize=2048)
+def _peers_excluding(peers, ticker):
+    """Return the fallback peer tuple with the requested ticker filtered out."""
+    return tuple(p for p in peers if p != ticker)
+
+
+MAX_RETRY_WAIT_SECONDS = 30
+
+
+def _retry_wait(error, base, previous):
+    """Decorrelated-jitter backoff, deferring to a Retry-After header if present."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_RETRY_WAIT_SECONDS * 2)
+        except ValueError:
+            pass
+    return random.uniform(base, min(MAX_RETRY_WAIT_SECONDS, previous * 3))
 
 
 def _df_to_dict(df):
     if df is None or df.empty:
         return {}
-    return df.fillna(0).to_dict()
+    values = df.to_numpy()
+    if values.dtype.kind != "f":
+        return df.fillna(0).to_dict()
+    values = np.where(np.isnan(values), 0.0, values)
+    index = df.index
+    return {col: dict(zip(index, column)) for col, column in zip(df.columns, values.T.tolist())}
 
 
 def _extract_ohlcv(df, ticker=None):
     """Extract OHLCV from a DataFrame, handling MultiIndex columns."""
     if df is None or df.empty:
         return None
+    cols = df.columns
+    if cols.nlevels == 1:
+        return df
     # Handle MultiIndex columns from yf.download with multiple tickers
-    if hasattr(df, "columns") and hasattr(df.columns, "nlevels") and df.columns.nlevels > 1:
-        if ticker and ticker in df.columns.get_level_values(1):
-            df = df.xs(ticker, axis=1, level=1)
-        else:
-            # Flatten by taking first level
-            df.columns = df.columns.get_level_values(0)
+    if ticker and ticker in cols.get_level_values(1):
+        df = df.xs(ticker, axis=1, level=1)
+    else:
+        # Flatten by taking first level
+        df.columns = cols.get_level_values(0)
     return df
 
 
+def _history_to_points(history):
+    """Convert an OHLCV DataFrame into a list of PricePoint."""
+    index = history.index
+    if isinstance(index, pd.DatetimeIndex):
+        dates = index.strftime("%Y-%m-%d").tolist()
+    else:
+        dates = index.astype(str).str[:10].tolist()
+    # Gaps stay NaN as they always have; 0.0 would read as a real price
+    # and show up downstream as a -100% return
+    columns = [
+        history[col].to_numpy(dtype="float64", na_value=np.nan).tolist()
+        if col in history.columns
+        else [0.0] * len(history)
+        for col in ("Open", "High", "Low", "Close", "Volume")
+    ]
+    return [
+        PricePoint(date=d, open=o, high=h, low=l, close=c, volume=v)
+        for d, o, h, l, c, v in zip(dates, *columns)
+    ]
+
+
+INFO_CACHE_TTL_SECONDS = 300
+INFO_CACHE_SIZE = 256
+PRICE_MISSING_TTL_SECONDS = 60
+INFO_MISSING_TTL_SECONDS = 60
+
+_YF_EXCEPTIONS = getattr(yf, "exceptions", None)
+_MISSING_PRICE_ERRORS = tuple(
+    getattr(_YF_EXCEPTIONS, name)
+    for name in ("YFPricesMissingError", "YFTickerMissingError", "YFTzMissingError")
+    if hasattr(_YF_EXCEPTIONS, name)
+)
+
+
+def _store_expiring(cache, key, value, ttl):
+    """cache[key] = (expires_at, value), pruning expired entries and then the oldest past INFO_CACHE_SIZE."""
+    now = time.time()
+    # list() snapshots the dict so a concurrent insert cannot break the scan
+    for k, (expires_at, _value) in list(cache.items()):
+        if expires_at <= now:
+            cache.pop(k, None)
+    while len(cache) >= INFO_CACHE_SIZE:
+        # Oldest entry first; dicts keep insertion order
+        cache.pop(next(iter(cache)), None)
+    cache[key] = (now + ttl, value)
+
+
+def _is_rate_limit_error(error):
+    if type(error).__name__ == "YFRateLimitError":
+        return True
+    message = str(error).lower()
+    return "429" in message or "too many requests" in message or "rate limit" in message
+
+
 class YFinanceProvider(DataProvider):
+    # (ticker, period, interval) -> expiry; shared so every request skips
+    # symbols that just came back empty. Expired keys are pruned on insert
+    _missing_price = {}
+    # ticker -> (expires_at, info); collapses the repeated .info lookups made
+    # by context, fundamentals, peers and sector ETF, across requests since a
+    # provider is built per request; failed lookups are stored as {} for
+    # INFO_MISSING_TTL_SECONDS. Bounded by INFO_CACHE_SIZE
+    _info_cache = {}
+    # ticker -> (expires_at, yf.Ticker); yfinance memoizes .info/.calendar
+    # on the object, so it expires alongside the info cache
+    _ticker_cache = {}
+
+    def _ticker(self, symbol):
+        cached = self._ticker_cache.get(symbol)
+        if cached is not None and cached[0] > time.time():
+            return cached[1]
+        ticker_obj = yf.Ticker(symbol)
+        _store_expiring(self._ticker_cache, symbol, ticker_obj, INFO_CACHE_TTL_SECONDS)
+        return ticker_obj
+
     def _safe_yfinance_call(self, func, ticker, max_retries=3, retry_delay=2, *args, **kwargs):
         """Safely call yfinance methods with retry logic for rate limits"""
+        wait_time = retry_delay
         for attempt in range(max_retries):
             try:
                 result = func(*args, **kwargs)
@@ -108,8 +278,8 @@ class YFinanceProvider(DataProvider):
                 # Check for rate limit errors
                 if "429" in error_str or "too many requests" in error_msg or "rate limit" in error_msg:
                     if attempt < max_retries - 1:
-                        wait_time = retry_delay * (attempt + 1)  # Exponential backoff
-                        logger.warning(f"Rate limit hit for {ticker}, waiting {wait_time}s before retry {attempt + 1}/{max_retries}")
+                        wait_time = _retry_wait(e, retry_delay, wait_time)
+                        logger.warning(f"Rate limit hit for {ticker}, waiting {wait_time:.1f}s before retry {attempt + 1}/{max_retries}")
                         time.sleep(wait_time)
                         continue
                     else:
@@ -118,8 +288,8 @@ class YFinanceProvider(DataProvider):
                 elif "json" in error_msg.lower() or "decode" in error_msg.lower() or "expecting value" in error_msg:
                     # JSON decode error often means rate limit
                     if attempt < max_retries - 1:
-                        wait_time = retry_delay * (attempt + 1)
-                        logger.warning(f"JSON decode error for {ticker} (likely rate limit), waiting {wait_time}s...")
+                        wait_time = _retry_wait(e, retry_delay, wait_time)
+                        logger.warning(f"JSON decode error for {ticker} (likely rate limit), waiting {wait_time:.1f}s...")
                         time.sleep(wait_time)
                         continue
                     else:
@@ -136,28 +306,64 @@ class YFinanceProvider(DataProvider):
     
     def _safe_get_info(self, ticker, max_retries=3, retry_delay=2):
         """Safely get ticker info with retry logic for rate limits"""
+        cached = self._info_cache.get(ticker)
+        if cached is not None and cached[0] > time.time():
+            return cached[1]
+
         def _get_info():
-            ticker_obj = yf.Ticker(ticker)
-            return ticker_obj.info or {}
+            info = self._ticker(ticker).info or {}
+            if not info:
+                # Drop the object so a retry doesn't reread its memoized empty info
+                self._ticker_cache.pop(ticker, None)
+            return info
         
-        return self._safe_yfinance_call(_get_info, ticker, max_retries, retry_delay)
-    
-    def get_ticker_context(self, ticker):
         try:
-            info = self._safe_get_info(ticker)
-        except Exception as e:
-            logger.error(f"Error getting ticker context for {ticker}: {e}")
-            # Return minimal context on error
-            return TickerContext(
-                ticker=ticker,
-                company_name=ticker,
-                sector=None,
-                industry=None,
-                exchange=None,
-                currency="USD",
-                peers=[],
-                benchmark=DEFAULT_BENCHMARK,
-            )
+            info = self._safe_yfinance_call(_get_info, ticker, max_retries, retry_delay)
+        except Exception:
+            # Failures are remembered briefly so callers don't re-pay the retry budget
+            _store_expiring(self._info_cache, ticker, {}, INFO_MISSING_TTL_SECONDS)
+            raise
+        ttl = INFO_CACHE_TTL_SECONDS if info else INFO_MISSING_TTL_SECONDS
+        _store_expiring(self._info_cache, ticker, info, ttl)
+        return info
+    
+    def fetch_many(self, tickers, attrs=("info", "financials", "calendar"), max_workers=8):
+        """Fetch yfinance Ticker attributes for several symbols concurrently.
+
+        Returns a dict keyed by (ticker, attr); failed lookups map to None.
+        """
+        def _fetch(ticker, attr):
+            try:
+                return self._safe_yfinance_call(lambda: getattr(self._ticker(ticker), attr), ticker)
+            except Exception as e:
+                logger.warning(f"fetch_many: {attr} failed for {ticker}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                (ticker, attr): executor.submit(_fetch, ticker, attr)
+                for ticker in tickers
+                for attr in attrs
+            }
+            return {key: future.result() for key, future in futures.items()}
+
+    def get_ticker_context(self, ticker, info=None):
+        if info is None:
+            try:
+                info = self._safe_get_info(ticker)
+            except Exception as e:
+                logger.error(f"Error getting ticker context for {ticker}: {e}")
+                # Return minimal context on error
+                return TickerContext(
+                    ticker=ticker,
+                    company_name=ticker,
+                    sector=None,
+                    industry=None,
+                    exchange=None,
+                    currency="USD",
+                    peers=[],
+                    benchmark=DEFAULT_BENCHMARK,
+                )
         
         company_name = info.get("shortName") or info.get("longName") or ticker
         sector = info.get("sector")
@@ -182,42 +388,34 @@ class YFinanceProvider(DataProvider):
     def get_price_history(self, ticker, start, end, interval):
         history = None
         period = _period_from_range(start, end)
+        missing_key = (ticker, period, interval)
+        if self._missing_price.get(missing_key, 0) > time.time():
+            logger.info(f"Skipping price fetch for {ticker}: no data on a recent attempt")
+            return []
 
         # Method 1: Ticker.history with period (most reliable)
         try:
-            t = yf.Ticker(ticker)
+            t = self._ticker(ticker)
             history = t.history(period=period, interval=interval)
             history = _extract_ohlcv(history, ticker)
             if history is not None and not history.empty:
                 logger.info(f"Got {len(history)} rows via Ticker.history(period={period})")
+        except _MISSING_PRICE_ERRORS as e:
+            # Yahoo has definitively no prices; other methods would agree
+            logger.warning(f"No price data for {ticker}: {e}")
+            self._mark_price_missing(missing_key)
+            return []
         except Exception as e:
+            if _is_rate_limit_error(e):
+                # Switching methods would only add load while rate limited.
+                # The data may well exist, so nothing is recorded as missing;
+                # the error reaches the caller and nothing gets cached
+                logger.warning(f"Rate limited fetching prices for {ticker}, backing off")
+                raise RateLimitError(f"Yahoo Finance rate limit hit fetching prices for {ticker}") from e
             logger.warning(f"Ticker.history(period) failed: {e}")
             history = None
 
-        # Method 2: Ticker.history with start/end
-        if history is None or history.empty:
-            try:
-                t = yf.Ticker(ticker)
-                history = t.history(start=start, end=end, interval=interval)
-                history = _extract_ohlcv(history, ticker)
-                if history is not None and not history.empty:
-                    logger.info(f"Got {len(history)} rows via Ticker.history(start/end)")
-            except Exception as e:
-                logger.warning(f"Ticker.history(start/end) failed: {e}")
-                history = None
-
-        # Method 3: yf.download with period
-        if history is None or history.empty:
-            try:
-                history = yf.download(ticker, period=period, interval=interval, progress=False, threads=False)
-                history = _extract_ohlcv(history, ticker)
-                if history is not None and not history.empty:
-                    logger.info(f"Got {len(history)} rows via yf.download(period={period})")
-            except Exception as e:
-                logger.warning(f"yf.download(period) failed: {e}")
-                history = None
-
-        # Method 4: yf.download with start/end
+        # Method 2: yf.download with start/end (separate code path, last attempt)
         if history is None or history.empty:
             try:
                 history = yf.download(ticker, start=start, end=end, interval=interval, progress=False, threads=False)
@@ -228,37 +426,68 @@ class YFinanceProvider(DataProvider):
                 logger.warning(f"yf.download(start/end) failed: {e}")
                 history = None
 
-        # Convert to PricePoint list
-        points = []
         if history is None or history.empty:
             logger.error(f"All price fetch methods failed for {ticker}")
-            return points
-
-        for idx, row in history.iterrows():
-            try:
-                points.append(
-                    PricePoint(
-                        date=idx.strftime("%Y-%m-%d") if hasattr(idx, "strftime") else str(idx)[:10],
-                        open=float(row.get("Open", 0) or 0),
-                        high=float(row.get("High", 0) or 0),
-                        low=float(row.get("Low", 0) or 0),
-                        close=float(row.get("Close", 0) or 0),
-                        volume=float(row.get("Volume", 0) or 0),
-                    )
-                )
-            except Exception as e:
-                logger.warning(f"Skipping row due to error: {e}")
-                continue
+            self._mark_price_missing(missing_key)
+            return []
 
+        points = _history_to_points(history)
         logger.info(f"Returning {len(points)} price points for {ticker}")
         return points
 
-    def get_fundamentals(self, ticker):
+    @classmethod
+    def _mark_price_missing(cls, key):
+        now = time.time()
+        # list() snapshots the dict so a concurrent insert cannot break the scan
+        expired = [k for k, expires_at in list(cls._missing_price.items()) if expires_at <= now]
+        for k in expired:
+            cls._missing_price.pop(k, None)
+        cls._missing_price[key] = now + PRICE_MISSING_TTL_SECONDS
+
+    def get_price_histories(self, tickers, start, end, interval):
+        """Fetch price history for several tickers with one yf.download call.
+
+        Symbols missing from the batch result fall back to get_price_history.
+        Returns a dict of ticker -> list of PricePoint.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if len(tickers) < 2:
+            return {ticker: self.get_price_history(ticker, start, end, interval) for ticker in tickers}
+
+        frame = None
         try:
-            info = self._safe_get_info(ticker)
+            frame = yf.download(
+                tickers=" ".join(tickers),
+                start=start,
+                end=end,
+                interval=interval,
+                progress=False,
+                threads=True,
+                group_by="ticker",
+            )
         except Exception as e:
-            logger.error(f"Error getting fundamentals for {ticker}: {e}")
-            info = {}
+            logger.warning(f"Batch yf.download failed for {tickers}: {e}")
+
+        symbols = set()
+        if frame is not None and not frame.empty and frame.columns.nlevels > 1:
+            symbols = set(frame.columns.get_level_values(0))
+
+        results = {}
+        for ticker in tickers:
+            history = frame[ticker].dropna(how="all") if ticker in symbols else None
+            if history is None or history.empty:
+                results[ticker] = self.get_price_history(ticker, start, end, interval)
+            else:
+                results[ticker] = _history_to_points(history)
+        return results
+
+    def get_fundamentals(self, ticker, info=None):
+        if info is None:
+            try:
+                info = self._safe_get_info(ticker)
+            except Exception as e:
+                logger.error(f"Error getting fundamentals for {ticker}: {e}")
+                info = {}
         
         # Calculate PEG ratio if we have the data
         pe = info.get("trailingPE")
@@ -323,7 +552,7 @@ class YFinanceProvider(DataProvider):
 
     def get_financial_statements(self, ticker):
         def _get_statements():
-            yf_ticker = yf.Ticker(ticker)
+            yf_ticker = self._ticker(ticker)
             return {
                 "income_statement": _df_to_dict(yf_ticker.financials),
                 "balance_sheet": _df_to_dict(yf_ticker.balance_sheet),
@@ -358,7 +587,7 @@ class YFinanceProvider(DataProvider):
         logger.info(f"news: Using yfinance fallback for {ticker}")
         try:
             def _get_news():
-                return yf.Ticker(ticker).news or []
+                return self._ticker(ticker).news or []
             news = self._safe_yfinance_call(_get_news, ticker)
         except Exception as e:
             logger.error(f"Error getting news for {ticker}: {e}")
@@ -379,7 +608,7 @@ class YFinanceProvider(DataProvider):
             published_at = content.get("pubDate") or item.get("providerPublishTime")
             if published_at and not isinstance(published_at, str):
                 try:
-                    published_at = datetime.utcfromtimestamp(published_at).isoformat()
+                    published_at = _utc_isoformat(published_at)
                 except (TypeError, ValueError):
                     published_at = None
             
@@ -395,58 +624,22 @@ class YFinanceProvider(DataProvider):
     
     def _fetch_finnhub_news(self, ticker, start, end):
         """Fetch news from Finnhub API."""
-        # Calculate date range (last 30 days or provided range)
-        try:
-            end_date = datetime.strptime(end, "%Y-%m-%d") if isinstance(end, str) else datetime.utcnow()
-            start_date = datetime.strptime(start, "%Y-%m-%d") if isinstance(start, str) else (end_date - timedelta(days=30))
-        except (ValueError, TypeError):
-            end_date = datetime.utcnow()
-            start_date = end_date - timedelta(days=30)
-        
-        params = {
-            "symbol": ticker,
-            "from": start_date.strftime("%Y-%m-%d"),
-            "to": end_date.strftime("%Y-%m-%d"),
-            "token": FINNHUB_API_KEY,
-        }
-        
-        response = requests.get(FINNHUB_NEWS_URL, params=params, timeout=10)
+        params = _finnhub_params(ticker, start, end)
+        response = _FINNHUB_SESSION.get(FINNHUB_NEWS_URL, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
-        
-        if not isinstance(data, list):
-            return []
-        
-        items = []
-        for article in data[:100]:  # Limit to 100 articles
-            published_at = article.get("datetime")
-            if published_at:
-                try:
-                    published_at = datetime.utcfromtimestamp(published_at).isoformat()
-                except (TypeError, ValueError):
-                    published_at = None
-            
-            items.append(
-                NewsItem(
-                    title=article.get("headline") or "Untitled",
-                    publisher=article.get("source"),
-                    url=article.get("url"),
-                    published_at=published_at,
-                )
-            )
-        
-        return items
+        return _parse_finnhub_news(response.json())
 
     def get_social_posts(self, ticker, start, end):
         return []
 
-    def get_peers(self, ticker):
+    def get_peers(self, ticker, info=None):
         """Get peer tickers with multiple fallback strategies."""
-        try:
-            info = self._safe_get_info(ticker)
-        except Exception as e:
-            logger.error(f"Error getting peers for {ticker}: {e}")
-            info = {}
+        if info is None:
+            try:
+                info = self._safe_get_info(ticker)
+            except Exception as e:
+                logger.error(f"Error getting peers for {ticker}: {e}")
+                info = {}
         
         # Strategy 1: Use yfinance similarTickers
         peers = info.get("similarTickers") or []
@@ -457,34 +650,35 @@ class YFinanceProvider(DataProvider):
         # Strategy 2: Use industry-based peers
         industry = info.get("industry")
         if industry and industry in INDUSTRY_PEERS:
-            industry_peers = [p for p in INDUSTRY_PEERS[industry] if p != ticker]
+            industry_peers = _peers_excluding(INDUSTRY_PEERS[industry], ticker)
             if industry_peers:
                 logger.info(f"peers: Using {len(industry_peers)} industry peers for {ticker} ({industry})")
-                return industry_peers[:8]
+                return list(industry_peers[:8])
         
         # Strategy 3: Use sector leaders
         sector = info.get("sector")
         if sector and sector in SECTOR_LEADERS:
-            sector_peers = [p for p in SECTOR_LEADERS[sector] if p != ticker]
+            sector_peers = _peers_excluding(SECTOR_LEADERS[sector], ticker)
             if sector_peers:
                 logger.info(f"peers: Using {len(sector_peers)} sector leaders for {ticker} ({sector})")
-                return sector_peers[:8]
+                return list(sector_peers[:8])
         
         logger.warning(f"peers: No peers found for {ticker}")
         return []
 
-    def get_sector_etf(self, ticker):
-        try:
-            info = self._safe_get_info(ticker)
-        except Exception as e:
-            logger.error(f"Error getting sector ETF for {ticker}: {e}")
-            info = {}
+    def get_sector_etf(self, ticker, info=None):
+        if info is None:
+            try:
+                info = self._safe_get_info(ticker)
+            except Exception as e:
+                logger.error(f"Error getting sector ETF for {ticker}: {e}")
+                info = {}
         sector = info.get("sector")
         return SECTOR_ETF_MAP.get(sector, DEFAULT_BENCHMARK)
 
     def get_earnings(self, ticker):
         def _get_calendar():
-            return yf.Ticker(ticker).calendar
+            return self._ticker(ticker).calendar
         
         try:
             calendar = self._safe_yfinance_call(_get_calendar, ticker)
@@ -503,22 +697,11 @@ class YFinanceProvider(DataProvider):
             elif isinstance(calendar, dict):
                 next_date = calendar.get("Earnings Date") or calendar.get("EarningsDate")
         
-        # Unwrap from any container (list, tuple, ndarray, Series, etc.)
-        # Keep unwrapping until we get a scalar
-        for _ in range(5):  # Safety limit
-            if next_date is None:
-                break
-            if isinstance(next_date, str):
-                break
-            # Check if it's iterable/indexable and not a date object
-            if hasattr(next_date, "__iter__") and hasattr(next_date, "__getitem__"):
-                try:
-                    inner = next_date[0] if len(next_date) > 0 else None
-                    next_date = inner
-                except (TypeError, IndexError, KeyError):
-                    break
-            else:
-                break
+        # Calendars report a list (dict form) or Series/array (frame form) of dates
+        if isinstance(next_date, (list, tuple, np.ndarray, pd.Index)):
+            next_date = next_date[0] if len(next_date) else None
+        elif isinstance(next_date, pd.Series):
+            next_date = next_date.iloc[0] if len(next_date) else None
         
         # Convert to clean date string
         if next_date is not None:
@@ -537,27 +720,17 @@ def _format_date(value):
         return None
     if isinstance(value, str):
         # Already a string, clean it up
-        if "T" in value:
-            return value.split("T")[0]
-        return value
-    # Try pandas Timestamp
-    try:
-        return value.to_pydatetime().date().isoformat()
-    except AttributeError:
-        pass
-    # Try datetime.date or datetime.datetime
-    try:
-        if hasattr(value, "isoformat"):
-            result = value.isoformat()
-            if "T" in result:
-                return result.split("T")[0]
-            return result
-    except Exception:
-        pass
+        return value.split("T")[0] if "T" in value else value
+    if isinstance(value, np.datetime64):
+        value = pd.Timestamp(value)
+    # pandas Timestamp and datetime are both date subclasses
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
     # Last resort
     return str(value)
 
 
+@lru_cache(maxsize=64)
 def _period_from_range(start, end):
     try:
         start_dt = datetime.fromisoformat(start)
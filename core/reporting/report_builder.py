@@ -1,16 +1,34 @@
 import os
 from datetime import datetime
+from functools import lru_cache
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from core.visualization.report_charts import (
     fundamentals_chart,
     peers_chart,
     price_chart,
     relative_chart,
+    render_all,
     sentiment_chart,
 )
 
+TEMPLATE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "templates"))
+
+
+@lru_cache(maxsize=1)
+def _environment():
+    """
+    Jinja environment for report.html, built once per process. Compiled
+    bytecode goes to Jinja's per-user temp directory, outside the source
+    tree, and auto_reload keeps edits to the template visible.
+    """
+    return Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        cache_size=50,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+
 
 def build_report(snapshot, analysis, benchmark_prices, output_dir, export_format="html"):
     os.makedirs(output_dir, exist_ok=True)
@@ -18,27 +36,28 @@ def build_report(snapshot, analysis, benchmark_prices, output_dir, export_format
     filename = f"{snapshot.context.ticker}_{timestamp}.{export_format}"
     filepath = os.path.join(output_dir, filename)
 
-    template_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "templates"))
-    env = Environment(loader=FileSystemLoader(template_dir))
-    template = env.get_template("report.html")
+    template = _environment().get_template("report.html")
+
+    figures = {
+        "price": price_chart(snapshot.price_history),
+        "relative": relative_chart(snapshot.price_history, benchmark_prices),
+        "fundamentals": fundamentals_chart(analysis.fundamentals.time_series),
+        "peers": peers_chart(analysis.peers.peer_metrics),
+        "sentiment": sentiment_chart(snapshot.news),
+    }
+    # Image export dominates; render_all exports every figure in one batch
+    charts = dict(zip(figures, render_all(figures.values())))
 
     context = {
         "snapshot": snapshot,
         "analysis": analysis,
         "generated_at": datetime.utcnow().isoformat(),
-        "charts": {
-            "price": price_chart(snapshot.price_history),
-            "relative": relative_chart(snapshot.price_history, benchmark_prices),
-            "fundamentals": fundamentals_chart(analysis.fundamentals.time_series),
-            "peers": peers_chart(analysis.peers.peer_metrics),
-            "sentiment": sentiment_chart(snapshot.news),
-        },
+        "charts": charts,
     }
 
-    html = template.render(**context)
     if export_format == "html":
         with open(filepath, "w", encoding="utf-8") as handle:
-            handle.write(html)
+            template.stream(**context).dump(handle)
         return filepath
 
     if export_format == "pdf":
@@ -46,7 +65,8 @@ def build_report(snapshot, analysis, benchmark_prices, output_dir, export_format
             from weasyprint import HTML
         except ImportError as exc:
             raise RuntimeError("WeasyPrint not installed; cannot export PDF.") from exc
-        HTML(string=html, base_url=template_dir).write_pdf(filepath)
+        html = template.render(**context)
+        HTML(string=html, base_url=TEMPLATE_DIR).write_pdf(filepath)
         return filepath
 
     raise ValueError(f"Unsupported export format: {export_format}")
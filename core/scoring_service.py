@@ -19,38 +19,492 @@ Special Handling:
 - ETFs: Only scored on Technical, Risk, Momentum, Market factors (no fundamentals/valuation)
 """
 
-from core.analysis_models import Recommendation
+from bisect import bisect_right
+from collections import OrderedDict
+import copy
+from functools import lru_cache, partial
+from itertools import product
+import math
+import threading
+import time
+from types import MappingProxyType
+
+import numpy as np
+
+from core._scoring_kernels import weighted_score_batch
+from core.analysis_models import Fmt, Recommendation
+from core.config import SECTOR_ETF_MAP
 from core.scoring_config import SCORE_WEIGHTS, THRESHOLDS, ETF_SCORE_WEIGHTS, TIMING_THRESHOLDS
 
+try:
+    from core.analytics.market_sentiment import analyze_market_sentiment, get_sector_performance
+    HAS_MARKET_DATA = True
+except Exception:
+    analyze_market_sentiment = None
+    get_sector_performance = None
+    HAS_MARKET_DATA = False
+
 
-def _scale(value, min_val, max_val, invert=False):
-    """Scale a value to 0-100 range."""
+def _scale_pre(value, min_val, coef, invert=False):
+    """Scale with a precomputed 100 / (max - min); literal coefs fold at compile time."""
     if value is None:
         return None
-    if min_val == max_val:
-        return 50
-    score = (value - min_val) / (max_val - min_val) * 100
-    score = max(0, min(100, score))
+    score = (value - min_val) * coef
+    if score < 0:
+        score = 0.0
+    elif score > 100:
+        score = 100.0
     return 100 - score if invert else score
 
 
 def _avg(values):
-    """Calculate average of non-None values."""
-    filtered = [v for v in values if v is not None]
-    if not filtered:
-        return None
-    return sum(filtered) / len(filtered)
+    """Average of the values that are neither None nor NaN, in one pass."""
+    total = 0.0
+    count = 0
+    for value in values:
+        if value is not None and value == value:
+            total += value
+            count += 1
+    return total / count if count else None
+
+
+# Trend scoring: bullish = 75, bearish = 25, anything else neutral
+_TREND_SCORE_MAP = MappingProxyType({"bullish": 75, "bearish": 25})
+_TREND_HORIZONS = ("1w", "1m", "3m")
+
+
+def _trend_score(trend_by_horizon):
+    """Average trend score over the labelled horizons; neutral 50 when none are."""
+    total = 0.0
+    count = 0
+    for horizon in _TREND_HORIZONS:
+        trend = trend_by_horizon.get(horizon)
+        if trend:
+            total += _TREND_SCORE_MAP.get(trend.lower(), 50)
+            count += 1
+    return total / count if count else 50
+
+MARKET_DATA_TTL_SECONDS = 60
+SCORE_CACHE_SIZE = 512
+# (analysis digest, completeness, quote type, sector) -> (monotonic time,
+# Recommendation), LRU. Entries live for MARKET_DATA_TTL_SECONDS, the same
+# window the market reading they were scored with is itself reused for
+_score_cache = OrderedDict()
+# Flask serves requests on threads; the LRU bookkeeping runs under this lock
+_score_cache_lock = threading.Lock()
+_market_cache = {}
+# Monotonic time until which market data is treated as unavailable after a failure
+_market_down_until = 0.0
+# Upstream failures worth a neutral fallback: network errors (requests' are
+# OSErrors) and malformed or partial payloads. Anything else is a bug
+_MARKET_DATA_ERRORS = (OSError, ValueError, LookupError)
+
+
+def _cached(fn, ttl=MARKET_DATA_TTL_SECONDS):
+    """Return fn() reusing a result younger than ttl; market data is ticker-independent."""
+    now = time.monotonic()
+    hit = _market_cache.get(fn)
+    if hit is not None and now - hit[0] < ttl:
+        return hit[1]
+    value = fn()
+    _market_cache[fn] = (now, value)
+    return value
+
+
+@lru_cache(maxsize=1)
+def _sector_lookup(sector_changes):
+    """Map sector ETF ticker -> weekly change from (ticker, change) pairs."""
+    return dict(sector_changes)
+
+
+def _avg_nn(*values):
+    """_avg over the arguments."""
+    return _avg(values)
+
+
+# Display formats: a ratio as a percentage, or a number to fixed decimals
+_fmt_pct = partial(Fmt, spec=".1f", scale=100, suffix="%")
+_fmt_num = partial(Fmt, spec=".1f")
+_fmt_num2 = partial(Fmt, spec=".2f")
+
+
+def _column(values):
+    """Float array with None as NaN."""
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+# Scaled inputs: (name, min, max, invert, zero counts as missing), in the
+# column order of the arrays below and the factor slices that average them
+_SCALE_INPUTS = (
+    ("roe", 0, 0.30, False, False),
+    ("operating_margins", 0, 0.30, False, False),
+    ("profit_margins", 0, 0.25, False, False),
+    ("revenue_growth", -0.20, 0.40, False, False),
+    ("earnings_growth", -0.30, 0.50, False, False),
+    ("pe_ratio", 5, 40, True, True),
+    ("forward_pe", 5, 35, True, True),
+    ("peg_ratio", 0.5, 3, True, True),
+    ("ev_to_ebitda", 5, 25, True, True),
+    ("volatility", 0.15, 0.50, True, True),
+    ("beta", 0.5, 2.0, True, True),
+    ("max_drawdown", -0.50, -0.05, False, True),  # Less negative = better
+    ("total_return", -0.30, 0.50, False, True),
+    ("rolling_3m", -0.20, 0.30, False, True),
+    ("rolling_1m", -0.10, 0.15, False, True),
+    ("headline_score", -0.5, 0.5, False, False),
+    ("net_sentiment", -0.5, 0.5, False, False),
+)
+_SCALE_LO = np.array([spec[1] for spec in _SCALE_INPUTS], dtype=np.float64)
+_SCALE_COEF = 100 / (np.array([spec[2] for spec in _SCALE_INPUTS], dtype=np.float64) - _SCALE_LO)
+_INVERT = np.array([spec[3] for spec in _SCALE_INPUTS], dtype=bool)
+_ZERO_MISSING = np.array([spec[4] for spec in _SCALE_INPUTS], dtype=bool)
+
+_QUALITY = slice(0, 3)
+_GROWTH = slice(3, 5)
+_VALUATION = slice(5, 9)
+_RISK = slice(9, 12)
+_MOMENTUM = slice(12, 15)
+_SENTIMENT = slice(15, 17)
+
+
+def _scale_inputs(values):
+    """Scale raw inputs (last axis in _SCALE_INPUTS order) to 0-100 in one pass; missing -> NaN."""
+    values = np.where(_ZERO_MISSING & (values == 0), np.nan, values)
+    score = np.clip((values - _SCALE_LO) * _SCALE_COEF, 0, 100)
+    return np.where(_INVERT, 100 - score, score)
+
+
+def _slice_mean(scaled, columns):
+    """Mean of the present values in one factor slice, or None if all are missing."""
+    part = scaled[columns]
+    part = part[~np.isnan(part)]
+    return float(part.sum() / part.size) if part.size else None
+
+
+def _nanmean(*arrays):
+    """Row-wise mean ignoring NaN; NaN where every input is missing."""
+    total = np.zeros_like(arrays[0])
+    count = np.zeros_like(arrays[0])
+    for values in arrays:
+        present = ~np.isnan(values)
+        total += np.where(present, values, 0.0)
+        count += present
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, total / count, np.nan)
+
+
+def _or_neutral(values):
+    """Array form of `score or 50`."""
+    return np.where(np.isnan(values) | (values == 0), 50.0, values)
+
+
+_WEIGHT_KEYS = tuple(SCORE_WEIGHTS)
+_WEIGHT_VECTOR = np.array([SCORE_WEIGHTS[key] for key in _WEIGHT_KEYS])
+_ETF_WEIGHT_VECTOR = np.array([ETF_SCORE_WEIGHTS[key] for key in _WEIGHT_KEYS])
+# Indexed by the kernel's rating code
+_RATINGS = ("INVEST", "WATCH", "AVOID")
+_INVEST_THRESHOLD = THRESHOLDS["invest"]
+_WATCH_THRESHOLD = THRESHOLDS["watch"]
+_TIMING_EXCELLENT = TIMING_THRESHOLDS["excellent"]
+_TIMING_GOOD = TIMING_THRESHOLDS["good"]
+_TIMING_FAIR = TIMING_THRESHOLDS["fair"]
+
+
+def _weighted(scores, weights):
+    """
+    Contributions dict and weighted total for a factor -> score dict.
+    
+    Terms are added one at a time in _WEIGHT_KEYS order, the same order as
+    the batch kernel, so totals equal score_batch's exactly (sum() would
+    compensate the rounding on 3.12+ and drift from the kernel).
+    """
+    contributions = {}
+    total = 0.0
+    for key, weight in weights:
+        contribution = scores[key] * weight
+        contributions[key] = contribution
+        total += contribution
+    return contributions, total
+
+
+_weighted_equity = partial(_weighted, weights=tuple(zip(_WEIGHT_KEYS, _WEIGHT_VECTOR.tolist())))
+_weighted_etf = partial(_weighted, weights=tuple(zip(_WEIGHT_KEYS, _ETF_WEIGHT_VECTOR.tolist())))
+
+
+def _confidence_levels(total_scores, completeness, factor_scores):
+    """
+    High/Medium/Low confidence for (N,) totals and an (N, K) factor matrix.
+    
+    Agreement between factors (100 - 2 * std, lower spread = more agreement)
+    is blended 50/50 with data completeness; rows with fewer than three
+    present factors are Low.
+    """
+    enough = (~np.isnan(factor_scores)).sum(axis=1) >= 3
+    std = np.nanstd(np.where(enough[:, None], factor_scores, 0.0), axis=1)
+    agreement = np.clip(100 - std * 2, 0, None)
+    blended = completeness * 0.5 + agreement * 0.5
+    return np.select(
+        [~enough, (blended >= 75) & (total_scores >= 60), blended >= 50],
+        ["Low", "High", "Medium"],
+        default="Low",
+    )
+
+
+_FACTOR_FORMATS = {
+    "technical": {"rsi": _fmt_num},
+    "fundamental": {"roe": _fmt_pct, "revenue_growth": _fmt_pct},
+    "valuation": {"pe": _fmt_num, "forward_pe": _fmt_num, "peg": _fmt_num2},
+    "risk": {"volatility": _fmt_pct, "beta": _fmt_num2, "max_drawdown": _fmt_pct},
+    "sentiment": {"headline_score": _fmt_num2},
+    "momentum": {"total_return": _fmt_pct, "rolling_3m": _fmt_pct},
+}
+
+
+def format_factor_details(factor_inputs):
+    """
+    Display dicts for the Overview from raw per-factor inputs.
+    
+    Numeric fields are wrapped in Fmt, so the string formatting only runs
+    for the fields a template actually renders.
+    """
+    details = {}
+    for name, raw in factor_inputs.items():
+        formats = _FACTOR_FORMATS.get(name, {})
+        details[name] = {
+            key: formats[key](value) if key in formats else value
+            for key, value in raw.items()
+        }
+    return details
+
+
+def _etf_details():
+    """Placeholder details for factors that don't apply to ETFs."""
+    return {"score": 50, "signal": "neutral", "explanation": "Not applicable for ETFs."}
+
+
+# (factor, template when strong, template when weak) in the order reasons are
+# listed; "{}" is filled with the factor's explanation
+_FACTOR_MESSAGES = (
+    ("technical", "Technical outlook positive: {}", "Technical weakness: {}"),
+    ("fundamental", "Strong fundamentals: {}", "Fundamental concerns: {}"),
+    ("valuation", "Attractive valuation: {}", "Expensive valuation: {}"),
+    ("risk", "Favorable risk profile: {}", "Elevated risk: {}"),
+    ("sentiment", "Positive sentiment: {}", "Negative sentiment: {}"),
+    ("momentum", "Strong momentum: {}", "Weak momentum: {}"),
+    ("market", "Favorable market/sector conditions supporting the stock", "Challenging market/sector headwinds"),
+)
+
+# (factor, what would need to change) for factors scoring below 50, in listing order
+_TRIGGER_MESSAGES = (
+    ("valuation", "Valuation becomes more attractive (P/E contracts or earnings grow faster than price)"),
+    ("technical", "Technical trend turns bullish with price breaking above key moving averages"),
+    ("sentiment", "News sentiment shifts positive with sustained bullish coverage"),
+    ("risk", "Volatility decreases and risk metrics normalize"),
+    ("fundamental", "Earnings or revenue growth accelerates, margins expand"),
+    ("momentum", "Price momentum turns positive with higher highs and higher lows"),
+    ("market", "Market/sector conditions improve with broader rally"),
+)
+_TRIGGER_TEXTS = tuple(message for _, message in _TRIGGER_MESSAGES)
+# Factor matrix columns (_WEIGHT_KEYS order) in trigger listing order
+_TRIGGER_COLUMNS = [_WEIGHT_KEYS.index(key) for key, _ in _TRIGGER_MESSAGES]
+
+
+def _trigger_lists(factor_matrix):
+    """Up to four triggers per row of an (N, K) factor matrix, from one < 50 mask."""
+    mask = factor_matrix[:, _TRIGGER_COLUMNS] < 50
+    triggers = [[] for _ in range(len(mask))]
+    for row in np.flatnonzero(mask.any(axis=1)):
+        triggers[row] = [text for text, hit in zip(_TRIGGER_TEXTS, mask[row].tolist()) if hit][:4]
+    return triggers
+
+_PEER_RANK_KEYS = ("pe_ratio", "forward_pe", "roe", "revenue_growth", "debt_to_equity")
+
+_SIGNAL_LABELS = ("negative", "neutral", "positive")
 
 
 def _signal_from_score(score):
-    """Convert score to signal label."""
+    """Convert score to signal label: <=35 negative, >=65 positive."""
     if score is None:
         return "neutral"
-    if score >= 65:
-        return "positive"
-    if score <= 35:
-        return "negative"
-    return "neutral"
+    return _SIGNAL_LABELS[(score > 35) + (score >= 65)]
+
+
+def _explanation_table(phrase_groups, fallback):
+    """Precompute every sentence combination, keyed by one phrase index per group (0 = none)."""
+    table = {}
+    for key in product(*(range(len(group)) for group in phrase_groups)):
+        parts = [group[i] for group, i in zip(phrase_groups, key) if group[i]]
+        table[key] = ". ".join(parts) + "." if parts else fallback
+    return MappingProxyType(table)
+
+
+_TREND_CODES = MappingProxyType({"": 0, "bullish": 1, "bearish": 2})
+
+_TECH_EXPLANATIONS = _explanation_table(
+    (
+        (None, "Trend is bullish", "Trend is bearish", "Trend is neutral"),
+        (None, "RSI oversold (potential bounce)", "RSI overbought (potential pullback)", "RSI in neutral zone"),
+        (None, "MACD bullish", "MACD bearish"),
+    ),
+    "Insufficient technical data.",
+)
+
+_FUNDAMENTAL_EXPLANATIONS = _explanation_table(
+    (
+        (None, "Excellent ROE (>20%)", "Good ROE (>12%)", "Weak ROE (<12%)"),
+        (None, "Strong revenue growth", "Positive revenue growth", "Revenue declining"),
+    ),
+    "Limited fundamental data.",
+)
+
+_VALUATION_EXPLANATIONS = _explanation_table(
+    (
+        (None, "Low P/E suggests value", "High P/E reflects growth premium", "P/E in reasonable range"),
+        (None, "PEG < 1 (undervalued vs growth)", "PEG > 2 (expensive vs growth)"),
+    ),
+    "Limited valuation data.",
+)
+
+_RISK_EXPLANATIONS = _explanation_table(
+    (
+        (None, "High volatility (>40%)", "Low volatility (<20%)"),
+        (None, "High beta amplifies market moves", "Low beta provides stability"),
+        (None, "Large historical drawdown"),
+    ),
+    "Standard risk profile.",
+)
+
+_SENTIMENT_EXPLANATIONS = (
+    "Limited news coverage.",
+    "News sentiment predominantly positive.",
+    "News sentiment predominantly negative.",
+    "Mixed news sentiment.",
+)
+
+_MOMENTUM_EXPLANATIONS = (
+    "Neutral momentum.",
+    "Strong positive momentum.",
+    "Positive but modest momentum.",
+    "Negative momentum, price weakness.",
+)
+
+
+def _technical_bucket(trend, rsi, macd, macd_signal):
+    """Trend label (unrecognised labels read as neutral), RSI zone and MACD cross."""
+    if not rsi:
+        rsi_code = 0
+    elif rsi < 30:
+        rsi_code = 1
+    elif rsi > 70:
+        rsi_code = 2
+    else:
+        rsi_code = 3
+    if macd is None or macd_signal is None:
+        macd_code = 0
+    else:
+        macd_code = 1 if macd > macd_signal else 2
+    return _TREND_CODES.get(trend, 3), rsi_code, macd_code
+
+
+def _fundamental_bucket(roe, rev_growth):
+    if not roe:
+        roe_code = 0
+    elif roe > 0.20:
+        roe_code = 1
+    elif roe > 0.12:
+        roe_code = 2
+    else:
+        roe_code = 3
+    if not rev_growth:
+        growth_code = 0
+    elif rev_growth > 0.15:
+        growth_code = 1
+    elif rev_growth > 0:
+        growth_code = 2
+    else:
+        growth_code = 3
+    return roe_code, growth_code
+
+
+def _valuation_bucket(pe, peg):
+    if not pe:
+        pe_code = 0
+    elif pe < 15:
+        pe_code = 1
+    elif pe > 30:
+        pe_code = 2
+    else:
+        pe_code = 3
+    if peg and peg < 1:
+        peg_code = 1
+    elif peg and peg > 2:
+        peg_code = 2
+    else:
+        peg_code = 0
+    return pe_code, peg_code
+
+
+def _risk_bucket(vol, beta, dd):
+    vol_code = 1 if vol and vol > 0.40 else 2 if vol and vol < 0.20 else 0
+    beta_code = 1 if beta and beta > 1.3 else 2 if beta and beta < 0.7 else 0
+    return vol_code, beta_code, 1 if dd and dd < -0.30 else 0
+
+
+def _sentiment_bucket(pos, neg):
+    if pos > neg * 2:
+        return 1
+    if neg > pos * 2:
+        return 2
+    return 3 if pos > 0 or neg > 0 else 0
+
+
+def _momentum_bucket(total):
+    if not total:
+        return 0
+    if total > 0.20:
+        return 1
+    if total > 0:
+        return 2
+    return 3 if total < -0.10 else 0
+
+
+def _above(edge):
+    """Bucket edge for a strict `value > edge` test under bisect_right."""
+    return math.nextafter(edge, math.inf)
+
+
+# Timing buckets: scores[bisect_right(edges, value)]
+_RSI_TIMING_EDGES = (30, 40, _above(60), _above(70))
+_RSI_TIMING_SCORES = (90, 75, 55, 35, 20)  # oversold = excellent entry .. overbought = poor
+_SMA50_TIMING_EDGES = (-15, _above(-10), -2, _above(10))
+_SMA50_TIMING_SCORES = (40, 55, 75, 55, 30)  # % from 50 SMA; a modest pullback is best
+_VOL_TIMING_EDGES = (0.20, _above(0.40))
+_VOL_TIMING_SCORES = (70, 50, 35)  # calm entries score higher
+
+
+def _copy_recommendation(recommendation):
+    """
+    Copy of a cached Recommendation that the caller is free to mutate.
+    
+    The containers are copied one level deep (factor_inputs two, as it
+    holds a dict per factor); formatted factor_details are rebuilt lazily.
+    """
+    fresh = copy.copy(recommendation)
+    fresh.__dict__.pop("factor_details", None)
+    fresh.contributions = dict(recommendation.contributions)
+    fresh.positives = list(recommendation.positives)
+    fresh.risks = list(recommendation.risks)
+    fresh.triggers = list(recommendation.triggers)
+    if recommendation.factor_scores is not None:
+        fresh.factor_scores = dict(recommendation.factor_scores)
+    if recommendation.factor_inputs is not None:
+        fresh.factor_inputs = {key: dict(details) for key, details in recommendation.factor_inputs.items()}
+    return fresh
+
+
+def _bucket_score(edges, scores, value, default):
+    """Score for the bucket holding value; NaN, which orders nowhere, gets default."""
+    return scores[bisect_right(edges, value)] if value == value else default
 
 
 class ScoringService:
@@ -63,30 +517,82 @@ class ScoringService:
             completeness_percent: Data quality percentage
             quote_type: 'EQUITY', 'ETF', 'MUTUALFUND', etc.
             sector: Company sector for market scoring (e.g., 'Technology')
+        
+        Results are memoized on the analysis content digest for as long as
+        the market reading is reused, so rescoring unchanged data skips both
+        the market lookup and the scoring. Callers always get their own copy.
         """
+        key = (analysis.content_digest(), completeness_percent, quote_type, sector)
+        now = time.monotonic()
+        with _score_cache_lock:
+            hit = _score_cache.get(key)
+            if hit is not None and now - hit[0] < MARKET_DATA_TTL_SECONDS:
+                _score_cache.move_to_end(key)
+                return _copy_recommendation(hit[1])
+        
+        # Scoring runs outside the lock; two threads missing on the same key
+        # both score it and the later insert wins
+        market = self._market_score(sector)
+        recommendation = self._score(analysis, completeness_percent, quote_type, sector, market)
+        with _score_cache_lock:
+            _score_cache[key] = (now, recommendation)
+            _score_cache.move_to_end(key)
+            while len(_score_cache) > SCORE_CACHE_SIZE:
+                _score_cache.popitem(last=False)
+        return _copy_recommendation(recommendation)
+    
+    def _score(self, analysis, completeness_percent, quote_type, sector, market):
+        """Uncached body of score(); market is the _market_score() pair for sector."""
         is_etf = quote_type == "ETF"
-        weights = ETF_SCORE_WEIGHTS if is_etf else SCORE_WEIGHTS
+        tech = analysis.technicals
+        tbh = tech.trend_by_horizon
+        fund = analysis.fundamentals
+        prof = fund.profitability
+        val = fund.valuation
+        grw = fund.growth
+        snt = analysis.sentiment
+        price = analysis.price
+        rsk = analysis.risk
+        
+        roe = prof.get("roe")
+        revenue_growth = grw.get("revenue_growth")
+        earnings_growth = grw.get("earnings_growth")
+        pe = val.get("pe_ratio")
+        forward_pe = val.get("forward_pe")
+        peg = val.get("peg_ratio")
+        volatility = rsk.get("volatility")
+        beta = rsk.get("beta")
+        max_drawdown = rsk.get("max_drawdown")
+        headline_score = snt.headline_score
+        headline_volume = snt.headline_volume
+        positive_count = snt.positive_count
+        negative_count = snt.negative_count
+        net_sentiment = (positive_count - negative_count) / headline_volume if headline_volume > 0 else None
+        total_return = price.total_return
+        rolling = price.rolling_returns
+        rolling_3m = rolling.get("3m")
+        rolling_1m = rolling.get("1m")
+        
+        # Every scaled subscore input in one vectorized pass
+        scaled = _scale_inputs(np.array([
+            roe, prof.get("operating_margins"), prof.get("profit_margins"),
+            revenue_growth, earnings_growth,
+            pe, forward_pe, peg, val.get("ev_to_ebitda"),
+            volatility, beta, max_drawdown,
+            total_return, rolling_3m, rolling_1m,
+            headline_score, net_sentiment,
+        ], dtype=np.float64))
+        
         # ============================================================
         # TECHNICAL SCORE (20% weight)
         # Based on: trend direction, RSI positioning, MACD signals
         # ============================================================
-        trend_1m = analysis.technicals.trend_by_horizon.get("1m", "").lower()
-        trend_3m = analysis.technicals.trend_by_horizon.get("3m", "").lower()
-        trend_1w = analysis.technicals.trend_by_horizon.get("1w", "").lower()
-        
-        # Trend scoring: bullish = 75, bearish = 25, neutral = 50
-        trend_scores = []
-        if trend_1w:
-            trend_scores.append(75 if trend_1w == "bullish" else 25 if trend_1w == "bearish" else 50)
-        if trend_1m:
-            trend_scores.append(75 if trend_1m == "bullish" else 25 if trend_1m == "bearish" else 50)
-        if trend_3m:
-            trend_scores.append(75 if trend_3m == "bullish" else 25 if trend_3m == "bearish" else 50)
-        
-        trend_score = _avg(trend_scores) if trend_scores else 50
+        trend_score = _trend_score(tbh)
+        # 1M label is only used for display and the explanation
+        trend_1m = tbh.get("1m", "").lower()
         
         # RSI: 30-70 is ideal, extremes are less favorable
-        rsi = analysis.technicals.rsi_14
+        rsi = tech.rsi_14
         if rsi is not None:
             if 40 <= rsi <= 60:
                 rsi_score = 70  # Neutral zone - good
@@ -100,227 +606,120 @@ class ScoringService:
             rsi_score = None
         
         # MACD: positive histogram is bullish
-        macd = analysis.technicals.macd
-        macd_signal = analysis.technicals.macd_signal
+        macd = tech.macd
+        macd_signal = tech.macd_signal
         if macd is not None and macd_signal is not None:
             macd_score = 70 if macd > macd_signal else 30
         else:
             macd_score = None
         
-        technical_score = _avg([trend_score, rsi_score, macd_score])
+        technical_score = _avg_nn(trend_score, rsi_score, macd_score)
         
         technical_details = {
             "score": technical_score,
             "signal": _signal_from_score(technical_score),
             "trend": f"{trend_1m.title() if trend_1m else 'N/A'} (1M)",
-            "rsi": f"{rsi:.1f}" if rsi else "N/A",
+            "rsi": rsi,
             "rsi_signal": "Oversold" if rsi and rsi < 30 else "Overbought" if rsi and rsi > 70 else "Normal" if rsi else "N/A",
             "macd_signal": "Bullish" if macd and macd_signal and macd > macd_signal else "Bearish" if macd and macd_signal else "N/A",
-            "explanation": self._explain_technical(trend_1m, rsi, macd, macd_signal),
+            "explanation": _TECH_EXPLANATIONS[_technical_bucket(trend_1m, rsi, macd, macd_signal)],
         }
         
         # ============================================================
         # FUNDAMENTAL SCORE (25% weight)
         # Quality (ROE, margins) + Growth (revenue, earnings)
         # ============================================================
-        # Quality metrics
-        roe = analysis.fundamentals.profitability.get("roe")
-        roa = analysis.fundamentals.profitability.get("roa")
-        operating_margin = analysis.fundamentals.profitability.get("operating_margins")
-        profit_margin = analysis.fundamentals.profitability.get("profit_margins")
-        
-        quality_score = _avg([
-            _scale(roe, 0, 0.30),  # ROE: 0-30% range
-            _scale(operating_margin, 0, 0.30),  # Op margin: 0-30%
-            _scale(profit_margin, 0, 0.25),  # Net margin: 0-25%
-        ])
-        
-        # Growth metrics
-        revenue_growth = analysis.fundamentals.growth.get("revenue_growth")
-        earnings_growth = analysis.fundamentals.growth.get("earnings_growth")
-        
-        growth_score = _avg([
-            _scale(revenue_growth, -0.20, 0.40),  # -20% to +40%
-            _scale(earnings_growth, -0.30, 0.50),  # -30% to +50%
-        ])
-        
-        fundamental_score = _avg([quality_score, growth_score])
-        
-        fundamental_details = {
-            "score": fundamental_score,
-            "signal": _signal_from_score(fundamental_score),
-            "quality_score": quality_score,
-            "growth_score": growth_score,
-            "roe": f"{roe*100:.1f}%" if roe else "N/A",
-            "revenue_growth": f"{revenue_growth*100:.1f}%" if revenue_growth else "N/A",
-            "explanation": self._explain_fundamental(roe, revenue_growth, earnings_growth),
-        }
-        
-        # ============================================================
-        # VALUATION SCORE (20% weight)
-        # Lower multiples = higher score (inverted)
-        # ============================================================
-        pe = analysis.fundamentals.valuation.get("pe_ratio")
-        forward_pe = analysis.fundamentals.valuation.get("forward_pe")
-        peg = analysis.fundamentals.valuation.get("peg_ratio")
-        pb = analysis.fundamentals.valuation.get("price_to_book")
-        ev_ebitda = analysis.fundamentals.valuation.get("ev_to_ebitda")
-        
-        valuation_subscores = [
-            _scale(pe, 5, 40, invert=True) if pe else None,
-            _scale(forward_pe, 5, 35, invert=True) if forward_pe else None,
-            _scale(peg, 0.5, 3, invert=True) if peg else None,
-            _scale(ev_ebitda, 5, 25, invert=True) if ev_ebitda else None,
-        ]
-        
-        valuation_score = _avg(valuation_subscores)
-        
-        valuation_details = {
-            "score": valuation_score,
-            "signal": _signal_from_score(valuation_score),
-            "pe": f"{pe:.1f}" if pe else "N/A",
-            "forward_pe": f"{forward_pe:.1f}" if forward_pe else "N/A",
-            "peg": f"{peg:.2f}" if peg else "N/A",
-            "explanation": self._explain_valuation(pe, forward_pe, peg),
-        }
+        if is_etf:
+            # ETFs aren't scored on fundamentals or valuation
+            fundamental_score = valuation_score = 50
+            fundamental_details = _etf_details()
+            valuation_details = _etf_details()
+        else:
+            # Quality (ROE, op margin 0-30%, net margin 0-25%) and growth
+            # (revenue -20% to +40%, earnings -30% to +50%)
+            quality_score = _slice_mean(scaled, _QUALITY)
+            growth_score = _slice_mean(scaled, _GROWTH)
+        
+            fundamental_score = _avg_nn(quality_score, growth_score)
+        
+            fundamental_details = {
+                "score": fundamental_score,
+                "signal": _signal_from_score(fundamental_score),
+                "quality_score": quality_score,
+                "growth_score": growth_score,
+                "roe": roe,
+                "revenue_growth": revenue_growth,
+                "explanation": _FUNDAMENTAL_EXPLANATIONS[_fundamental_bucket(roe, revenue_growth)],
+            }
+        
+            # ============================================================
+            # VALUATION SCORE (20% weight)
+            # Lower multiples = higher score (inverted)
+            # ============================================================
+            valuation_score = _slice_mean(scaled, _VALUATION)
+        
+            valuation_details = {
+                "score": valuation_score,
+                "signal": _signal_from_score(valuation_score),
+                "pe": pe,
+                "forward_pe": forward_pe,
+                "peg": peg,
+                "explanation": _VALUATION_EXPLANATIONS[_valuation_bucket(pe, peg)],
+            }
         
         # ============================================================
         # RISK SCORE (15% weight)
         # Lower risk = higher score (inverted for most metrics)
         # ============================================================
-        volatility = analysis.risk.get("volatility")
-        beta = analysis.risk.get("beta")
-        max_drawdown = analysis.risk.get("max_drawdown")
-        
-        risk_subscores = [
-            _scale(volatility, 0.15, 0.50, invert=True) if volatility else None,
-            _scale(beta, 0.5, 2.0, invert=True) if beta else None,
-            _scale(max_drawdown, -0.50, -0.05, invert=False) if max_drawdown else None,  # Less negative = better
-        ]
-        
-        risk_score = _avg(risk_subscores)
+        risk_score = _slice_mean(scaled, _RISK)
         
         risk_details = {
             "score": risk_score,
             "signal": _signal_from_score(risk_score),
-            "volatility": f"{volatility*100:.1f}%" if volatility else "N/A",
-            "beta": f"{beta:.2f}" if beta else "N/A",
-            "max_drawdown": f"{max_drawdown*100:.1f}%" if max_drawdown else "N/A",
-            "explanation": self._explain_risk(volatility, beta, max_drawdown),
+            "volatility": volatility,
+            "beta": beta,
+            "max_drawdown": max_drawdown,
+            "explanation": _RISK_EXPLANATIONS[_risk_bucket(volatility, beta, max_drawdown)],
         }
         
         # ============================================================
         # SENTIMENT SCORE (10% weight)
         # News sentiment analysis
         # ============================================================
-        headline_score = analysis.sentiment.headline_score
-        positive_pct = analysis.sentiment.positive_count / max(analysis.sentiment.headline_volume, 1) if analysis.sentiment.headline_volume > 0 else 0
-        negative_pct = analysis.sentiment.negative_count / max(analysis.sentiment.headline_volume, 1) if analysis.sentiment.headline_volume > 0 else 0
-        
-        sentiment_subscores = [
-            _scale(headline_score, -0.5, 0.5) if headline_score is not None else None,
-            _scale(positive_pct - negative_pct, -0.5, 0.5) if analysis.sentiment.headline_volume > 0 else None,
-        ]
-        
-        sentiment_score = _avg(sentiment_subscores) if any(s is not None for s in sentiment_subscores) else 50
+        sentiment_score = _slice_mean(scaled, _SENTIMENT)
+        if sentiment_score is None:
+            sentiment_score = 50
         
         sentiment_details = {
             "score": sentiment_score,
             "signal": _signal_from_score(sentiment_score),
-            "headline_score": f"{headline_score:.2f}" if headline_score else "N/A",
-            "positive_count": analysis.sentiment.positive_count,
-            "negative_count": analysis.sentiment.negative_count,
-            "overall": analysis.sentiment.overall_sentiment,
-            "explanation": self._explain_sentiment(headline_score, analysis.sentiment.positive_count, analysis.sentiment.negative_count),
+            "headline_score": headline_score,
+            "positive_count": positive_count,
+            "negative_count": negative_count,
+            "overall": snt.overall_sentiment,
+            "explanation": _SENTIMENT_EXPLANATIONS[_sentiment_bucket(positive_count, negative_count)],
         }
         
         # ============================================================
         # MOMENTUM SCORE (10% weight)
         # Recent price performance
         # ============================================================
-        total_return = analysis.price.total_return
-        rolling_3m = analysis.price.rolling_returns.get("3m")
-        rolling_1m = analysis.price.rolling_returns.get("1m")
-        
-        momentum_subscores = [
-            _scale(total_return, -0.30, 0.50) if total_return else None,
-            _scale(rolling_3m, -0.20, 0.30) if rolling_3m else None,
-            _scale(rolling_1m, -0.10, 0.15) if rolling_1m else None,
-        ]
-        
-        momentum_score = _avg(momentum_subscores)
+        momentum_score = _slice_mean(scaled, _MOMENTUM)
         
         momentum_details = {
             "score": momentum_score,
             "signal": _signal_from_score(momentum_score),
-            "total_return": f"{total_return*100:.1f}%" if total_return else "N/A",
-            "rolling_3m": f"{rolling_3m*100:.1f}%" if rolling_3m else "N/A",
-            "explanation": self._explain_momentum(total_return, rolling_3m),
+            "total_return": total_return,
+            "rolling_3m": rolling_3m,
+            "explanation": _MOMENTUM_EXPLANATIONS[_momentum_bucket(total_return)],
         }
         
         # ============================================================
         # MARKET & SECTOR SCORE (8% weight)
         # Overall market conditions and sector performance
         # ============================================================
-        market_score = 50  # Default neutral
-        market_explanation = "Market data not available."
         sector_name = sector  # Use passed sector parameter
-        
-        # Sector to ETF mapping
-        sector_etf_map = {
-            "Technology": "XLK",
-            "Financial Services": "XLF",
-            "Healthcare": "XLV",
-            "Energy": "XLE",
-            "Industrials": "XLI",
-            "Consumer Cyclical": "XLY",
-            "Consumer Defensive": "XLP",
-            "Utilities": "XLU",
-            "Basic Materials": "XLB",
-            "Real Estate": "XLRE",
-            "Communication Services": "XLC",
-        }
-        
-        try:
-            from core.analytics.market_sentiment import analyze_market_sentiment, get_sector_performance
-            
-            # Get market sentiment
-            market_data = analyze_market_sentiment()
-            market_sentiment_score = market_data.get("score", 0)
-            
-            # Scale market sentiment from -100/+100 to 0-100
-            market_component = (market_sentiment_score + 100) / 2
-            
-            # Get sector performance
-            sectors = get_sector_performance()
-            sector_component = 50  # Default
-            
-            # Match company's sector to sector ETF performance
-            if sector_name and sector_name in sector_etf_map:
-                target_etf = sector_etf_map[sector_name]
-                for sector_data in sectors:
-                    if sector_data.get("ticker") == target_etf:
-                        sector_change = sector_data.get("weekly_change", 0)
-                        # Scale sector change: -5% to +5% -> 0 to 100
-                        sector_component = _scale(sector_change, -5, 5) or 50
-                        break
-            else:
-                # If no sector match, use average of all sectors
-                all_changes = [s.get("weekly_change", 0) for s in sectors if s.get("weekly_change") is not None]
-                if all_changes:
-                    avg_change = sum(all_changes) / len(all_changes)
-                    sector_component = _scale(avg_change, -5, 5) or 50
-            
-            # Combine market sentiment (60%) and sector (40%)
-            market_score = (market_component * 0.6) + (sector_component * 0.4)
-            
-            sentiment_label = market_data.get("sentiment", "Neutral")
-            market_explanation = f"Market is {sentiment_label}. "
-            if sector_name:
-                market_explanation += f"Sector ({sector_name}) showing recent momentum."
-            
-        except Exception as e:
-            market_explanation = "Unable to analyze market conditions."
+        market_score, market_explanation = market
         
         market_details = {
             "score": market_score,
@@ -333,102 +732,115 @@ class ScoringService:
         # PEERS SCORE (7% weight)
         # How does this stock compare to its peers?
         # ============================================================
-        peers_score = 50  # Default neutral
-        peers_explanation = "Limited peer data available."
-        
-        peer_ranks = analysis.peers.percentile_ranks if analysis.peers else {}
-        if peer_ranks:
-            peer_subscores = []
+        if is_etf:
+            peers_score = 50
+            peers_details = _etf_details()
+        else:
+            peers_score = 50  # Default neutral
+            peers_explanation = "Limited peer data available."
+        
+            peer_ranks = analysis.peers.percentile_ranks if analysis.peers else {}
+            pe_rank, fwd_pe_rank, roe_rank, rev_rank, de_rank = map(peer_ranks.get, _PEER_RANK_KEYS)
+            if peer_ranks:
+                total = 0.0
+                count = 0
             
-            # P/E rank: lower is better (cheaper valuation)
-            pe_rank = peer_ranks.get("pe_ratio")
-            if pe_rank is not None:
-                # Invert: low percentile (cheap) = high score
-                peer_subscores.append(100 - pe_rank)
+                # P/E rank: lower is better (cheaper valuation)
+                if pe_rank is not None:
+                    # Invert: low percentile (cheap) = high score
+                    total += 100 - pe_rank
+                    count += 1
             
-            # Forward P/E rank: lower is better
-            fwd_pe_rank = peer_ranks.get("forward_pe")
-            if fwd_pe_rank is not None:
-                peer_subscores.append(100 - fwd_pe_rank)
+                # Forward P/E rank: lower is better
+                if fwd_pe_rank is not None:
+                    total += 100 - fwd_pe_rank
+                    count += 1
             
-            # ROE rank: higher is better (more profitable)
-            roe_rank = peer_ranks.get("roe")
-            if roe_rank is not None:
-                peer_subscores.append(roe_rank)
+                # ROE rank: higher is better (more profitable)
+                if roe_rank is not None:
+                    total += roe_rank
+                    count += 1
             
-            # Revenue growth rank: higher is better
-            rev_rank = peer_ranks.get("revenue_growth")
-            if rev_rank is not None:
-                peer_subscores.append(rev_rank)
+                # Revenue growth rank: higher is better
+                if rev_rank is not None:
+                    total += rev_rank
+                    count += 1
             
-            # Debt/Equity rank: lower is better (less leveraged)
-            de_rank = peer_ranks.get("debt_to_equity")
-            if de_rank is not None:
-                peer_subscores.append(100 - de_rank)
+                # Debt/Equity rank: lower is better (less leveraged)
+                if de_rank is not None:
+                    total += 100 - de_rank
+                    count += 1
             
-            if peer_subscores:
-                peers_score = _avg(peer_subscores)
+                if count:
+                    peers_score = total / count
                 
-                # Build explanation
-                strengths = []
-                weaknesses = []
-                if pe_rank is not None:
-                    if pe_rank < 30:
-                        strengths.append("cheaper valuation than most peers")
-                    elif pe_rank > 70:
-                        weaknesses.append("more expensive than peers")
-                if roe_rank is not None:
-                    if roe_rank > 70:
-                        strengths.append("higher profitability")
-                    elif roe_rank < 30:
-                        weaknesses.append("lower profitability")
+                    # Build explanation
+                    strengths = []
+                    weaknesses = []
+                    if pe_rank is not None:
+                        if pe_rank < 30:
+                            strengths.append("cheaper valuation than most peers")
+                        elif pe_rank > 70:
+                            weaknesses.append("more expensive than peers")
+                    if roe_rank is not None:
+                        if roe_rank > 70:
+                            strengths.append("higher profitability")
+                        elif roe_rank < 30:
+                            weaknesses.append("lower profitability")
                 
-                if strengths:
-                    peers_explanation = f"Ranks favorably: {', '.join(strengths)}."
-                elif weaknesses:
-                    peers_explanation = f"Ranks below peers: {', '.join(weaknesses)}."
-                else:
-                    peers_explanation = "Ranks near peer average on key metrics."
-        
-        peers_details = {
-            "score": peers_score,
-            "signal": _signal_from_score(peers_score),
-            "pe_rank": peer_ranks.get("pe_ratio"),
-            "roe_rank": peer_ranks.get("roe"),
-            "explanation": peers_explanation,
-        }
+                    if strengths:
+                        peers_explanation = f"Ranks favorably: {', '.join(strengths)}."
+                    elif weaknesses:
+                        peers_explanation = f"Ranks below peers: {', '.join(weaknesses)}."
+                    else:
+                        peers_explanation = "Ranks near peer average on key metrics."
+        
+            peers_details = {
+                "score": peers_score,
+                "signal": _signal_from_score(peers_score),
+                "pe_rank": pe_rank,
+                "roe_rank": roe_rank,
+                "explanation": peers_explanation,
+            }
         
         # ============================================================
         # CALCULATE FINAL WEIGHTED SCORE
         # ============================================================
-        scores = {
-            "technical": technical_score or 50,
-            "momentum": momentum_score or 50,
-            "fundamental": fundamental_score or 50 if not is_etf else 50,
-            "valuation": valuation_score or 50 if not is_etf else 50,
-            "peers": peers_score or 50 if not is_etf else 50,
-            "market": market_score or 50,
-            "sentiment": sentiment_score or 50,
-            "risk": risk_score or 50,
-        }
+        factors = (
+            ("technical", technical_score, technical_details),
+            ("momentum", momentum_score, momentum_details),
+            ("fundamental", fundamental_score, fundamental_details),
+            ("valuation", valuation_score, valuation_details),
+            ("peers", peers_score, peers_details),
+            ("market", market_score, market_details),
+            ("sentiment", sentiment_score, sentiment_details),
+            ("risk", risk_score, risk_details),
+        )
         
-        weighted_total = 0
-        for key, weight in weights.items():  # Use dynamic weights (ETF vs equity)
-            weighted_total += scores[key] * weight
+        # Scores, waterfall contributions (dynamic ETF/equity weights) and
+        # raw factor inputs (display strings are formatted on first access)
+        scores = {}
+        factor_inputs = {}
+        for key, factor_score, details in factors:
+            scores[key] = factor_score or 50
+            factor_inputs[key] = details
         
-        weighted_total = max(0, min(100, weighted_total))
+        # Weights for this asset class: contributions and total in one pass
+        contributions, weighted_total = (_weighted_etf if is_etf else _weighted_equity)(scores)
+        weighted_total = max(0.0, min(100.0, weighted_total))
+        rating = _RATINGS[(weighted_total < _INVEST_THRESHOLD) + (weighted_total < _WATCH_THRESHOLD)]
         
         # ============================================================
         # CALCULATE TIMING SIGNAL (Entry Point Quality)
         # ============================================================
-        timing_score = self._calculate_timing_signal(analysis)
-        if timing_score >= TIMING_THRESHOLDS["excellent"]:
+        timing_score = self._calculate_timing_signal(analysis, rolling_1m, rolling_3m)
+        if timing_score >= _TIMING_EXCELLENT:
             timing_signal = "Excellent"
             timing_description = "Strong entry point. Technical indicators suggest favorable timing for new positions."
-        elif timing_score >= TIMING_THRESHOLDS["good"]:
+        elif timing_score >= _TIMING_GOOD:
             timing_signal = "Good"
             timing_description = "Reasonable entry point. Some technical support for initiating positions."
-        elif timing_score >= TIMING_THRESHOLDS["fair"]:
+        elif timing_score >= _TIMING_FAIR:
             timing_signal = "Fair"
             timing_description = "Neutral timing. Consider scaling in gradually or waiting for pullback."
         else:
@@ -438,46 +850,22 @@ class ScoringService:
         # ============================================================
         # DETERMINE RATING
         # ============================================================
-        if weighted_total >= THRESHOLDS["invest"]:
-            rating = "INVEST"
+        if rating == "INVEST":
             if timing_signal in ["Excellent", "Good"]:
                 rating_description = "Strong buy signal with favorable entry timing. Consider initiating or adding to positions."
             else:
                 rating_description = "Fundamentally attractive but timing is suboptimal. Consider scaling in on pullbacks."
-        elif weighted_total >= THRESHOLDS["watch"]:
-            rating = "WATCH"
+        elif rating == "WATCH":
             rating_description = "Hold or monitor. Mixed signals or fair valuation. Wait for better entry point or improving fundamentals."
         else:
-            rating = "AVOID"
             rating_description = "Unfavorable risk/reward. Deteriorating fundamentals, poor valuation, or excessive risk. Consider alternatives."
         
         # ============================================================
         # BUILD DETAILED OUTPUT
         # ============================================================
         confidence = self._calculate_confidence(weighted_total, completeness_percent, scores)
-        positives, risks = self._build_reasoning(scores, technical_details, fundamental_details, valuation_details, risk_details, sentiment_details, momentum_details, market_details)
-        triggers = self._build_triggers(scores, valuation_details, technical_details, sentiment_details)
-        
-        # Contributions for waterfall chart (use dynamic weights)
-        contributions = {key: scores[key] * weights[key] for key in scores}
-        
-        # Factor details for Overview display
-        factor_details = {
-            "technical": technical_details,
-            "momentum": momentum_details,
-            "fundamental": fundamental_details,
-            "valuation": valuation_details,
-            "peers": peers_details,
-            "market": market_details,
-            "sentiment": sentiment_details,
-            "risk": risk_details,
-        }
-        
-        # For ETFs, update inapplicable factor explanations
-        if is_etf:
-            factor_details["fundamental"]["explanation"] = "Not applicable for ETFs."
-            factor_details["valuation"]["explanation"] = "Not applicable for ETFs."
-            factor_details["peers"]["explanation"] = "Not applicable for ETFs."
+        positives, risks = self._build_reasoning(scores, factor_inputs)
+        triggers = self._build_triggers(scores)
         
         return Recommendation(
             rating=rating,
@@ -488,7 +876,7 @@ class ScoringService:
             risks=risks,
             triggers=triggers,
             rating_description=rating_description,
-            factor_details=factor_details,
+            factor_inputs=factor_inputs,
             factor_scores=scores,
             timing_signal=timing_signal,
             timing_score=round(timing_score, 1),
@@ -496,181 +884,207 @@ class ScoringService:
             is_etf=is_etf,
         )
     
-    def _explain_technical(self, trend, rsi, macd, macd_signal):
-        parts = []
-        if trend:
-            parts.append(f"Trend is {trend}")
-        if rsi:
-            if rsi < 30:
-                parts.append("RSI oversold (potential bounce)")
-            elif rsi > 70:
-                parts.append("RSI overbought (potential pullback)")
-            else:
-                parts.append("RSI in neutral zone")
-        if macd is not None and macd_signal is not None:
-            parts.append("MACD bullish" if macd > macd_signal else "MACD bearish")
-        return ". ".join(parts) + "." if parts else "Insufficient technical data."
-    
-    def _explain_fundamental(self, roe, rev_growth, earn_growth):
-        parts = []
-        if roe:
-            if roe > 0.20:
-                parts.append("Excellent ROE (>20%)")
-            elif roe > 0.12:
-                parts.append("Good ROE (>12%)")
-            else:
-                parts.append("Weak ROE (<12%)")
-        if rev_growth:
-            if rev_growth > 0.15:
-                parts.append("Strong revenue growth")
-            elif rev_growth > 0:
-                parts.append("Positive revenue growth")
-            else:
-                parts.append("Revenue declining")
-        return ". ".join(parts) + "." if parts else "Limited fundamental data."
-    
-    def _explain_valuation(self, pe, fwd_pe, peg):
-        parts = []
-        if pe:
-            if pe < 15:
-                parts.append("Low P/E suggests value")
-            elif pe > 30:
-                parts.append("High P/E reflects growth premium")
-            else:
-                parts.append("P/E in reasonable range")
-        if peg:
-            if peg < 1:
-                parts.append("PEG < 1 (undervalued vs growth)")
-            elif peg > 2:
-                parts.append("PEG > 2 (expensive vs growth)")
-        return ". ".join(parts) + "." if parts else "Limited valuation data."
-    
-    def _explain_risk(self, vol, beta, dd):
-        parts = []
-        if vol:
-            if vol > 0.40:
-                parts.append("High volatility (>40%)")
-            elif vol < 0.20:
-                parts.append("Low volatility (<20%)")
-        if beta:
-            if beta > 1.3:
-                parts.append("High beta amplifies market moves")
-            elif beta < 0.7:
-                parts.append("Low beta provides stability")
-        if dd:
-            if dd < -0.30:
-                parts.append("Large historical drawdown")
-        return ". ".join(parts) + "." if parts else "Standard risk profile."
-    
-    def _explain_sentiment(self, score, pos, neg):
-        if pos > neg * 2:
-            return "News sentiment predominantly positive."
-        elif neg > pos * 2:
-            return "News sentiment predominantly negative."
-        elif pos > 0 or neg > 0:
-            return "Mixed news sentiment."
-        return "Limited news coverage."
+    def score_batch(self, analyses, quote_types=None, sectors=None, completeness=None, triggers=False):
+        """
+        Vectorized final scores for many analyses at once.
+        
+        Computes the same weighted total as score() for each AnalysisPack,
+        without reasoning or factor details, for screening runs.
+        
+        Args:
+            analyses: sequence of AnalysisPack
+            quote_types: optional parallel sequence of quote types
+            sectors: optional parallel sequence of sectors
+            completeness: optional parallel sequence of data quality percentages
+            triggers: also return each ticker's trigger list
+        
+        Returns:
+            np.ndarray of final scores rounded to one decimal; when
+            completeness and/or triggers are requested, a tuple of scores
+            followed by confidence levels and/or trigger lists, in that order
+        """
+        n = len(analyses)
+        if quote_types is None:
+            quote_types = [None] * n
+        if sectors is None:
+            sectors = [None] * n
+        is_etf = np.array([quote_type == "ETF" for quote_type in quote_types], dtype=bool)
+        
+        trend, rsi, macd, macd_signal = [], [], [], []
+        inputs = []
+        peers = []
+        for analysis in analyses:
+            tech = analysis.technicals
+            trend.append(_trend_score(tech.trend_by_horizon))
+            rsi.append(tech.rsi_14)
+            macd.append(tech.macd)
+            macd_signal.append(tech.macd_signal)
+            
+            fund = analysis.fundamentals
+            prof, grw, val = fund.profitability, fund.growth, fund.valuation
+            rsk, snt, price = analysis.risk, analysis.sentiment, analysis.price
+            rolling = price.rolling_returns
+            volume = snt.headline_volume
+            inputs.append((
+                prof.get("roe"), prof.get("operating_margins"), prof.get("profit_margins"),
+                grw.get("revenue_growth"), grw.get("earnings_growth"),
+                val.get("pe_ratio"), val.get("forward_pe"), val.get("peg_ratio"), val.get("ev_to_ebitda"),
+                rsk.get("volatility"), rsk.get("beta"), rsk.get("max_drawdown"),
+                price.total_return, rolling.get("3m"), rolling.get("1m"),
+                snt.headline_score,
+                (snt.positive_count - snt.negative_count) / volume if volume > 0 else None,
+            ))
+            
+            peer_ranks = analysis.peers.percentile_ranks if analysis.peers else {}
+            peers.append(tuple(map(peer_ranks.get, _PEER_RANK_KEYS)))
+        
+        # Technical: trend, RSI zone and MACD crossover. Only a missing RSI
+        # drops out; a NaN one (under 14 bars) fails every zone test and takes
+        # the overbought default, as in score()
+        rsi_missing = np.array([value is None for value in rsi], dtype=bool)
+        rsi = _column(rsi)
+        with np.errstate(invalid="ignore"):
+            rsi_score = np.select(
+                [
+                    rsi_missing,
+                    (rsi >= 40) & (rsi <= 60),
+                    ((rsi >= 30) & (rsi < 40)) | ((rsi > 60) & (rsi <= 70)),
+                    rsi < 30,
+                ],
+                [np.nan, 70.0, 55.0, 65.0],
+                default=35.0,
+            )
+        macd, macd_signal = _column(macd), _column(macd_signal)
+        macd_score = np.where(
+            np.isnan(macd) | np.isnan(macd_signal),
+            np.nan,
+            np.where(macd > macd_signal, 70.0, 30.0),
+        )
+        technical = _nanmean(np.array(trend, dtype=np.float64), rsi_score, macd_score)
+        
+        scaled = _scale_inputs(np.array(inputs, dtype=np.float64).reshape(n, len(_SCALE_INPUTS)))
+        fundamental = _nanmean(_nanmean(*scaled[:, _QUALITY].T), _nanmean(*scaled[:, _GROWTH].T))
+        valuation = _nanmean(*scaled[:, _VALUATION].T)
+        risk = _nanmean(*scaled[:, _RISK].T)
+        sentiment = _nanmean(*scaled[:, _SENTIMENT].T)
+        momentum = _nanmean(*scaled[:, _MOMENTUM].T)
+        
+        # Peers: cheaper P/E and forward P/E, higher ROE and growth, lower leverage
+        ranks = np.array(peers, dtype=np.float64).reshape(n, len(_PEER_RANK_KEYS))
+        pe_rank, fwd_pe_rank, roe_rank, rev_rank, de_rank = ranks.T
+        peers_score = _nanmean(100 - pe_rank, 100 - fwd_pe_rank, roe_rank, rev_rank, 100 - de_rank)
+        
+        # Market data is shared, so it is resolved once per distinct sector
+        market_by_sector = {sector: self._market_score(sector)[0] for sector in set(sectors)}
+        market = np.array([market_by_sector[sector] for sector in sectors], dtype=np.float64)
+        
+        scores = {
+            "technical": _or_neutral(technical),
+            "momentum": _or_neutral(momentum),
+            "fundamental": np.where(is_etf, 50.0, _or_neutral(fundamental)),
+            "valuation": np.where(is_etf, 50.0, _or_neutral(valuation)),
+            "peers": np.where(is_etf, 50.0, _or_neutral(peers_score)),
+            "market": _or_neutral(market),
+            "sentiment": _or_neutral(sentiment),
+            "risk": _or_neutral(risk),
+        }
+        factor_matrix = np.column_stack([scores[key] for key in _WEIGHT_KEYS])
+        weight_matrix = np.where(is_etf[:, None], _ETF_WEIGHT_VECTOR, _WEIGHT_VECTOR)
+        totals, _ = weighted_score_batch(
+            factor_matrix, weight_matrix, _INVEST_THRESHOLD, _WATCH_THRESHOLD
+        )
+        weighted_total = totals[:, 0]
+        
+        # Python's round() keeps ties identical to score()
+        rounded = np.array([round(total, 1) for total in weighted_total.tolist()])
+        extras = []
+        if completeness is not None:
+            extras.append(_confidence_levels(
+                weighted_total, np.asarray(completeness, dtype=np.float64), factor_matrix
+            ))
+        if triggers:
+            extras.append(_trigger_lists(factor_matrix))
+        return (rounded, *extras) if extras else rounded
     
-    def _explain_momentum(self, total, rolling_3m):
-        if total and total > 0.20:
-            return "Strong positive momentum."
-        elif total and total > 0:
-            return "Positive but modest momentum."
-        elif total and total < -0.10:
-            return "Negative momentum, price weakness."
-        return "Neutral momentum."
+    def _market_score(self, sector_name):
+        """Blend market sentiment (60%) with the sector ETF's weekly move (40%)."""
+        market_score = 50  # Default neutral
+        market_explanation = "Market data not available."
+        
+        global _market_down_until
+        if not HAS_MARKET_DATA or time.monotonic() < _market_down_until:
+            market_explanation = "Unable to analyze market conditions."
+        else:
+            try:
+                # Get market sentiment
+                market_data = _cached(analyze_market_sentiment)
+                market_sentiment_score = market_data.get("score", 0)
+            
+                # Scale market sentiment from -100/+100 to 0-100
+                market_component = (market_sentiment_score + 100) / 2
+            
+                # Get sector performance
+                sectors = _cached(get_sector_performance)
+                sector_component = 50  # Default
+            
+                # Match company's sector to sector ETF performance
+                if sector_name and sector_name in SECTOR_ETF_MAP:
+                    target_etf = SECTOR_ETF_MAP[sector_name]
+                    lookup = _sector_lookup(
+                        tuple((s.get("ticker"), s.get("weekly_change")) for s in sectors)
+                    )
+                    if target_etf in lookup:
+                        # Scale sector change: -5% to +5% -> 0 to 100
+                        sector_component = _scale_pre(lookup[target_etf], -5, 100 / (5 + 5)) or 50
+                else:
+                    # If no sector match, use average of all sectors
+                    all_changes = [s.get("weekly_change", 0) for s in sectors if s.get("weekly_change") is not None]
+                    if all_changes:
+                        avg_change = sum(all_changes) / len(all_changes)
+                        sector_component = _scale_pre(avg_change, -5, 100 / (5 + 5)) or 50
+            
+                # Combine market sentiment (60%) and sector (40%)
+                market_score = (market_component * 0.6) + (sector_component * 0.4)
+            
+                sentiment_label = market_data.get("sentiment", "Neutral")
+                market_explanation = f"Market is {sentiment_label}. "
+                if sector_name:
+                    market_explanation += f"Sector ({sector_name}) showing recent momentum."
+            
+            except _MARKET_DATA_ERRORS:
+                # Skip the upstream for a TTL instead of re-raising on every ticker
+                _market_down_until = time.monotonic() + MARKET_DATA_TTL_SECONDS
+                market_explanation = "Unable to analyze market conditions."
+        return market_score, market_explanation
     
     def _calculate_confidence(self, total_score, completeness, scores):
-        # Check agreement between factors
         score_values = [v for v in scores.values() if v is not None]
         if len(score_values) < 3:
             return "Low"
-        
-        # Standard deviation of scores - lower = more agreement
-        avg_score = sum(score_values) / len(score_values)
-        variance = sum((s - avg_score) ** 2 for s in score_values) / len(score_values)
-        std_dev = variance ** 0.5
-        
-        agreement_score = max(0, 100 - std_dev * 2)  # Lower std dev = higher agreement
-        
-        # Blend completeness and agreement
-        blended = (completeness * 0.5) + (agreement_score * 0.5)
-        
-        if blended >= 75 and total_score >= 60:
-            return "High"
-        if blended >= 50:
+        # Population std is at most half the range, so a spread narrower than
+        # the completeness already clears the Medium blend; if High is out of
+        # reach too, the answer is known without the std
+        if (completeness < 50 or total_score < 60) and max(score_values) - min(score_values) < completeness:
             return "Medium"
-        return "Low"
+        score_values = np.array(score_values, dtype=np.float64)
+        return str(_confidence_levels(np.array([total_score]), completeness, score_values[None, :])[0])
     
-    def _build_reasoning(self, scores, tech, fund, val, risk, sent, mom, market=None):
+    def _build_reasoning(self, scores, details):
         positives = []
         risks = []
-        
-        # Technical
-        if scores["technical"] >= 60:
-            positives.append(f"Technical outlook positive: {tech['explanation']}")
-        elif scores["technical"] <= 40:
-            risks.append(f"Technical weakness: {tech['explanation']}")
-        
-        # Fundamental
-        if scores["fundamental"] >= 60:
-            positives.append(f"Strong fundamentals: {fund['explanation']}")
-        elif scores["fundamental"] <= 40:
-            risks.append(f"Fundamental concerns: {fund['explanation']}")
-        
-        # Valuation
-        if scores["valuation"] >= 60:
-            positives.append(f"Attractive valuation: {val['explanation']}")
-        elif scores["valuation"] <= 40:
-            risks.append(f"Expensive valuation: {val['explanation']}")
-        
-        # Risk
-        if scores["risk"] >= 60:
-            positives.append(f"Favorable risk profile: {risk['explanation']}")
-        elif scores["risk"] <= 40:
-            risks.append(f"Elevated risk: {risk['explanation']}")
-        
-        # Sentiment
-        if scores["sentiment"] >= 60:
-            positives.append(f"Positive sentiment: {sent['explanation']}")
-        elif scores["sentiment"] <= 40:
-            risks.append(f"Negative sentiment: {sent['explanation']}")
-        
-        # Momentum
-        if scores["momentum"] >= 60:
-            positives.append(f"Strong momentum: {mom['explanation']}")
-        elif scores["momentum"] <= 40:
-            risks.append(f"Weak momentum: {mom['explanation']}")
-        
-        # Market conditions
-        if scores.get("market", 50) >= 60:
-            positives.append("Favorable market/sector conditions supporting the stock")
-        elif scores.get("market", 50) <= 40:
-            risks.append("Challenging market/sector headwinds")
-        
+        for key, positive_template, risk_template in _FACTOR_MESSAGES:
+            factor_score = scores[key]
+            if factor_score >= 60:
+                positives.append(positive_template.format(details[key]["explanation"]))
+            elif factor_score <= 40:
+                risks.append(risk_template.format(details[key]["explanation"]))
         return positives[:5], risks[:5]
     
-    def _build_triggers(self, scores, val, tech, sent):
-        triggers = []
-        
-        if scores["valuation"] < 50:
-            triggers.append("Valuation becomes more attractive (P/E contracts or earnings grow faster than price)")
-        if scores["technical"] < 50:
-            triggers.append("Technical trend turns bullish with price breaking above key moving averages")
-        if scores["sentiment"] < 50:
-            triggers.append("News sentiment shifts positive with sustained bullish coverage")
-        if scores["risk"] < 50:
-            triggers.append("Volatility decreases and risk metrics normalize")
-        if scores["fundamental"] < 50:
-            triggers.append("Earnings or revenue growth accelerates, margins expand")
-        if scores["momentum"] < 50:
-            triggers.append("Price momentum turns positive with higher highs and higher lows")
-        if scores.get("market", 50) < 50:
-            triggers.append("Market/sector conditions improve with broader rally")
-        
+    def _build_triggers(self, scores):
+        triggers = [message for key, message in _TRIGGER_MESSAGES if scores[key] < 50]
         return triggers[:4]
     
-    def _calculate_timing_signal(self, analysis):
+    def _calculate_timing_signal(self, analysis, rolling_1m, rolling_3m):
         """
         Calculate timing score for entry point quality.
         
@@ -681,27 +1095,23 @@ class ScoringService:
         - Recent momentum
         - Volatility regime
         
+        rolling_1m / rolling_3m are the analysis' rolling returns, already
+        read by score().
+        
         Returns score 0-100 where higher = better entry point.
         """
         timing_components = []
+        tech = analysis.technicals
+        price = analysis.price
         
         # RSI positioning (0-100, oversold is better for entry)
-        rsi = analysis.technicals.rsi_14
+        rsi = tech.rsi_14
         if rsi is not None:
-            if rsi < 30:
-                timing_components.append(90)  # Oversold - excellent entry
-            elif rsi < 40:
-                timing_components.append(75)  # Near oversold - good entry
-            elif rsi > 70:
-                timing_components.append(20)  # Overbought - poor entry
-            elif rsi > 60:
-                timing_components.append(35)  # Near overbought - suboptimal
-            else:
-                timing_components.append(55)  # Neutral
+            timing_components.append(_bucket_score(_RSI_TIMING_EDGES, _RSI_TIMING_SCORES, rsi, 55))
         
         # MACD momentum (bullish crossover = good timing)
-        macd = analysis.technicals.macd
-        macd_signal = analysis.technicals.macd_signal
+        macd = tech.macd
+        macd_signal = tech.macd_signal
         if macd is not None and macd_signal is not None:
             macd_diff = macd - macd_signal
             # Positive and rising MACD is good
@@ -711,26 +1121,17 @@ class ScoringService:
                 timing_components.append(35)  # Bearish momentum
         
         # Price vs moving averages (below = potential value)
-        sma_50 = analysis.technicals.ma_50
-        sma_200 = analysis.technicals.ma_200
-        current_price = analysis.price.current if hasattr(analysis.price, 'current') else None
+        sma_50 = tech.ma_50
+        current_price = price.current
         
         if sma_50 and current_price:
             price_to_sma50 = (current_price / sma_50 - 1) * 100  # % from 50 SMA
-            # Below 50 SMA but not too far = good entry
-            if -10 < price_to_sma50 < -2:
-                timing_components.append(75)  # Good pullback entry
-            elif price_to_sma50 > 10:
-                timing_components.append(30)  # Extended above - risky entry
-            elif price_to_sma50 < -15:
-                timing_components.append(40)  # Too far below - could be in downtrend
-            else:
-                timing_components.append(55)  # Near average
+            # Below 50 SMA but not too far = good entry; far below may be a downtrend
+            timing_components.append(
+                _bucket_score(_SMA50_TIMING_EDGES, _SMA50_TIMING_SCORES, price_to_sma50, 55)
+            )
         
         # Recent momentum (short-term pullback in uptrend = good entry)
-        rolling_1m = analysis.price.rolling_returns.get("1m")
-        rolling_3m = analysis.price.rolling_returns.get("3m")
-        
         if rolling_1m is not None and rolling_3m is not None:
             # Positive 3m but slight 1m pullback = good entry in uptrend
             if rolling_3m > 0.05 and -0.05 < rolling_1m < 0.02:
@@ -745,11 +1146,6 @@ class ScoringService:
         # Volatility regime (lower volatility = calmer entry)
         volatility = analysis.risk.get("volatility")
         if volatility is not None:
-            if volatility < 0.20:
-                timing_components.append(70)  # Low vol - stable entry
-            elif volatility > 0.40:
-                timing_components.append(35)  # High vol - uncertain
-            else:
-                timing_components.append(50)
+            timing_components.append(_bucket_score(_VOL_TIMING_EDGES, _VOL_TIMING_SCORES, volatility, 50))
         
         return _avg(timing_components) if timing_components else 50
\ No newline at end of file
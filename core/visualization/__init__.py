@@ -1,14 +1,18 @@
-from core.visualization.plotly_charts import (
-    fundamentals_trend,
-    peer_comparison,
-    price_candlestick,
-    relative_performance,
-    recommendation_waterfall,
-    rolling_volatility,
-    sentiment_chart,
-    volume_chart,
-)
-from core.visualization.chart_explanations import build_chart_insights
+import importlib
+
+# Chart helpers are resolved on first access (PEP 562) so importing the
+# package doesn't pull in plotly for code paths that never render charts
+_LAZY = {
+    "fundamentals_trend": "core.visualization.plotly_charts",
+    "peer_comparison": "core.visualization.plotly_charts",
+    "price_candlestick": "core.visualization.plotly_charts",
+    "relative_performance": "core.visualization.plotly_charts",
+    "recommendation_waterfall": "core.visualization.plotly_charts",
+    "rolling_volatility": "core.visualization.plotly_charts",
+    "sentiment_chart": "core.visualization.plotly_charts",
+    "volume_chart": "core.visualization.plotly_charts",
+    "build_chart_insights": "core.visualization.chart_explanations",
+}
 
 __all__ = [
     "fundamentals_trend",
@@ -21,3 +25,15 @@ __all__ = [
     "volume_chart",
     "build_chart_insights",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,141 @@
+"""
+Numeric kernels for the price charts.
+
+numba is optional: with it the loops below are compiled to machine code
+(cached on disk after the first call where numba allows it); without it
+the NumPy implementations are used. All kernels take float64 arrays. No
+fastmath, so compiled and NumPy results agree to rounding.
+"""
+
+import math
+from functools import lru_cache, partial
+
+import numpy as np
+
+from core._njit import HAS_NUMBA, njit
+
+
+def _rolling_mean_numpy(closes, window):
+    # Window sums as differences of one cumsum. Gaps are zero-filled and
+    # counted in a second cumsum so a NaN close only blanks its own windows
+    gaps = ~np.isfinite(closes)
+    cumulative = np.zeros(len(closes) + 1)
+    np.cumsum(np.where(gaps, 0.0, closes), out=cumulative[1:])
+    missing = np.zeros(len(closes) + 1, dtype=np.int64)
+    np.cumsum(gaps, out=missing[1:])
+    means = (cumulative[window:] - cumulative[:-window]) / window
+    means[missing[window:] > missing[:-window]] = np.nan
+    return means
+
+
+@lru_cache(maxsize=8)
+def rolling_mean_kernel(window):
+    """Moving-average kernel specialized to one window (20/50/200 in practice)."""
+    if not HAS_NUMBA:
+        return partial(_rolling_mean_numpy, window=window)
+
+    # window is a free variable, so numba freezes it as a compile-time
+    # constant; closures can't use the on-disk cache, hence no cache=True
+    @njit
+    def kernel(closes):
+        count = closes.shape[0] - window + 1
+        out = np.empty(max(count, 0))
+        total = 0.0
+        gaps = 0
+        for idx in range(closes.shape[0]):
+            if math.isfinite(closes[idx]):
+                total += closes[idx]
+            else:
+                gaps += 1
+            if idx >= window:
+                if math.isfinite(closes[idx - window]):
+                    total -= closes[idx - window]
+                else:
+                    gaps -= 1
+            if idx >= window - 1:
+                out[idx - window + 1] = total / window if gaps == 0 else np.nan
+        return out
+
+    return kernel
+
+
+def _rolling_vol_numpy(closes, window):
+    # Window mean and variance from cumsums of returns and squared returns.
+    # Non-finite returns (a gap or a zero close) are zero-filled and counted
+    # separately so they only blank the windows that contain them
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = closes[1:] / closes[:-1] - 1
+    gaps = ~np.isfinite(returns)
+    returns = np.where(gaps, 0.0, returns)
+    sums = np.zeros(len(returns) + 1)
+    squares = np.zeros(len(returns) + 1)
+    missing = np.zeros(len(returns) + 1, dtype=np.int64)
+    np.cumsum(returns, out=sums[1:])
+    np.cumsum(returns * returns, out=squares[1:])
+    np.cumsum(gaps, out=missing[1:])
+    mean = (sums[window:] - sums[:-window]) / window
+    var = (squares[window:] - squares[:-window]) / window - mean * mean
+    vols = np.sqrt(np.maximum(var, 0)) * np.sqrt(252.0)
+    vols[missing[window:] > missing[:-window]] = np.nan
+    return vols
+
+
+def _rolling_vol_loop(closes, window):
+    """Annualized volatility of each trailing window of daily returns."""
+    count = closes.shape[0] - window
+    out = np.empty(max(count, 0))
+    returns = np.empty(max(closes.shape[0] - 1, 0))
+    for idx in range(returns.shape[0]):
+        returns[idx] = closes[idx + 1] / closes[idx] - 1
+    scale = np.sqrt(252.0)
+    for end in range(window, returns.shape[0] + 1):
+        # Two-pass mean/variance per window stays exact for small returns
+        mean = 0.0
+        for idx in range(end - window, end):
+            mean += returns[idx]
+        mean /= window
+        var = 0.0
+        for idx in range(end - window, end):
+            var += (returns[idx] - mean) ** 2
+        out[end - window] = np.sqrt(var / window) * scale
+    return out
+
+
+def _beta_numpy(stock_returns, bench_returns):
+    variance = bench_returns.var()
+    if variance == 0:
+        return np.nan
+    return np.cov(stock_returns, bench_returns, bias=True)[0, 1] / variance
+
+
+def _beta_loop(stock_returns, bench_returns):
+    """Population covariance over benchmark variance; NaN for a flat benchmark."""
+    n = stock_returns.shape[0]
+    mean_stock = 0.0
+    mean_bench = 0.0
+    for idx in range(n):
+        mean_stock += stock_returns[idx]
+        mean_bench += bench_returns[idx]
+    mean_stock /= n
+    mean_bench /= n
+    covariance = 0.0
+    variance = 0.0
+    for idx in range(n):
+        bench_dev = bench_returns[idx] - mean_bench
+        covariance += (stock_returns[idx] - mean_stock) * bench_dev
+        variance += bench_dev * bench_dev
+    if variance == 0:
+        return np.nan
+    return covariance / variance
+
+
+if HAS_NUMBA:
+    # njit without a signature compiles (or loads the on-disk cache) on the
+    # first call, keeping the cost off import like plotly's lazy load
+    # error_model="numpy" so a zero close yields inf like NumPy instead of
+    # raising ZeroDivisionError inside the compiled loop
+    rolling_vol = njit(cache=True, error_model="numpy")(_rolling_vol_loop)
+    beta = njit(cache=True)(_beta_loop)
+else:
+    rolling_vol = _rolling_vol_numpy
+    beta = _beta_numpy
@@ -1,10 +1,12 @@
+import numpy as np
+
+_SIGNAL_CLASS = {"Positive": "signal-positive", "Negative": "signal-negative"}
+_IMPACT_WORD = {"Positive": "strengthens", "Negative": "weakens"}
+
+
 def _signal_class(signal):
     """Return CSS class for signal coloring."""
-    if signal == "Positive":
-        return "signal-positive"
-    if signal == "Negative":
-        return "signal-negative"
-    return "signal-neutral"
+    return _SIGNAL_CLASS.get(signal, "signal-neutral")
 
 
 def _signal_label(value, positive_threshold=0.05, negative_threshold=-0.05):
@@ -18,11 +20,19 @@ def _signal_label(value, positive_threshold=0.05, negative_threshold=-0.05):
 
 
 def _impact_word(signal):
-    if signal == "Positive":
-        return "strengthens"
-    if signal == "Negative":
-        return "weakens"
-    return "has no clear effect on"
+    return _IMPACT_WORD.get(signal, "has no clear effect on")
+
+
+def _insight(summary, signal, impact=None):
+    """One chart insight; impact defaults to the signal's effect on the case."""
+    if impact is None:
+        impact = f"{signal} — {_impact_word(signal)} the investment case."
+    return {
+        "summary": summary,
+        "signal": signal,
+        "signal_class": _signal_class(signal),
+        "impact": impact,
+    }
 
 
 def build_chart_insights(ticker, snapshot, analysis, benchmark_prices):
@@ -35,12 +45,7 @@ def build_chart_insights(ticker, snapshot, analysis, benchmark_prices):
         price_change = (price_history[-1].close / price_history[0].close) - 1
     signal = _signal_label(price_change)
     pct = f"{round(price_change * 100, 1)}%" if price_change is not None else "N/A"
-    insights["price"] = {
-        "summary": f"Price action with moving averages. Change: {pct}.",
-        "signal": signal,
-        "signal_class": _signal_class(signal),
-        "impact": f"{signal} — {_impact_word(signal)} the investment case.",
-    }
+    insights["price"] = _insight(f"Price action with moving averages. Change: {pct}.", signal)
 
     # Relative performance
     relative_change = None
@@ -51,31 +56,33 @@ def build_chart_insights(ticker, snapshot, analysis, benchmark_prices):
         )
     signal = _signal_label(relative_change)
     rel_pct = f"{round(relative_change * 100, 1)}%" if relative_change is not None else "N/A"
-    insights["relative"] = {
-        "summary": f"Performance vs benchmark. Relative: {rel_pct}.",
-        "signal": signal,
-        "signal_class": _signal_class(signal),
-        "impact": f"{signal} — {_impact_word(signal)} the investment case.",
-    }
+    insights["relative"] = _insight(f"Performance vs benchmark. Relative: {rel_pct}.", signal)
 
     # Volume chart
     volume_signal = "Neutral"
     vol_note = "Average activity"
     if price_history:
-        volumes = [p.volume for p in price_history if p.volume]
-        if volumes:
-            avg = sum(volumes) / len(volumes)
-            last = volumes[-1]
+        # One pass over non-zero volumes: count, total and the latest value
+        count = 0
+        total = 0.0
+        last = None
+        for point in price_history:
+            volume = point.volume
+            if volume:
+                count += 1
+                total += volume
+                last = volume
+        if count:
+            avg = total / count
             if last >= avg * 1.5:
                 vol_note = "Elevated volume"
             elif last <= avg * 0.7:
                 vol_note = "Low volume"
-    insights["volume"] = {
-        "summary": f"Daily trading volume. {vol_note}.",
-        "signal": volume_signal,
-        "signal_class": _signal_class(volume_signal),
-        "impact": f"{volume_signal} — volume alone is not directional.",
-    }
+    insights["volume"] = _insight(
+        f"Daily trading volume. {vol_note}.",
+        volume_signal,
+        f"{volume_signal} — volume alone is not directional.",
+    )
 
     # Rolling volatility
     vol_signal = "Neutral"
@@ -87,31 +94,23 @@ def build_chart_insights(ticker, snapshot, analysis, benchmark_prices):
             vol_signal = "Negative"
         elif vol_value <= 0.2:
             vol_signal = "Positive"
-    insights["volatility"] = {
-        "summary": f"Rolling 20-day volatility. Current: {vol_pct}.",
-        "signal": vol_signal,
-        "signal_class": _signal_class(vol_signal),
-        "impact": f"{vol_signal} — {_impact_word(vol_signal)} the investment case.",
-    }
+    insights["volatility"] = _insight(f"Rolling 20-day volatility. Current: {vol_pct}.", vol_signal)
 
     # Fundamentals trend
     revenue_series = analysis.fundamentals.time_series.get("revenue", {})
     fundamental_signal = "Neutral"
     fund_note = "Mixed data"
     if revenue_series and len(revenue_series) >= 2:
-        sorted_keys = sorted(revenue_series.keys())
-        first = revenue_series[sorted_keys[0]]
-        last = revenue_series[sorted_keys[-1]]
+        # Only the earliest and latest periods matter, no need to sort them all
+        first = revenue_series[min(revenue_series)]
+        last = revenue_series[max(revenue_series)]
         if first:
             change = (last / first) - 1
             fund_note = f"Revenue change: {round(change * 100, 1)}%"
             fundamental_signal = _signal_label(change)
-    insights["fundamentals"] = {
-        "summary": f"Revenue, income, and cash flow trends. {fund_note}.",
-        "signal": fundamental_signal,
-        "signal_class": _signal_class(fundamental_signal),
-        "impact": f"{fundamental_signal} — {_impact_word(fundamental_signal)} the investment case.",
-    }
+    insights["fundamentals"] = _insight(
+        f"Revenue, income, and cash flow trends. {fund_note}.", fundamental_signal
+    )
 
     # Peers chart
     peer_signal = "Neutral"
@@ -120,7 +119,9 @@ def build_chart_insights(ticker, snapshot, analysis, benchmark_prices):
         peer_values = [m.get("pe_ratio") for m in analysis.peers.peer_metrics if m.get("pe_ratio")]
         ticker_pe = analysis.fundamentals.valuation.get("pe_ratio")
         if peer_values and ticker_pe:
-            median = sorted(peer_values)[len(peer_values) // 2]
+            # Upper median by quickselect, as sorted(values)[n // 2] without the sort
+            middle = len(peer_values) // 2
+            median = float(np.partition(np.array(peer_values, dtype=np.float64), middle)[middle])
             if ticker_pe < median:
                 peer_signal = "Positive"
                 peer_note = "Below peer median P/E"
@@ -129,22 +130,16 @@ def build_chart_insights(ticker, snapshot, analysis, benchmark_prices):
                 peer_note = "Above peer median P/E"
             else:
                 peer_note = "Near peer median P/E"
-    insights["peers"] = {
-        "summary": f"P/E vs peers. {peer_note}.",
-        "signal": peer_signal,
-        "signal_class": _signal_class(peer_signal),
-        "impact": f"{peer_signal} — {_impact_word(peer_signal)} the investment case.",
-    }
+    insights["peers"] = _insight(f"P/E vs peers. {peer_note}.", peer_signal)
 
     # Sentiment chart
     sentiment_signal = "Neutral"
-    news_count = len(snapshot.news) if snapshot.news else 0
-    insights["sentiment"] = {
-        "summary": f"Recent news volume. {news_count} items.",
-        "signal": sentiment_signal,
-        "signal_class": _signal_class(sentiment_signal),
-        "impact": f"{sentiment_signal} — volume alone is not directional.",
-    }
+    news_count = len(snapshot.news or ())
+    insights["sentiment"] = _insight(
+        f"Recent news volume. {news_count} items.",
+        sentiment_signal,
+        f"{sentiment_signal} — volume alone is not directional.",
+    )
 
     # Recommendation waterfall
     rec_signal = "Neutral"
@@ -157,11 +152,10 @@ def build_chart_insights(ticker, snapshot, analysis, benchmark_prices):
     if analysis.recommendation.contributions:
         top_driver = max(analysis.recommendation.contributions, key=analysis.recommendation.contributions.get)
     driver_text = top_driver.title() if top_driver else "Mixed"
-    insights["recommendation"] = {
-        "summary": f"Score breakdown by factor. Top driver: {driver_text}.",
-        "signal": rec_signal,
-        "signal_class": _signal_class(rec_signal),
-        "impact": f"{rec_signal} — total score: {round(score, 1)}.",
-    }
+    insights["recommendation"] = _insight(
+        f"Score breakdown by factor. Top driver: {driver_text}.",
+        rec_signal,
+        f"{rec_signal} — total score: {round(score, 1)}.",
+    )
 
     return insights
@@ -1,129 +1,313 @@
-try:
-    import plotly.graph_objects as go
-    import plotly.io as pio
-    HAS_PLOTLY = True
-except ImportError:
-    go = None
-    pio = None
-    HAS_PLOTLY = False
+import copy
+import threading
+import uuid
+from functools import lru_cache
+
+import numpy as np
+
+from core.models import PriceFrame
+from core.visualization._kernels import beta, rolling_mean_kernel, rolling_vol
+
+# Encoded figures for the price-history charts, keyed by chart and by a
+# fingerprint of the history rather than the history itself, so an entry
+# holds one figure JSON and no PricePoints
+CHART_CACHE_SIZE = 32
+
+CHART_HEIGHT = 380
+
+# Registered plotly template the analysis charts opt into by name
+CHART_TEMPLATE = "stock_analyzer"
+
+VOLATILITY_WINDOW = 20
+
+# Line and bar traces longer than this are reduced with LTTB before they are
+# encoded; price bars are thinned by aggregation instead (below)
+DOWNSAMPLE_THRESHOLD = 2000
+DOWNSAMPLE_POINTS = 1000
+
+# Line traces with more points than this render through WebGL
+WEBGL_THRESHOLD = 1000
+
+# Price histories up to OHLC_THRESHOLD bars keep daily candlesticks; denser
+# ones draw as OHLC ticks (a few lines per bar instead of a filled box), and
+# past AGGREGATE_THRESHOLD as candles of AGGREGATE_BARS consecutive bars
+OHLC_THRESHOLD = 500
+AGGREGATE_THRESHOLD = 1000
+AGGREGATE_BARS = 5
+
+# Charts are embedded as bare figure JSON; plotly.js itself is loaded once by
+# the page (templates/index.html, from plotlyjs_url()), not by every fragment
+_CHART_HTML = (
+    '<div id="{id}" class="plotly-graph-div" style="height:{height}px; width:100%;"></div>'
+    '<script>Plotly.newPlot("{id}", {figure}, {{"responsive": true}});</script>'
+)
+
+# plotly is imported on the first chart render rather than at module import;
+# go/pio stay None until _ensure_plotly() succeeds
+go = None
+pio = None
+_plotly_loaded = None
+
+
+def _ensure_plotly():
+    """Import plotly once and install the shared template; False if missing."""
+    global go, pio, _plotly_loaded
+    if _plotly_loaded is None:
+        try:
+            import plotly.graph_objects as go
+            import plotly.io as pio
+        except ImportError:
+            _plotly_loaded = False
+        else:
+            _install_template()
+            _plotly_loaded = True
+    return _plotly_loaded
 
 
-def _to_html(fig):
-    if not HAS_PLOTLY:
-        return _placeholder()
-    fig.update_layout(
-        template="plotly_white",
-        height=380,
+@lru_cache(maxsize=1)
+def plotlyjs_url():
+    """
+    CDN URL of the plotly.js release bundled with the installed plotly.py.
+    
+    Figure JSON from _to_html targets that release's schema, so the page
+    loads exactly it. plotly.offline is light next to graph_objects; the
+    chart modules themselves stay unimported.
+    """
+    try:
+        from plotly.offline import get_plotlyjs_version
+    except ImportError:
+        return None
+    return f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+
+
+def _install_template():
+    # Shared styling for the analysis charts, registered once under
+    # CHART_TEMPLATE. It is not made the process default: the gauge, options
+    # and sector charts and the report PNGs keep plotly's own defaults
+    template = go.layout.Template(pio.templates["plotly_white"])
+    template.layout.update(
+        height=CHART_HEIGHT,
         margin=dict(l=50, r=20, t=50, b=40),
         font=dict(family="-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Arial, sans-serif", size=12),
         plot_bgcolor="#fff",
         paper_bgcolor="#fff",
+        # No chart shows spikelines, so skip plotly.js's spike hit-test
+        spikedistance=0,
     )
-    return pio.to_html(fig, full_html=False, include_plotlyjs="cdn")
+    pio.templates[CHART_TEMPLATE] = template
+
+
+def _to_html(fig):
+    if not _ensure_plotly():
+        return _placeholder()
+    return _html(_encode(fig))
 
 
-def price_candlestick(price_history, technicals):
-    if not HAS_PLOTLY:
+def _encode(fig):
+    """(height, figure JSON) for a figure, or None if it has no traces."""
+    if not fig.data:
+        return None
+    # to_json escapes "</" so chart text can't close the script tag
+    return fig.layout.height or CHART_HEIGHT, pio.to_json(fig, validate=False)
+
+
+def _html(encoded):
+    # The div id is minted per call, never cached, so a page showing the
+    # same chart twice still gets two distinct plot targets
+    if encoded is None:
+        return ""
+    height, figure = encoded
+    return _CHART_HTML.format(id=uuid.uuid4().hex, height=height, figure=figure)
+
+
+_MISSING = object()
+_chart_cache = {}
+# Flask serves requests on threads; lookups and FIFO eviction run under this lock
+_chart_cache_lock = threading.Lock()
+
+
+def _cached_chart(key, build, *args):
+    """HTML for build(*args), encoding the figure only on a cache miss."""
+    with _chart_cache_lock:
+        encoded = _chart_cache.get(key, _MISSING)
+    if encoded is _MISSING:
+        encoded = _encode(build(*args))
+        with _chart_cache_lock:
+            while len(_chart_cache) >= CHART_CACHE_SIZE:
+                # Oldest entry first; dicts keep insertion order
+                del _chart_cache[next(iter(_chart_cache))]
+            _chart_cache[key] = encoded
+    return _html(encoded)
+
+
+def _fingerprint(price_history, ticker=None):
+    """Cache key for a history: its ticker, length, date range and a hash of every close."""
+    closes = _series(price_history)[1]
+    return ticker, len(price_history), price_history[0].date, price_history[-1].date, hash(closes.tobytes())
+
+
+def clear_chart_cache():
+    """Drop every cached chart figure (tests, or after restyling charts)."""
+    with _chart_cache_lock:
+        _chart_cache.clear()
+
+
+def price_candlestick(price_history, technicals, ticker=None):
+    if not _ensure_plotly():
         return _placeholder()
     if not price_history:
         return ""
-    dates = [point.date for point in price_history]
+    # An average is drawn only if the history fills its window; a shorter
+    # one would ship an all-None trace
+    count = len(price_history)
+    averages = (
+        technicals.ma_20 is not None and count >= 20,
+        technicals.ma_50 is not None and count >= 50,
+        technicals.ma_200 is not None and count >= 200,
+    )
+    return _cached_chart(
+        ("price", _fingerprint(price_history, ticker), averages),
+        _price_candlestick,
+        price_history,
+        *averages,
+    )
+
+
+def _price_candlestick(price_history, ma_20, ma_50, ma_200):
+    # Dates and closes are shared with the other price charts; one pass
+    # fills the remaining candle columns, and the close array also feeds
+    # all three moving averages
+    dates, closes = _series(price_history)
+    n = len(price_history)
+    opens = np.empty(n)
+    highs = np.empty(n)
+    lows = np.empty(n)
+    for i, p in enumerate(price_history):
+        opens[i] = p.open
+        highs[i] = p.high
+        lows[i] = p.low
+    bar_dates, bar_closes = dates, closes
+    if n <= OHLC_THRESHOLD:
+        trace, title = go.Candlestick, "Price (Candlestick)"
+    elif n <= AGGREGATE_THRESHOLD:
+        trace, title = go.Ohlc, "Price (OHLC)"
+    else:
+        trace, title = go.Candlestick, f"Price (Candlestick, {AGGREGATE_BARS}-day bars)"
+        starts, opens, highs, lows, bar_closes = _aggregate_ohlc(opens, highs, lows, closes, AGGREGATE_BARS)
+        bar_dates = [dates[i] for i in starts]
     fig = go.Figure(
         data=[
-            go.Candlestick(
-                x=dates,
-                open=[p.open for p in price_history],
-                high=[p.high for p in price_history],
-                low=[p.low for p in price_history],
-                close=[p.close for p in price_history],
+            trace(
+                x=bar_dates,
+                open=opens,
+                high=highs,
+                low=lows,
+                close=bar_closes,
                 name="Price",
             )
         ]
     )
-    if technicals.ma_20 is not None:
-        fig.add_trace(go.Scatter(x=dates, y=_rolling(price_history, 20), mode="lines", name="MA 20"))
-    if technicals.ma_50 is not None:
-        fig.add_trace(go.Scatter(x=dates, y=_rolling(price_history, 50), mode="lines", name="MA 50"))
-    if technicals.ma_200 is not None:
-        fig.add_trace(go.Scatter(x=dates, y=_rolling(price_history, 200), mode="lines", name="MA 200"))
-    fig.update_layout(title="Price (Candlestick)")
-    return _to_html(fig)
+    # Averages always come from the daily closes
+    for window, enabled in ((20, ma_20), (50, ma_50), (200, ma_200)):
+        if enabled:
+            x, y = _thin(dates, _rolling(closes, window))
+            fig.add_trace(go.Scatter(x=x, y=y, mode="lines", name=f"MA {window}"))
+    fig.update_layout(template=CHART_TEMPLATE, title=title)
+    return fig
 
 
-def volume_chart(price_history):
-    if not HAS_PLOTLY:
+def volume_chart(price_history, ticker=None):
+    if not _ensure_plotly():
         return _placeholder()
-    if not price_history:
+    # A single bar isn't a chart; skip the figure build and encode
+    if not price_history or len(price_history) < 2:
         return ""
-    fig = go.Figure(
-        data=[
-            go.Bar(
-                x=[p.date for p in price_history],
-                y=[p.volume for p in price_history],
-                name="Volume",
-            )
-        ]
-    )
-    fig.update_layout(title="Volume")
-    return _to_html(fig)
+    return _cached_chart(("volume", _fingerprint(price_history, ticker)), _volume_chart, price_history)
+
 
+def _volume_chart(price_history):
+    x, y = _thin(_series(price_history)[0], [p.volume for p in price_history])
+    fig = go.Figure(data=[go.Bar(x=x, y=y, name="Volume")])
+    fig.update_layout(template=CHART_TEMPLATE, title="Volume")
+    return fig
 
-def relative_performance(price_history, benchmark_history):
-    if not HAS_PLOTLY:
+
+def relative_performance(price_history, benchmark_history, ticker=None):
+    if not _ensure_plotly():
         return _placeholder()
     if not price_history or not benchmark_history:
         return ""
-    base = price_history[0].close
-    benchmark_base = benchmark_history[0].close
-    fig = go.Figure()
-    fig.add_trace(
-        go.Scatter(
-            x=[p.date for p in price_history],
-            y=[(p.close / base) - 1 for p in price_history],
-            name="Ticker",
-        )
-    )
-    fig.add_trace(
-        go.Scatter(
-            x=[p.date for p in benchmark_history],
-            y=[(p.close / benchmark_base) - 1 for p in benchmark_history],
-            name="Benchmark",
-        )
+    return _cached_chart(
+        ("relative", _fingerprint(price_history, ticker), _fingerprint(benchmark_history)),
+        _relative_performance,
+        price_history,
+        benchmark_history,
     )
-    fig.update_layout(title="Relative Performance")
-    return _to_html(fig)
 
 
-def rolling_volatility(price_history):
-    if not HAS_PLOTLY:
+def _relative_performance(price_history, benchmark_history):
+    dates, closes = _series(price_history)
+    benchmark_dates, benchmark_closes = _columns(benchmark_history)
+    fig = go.Figure()
+    x, y = _thin(dates, closes / closes[0] - 1.0)
+    fig.add_trace(_scatter(x, y, name="Ticker"))
+    x, y = _thin(benchmark_dates, benchmark_closes / benchmark_closes[0] - 1.0)
+    fig.add_trace(_scatter(x, y, name="Benchmark"))
+    fig.update_layout(template=CHART_TEMPLATE, title="Relative Performance", hovermode="x")
+    return fig
+
+
+def rolling_volatility(price_history, ticker=None):
+    if not _ensure_plotly():
         return _placeholder()
-    if not price_history:
+    # 20 returns need 21 closes; with fewer every point would be None
+    if not price_history or len(price_history) <= VOLATILITY_WINDOW:
         return ""
-    vols = _rolling_vol(price_history, 20)
-    fig = go.Figure(
-        data=[go.Scatter(x=[p.date for p in price_history], y=vols, name="Volatility")]
-    )
-    fig.update_layout(title="Rolling Volatility (20d)")
-    return _to_html(fig)
+    return _cached_chart(("volatility", _fingerprint(price_history, ticker)), _rolling_volatility, price_history)
+
+
+def _rolling_volatility(price_history):
+    dates, closes = _series(price_history)
+    x, y = _thin(dates, _rolling_vol(closes, VOLATILITY_WINDOW))
+    fig = go.Figure(data=[_scatter(x, y, name="Volatility")])
+    fig.update_layout(template=CHART_TEMPLATE, title="Rolling Volatility (20d)", hovermode="x")
+    return fig
 
 
 def fundamentals_trend(time_series, title):
-    if not HAS_PLOTLY:
+    if not _ensure_plotly():
         return _placeholder()
-    if not time_series:
+    # Nothing to draw a trend from unless some series has two periods
+    if not time_series or not any(len(series or ()) >= 2 for series in time_series.values()):
         return ""
     fig = go.Figure()
     for series_name, series in time_series.items():
         if not series:
             continue
-        dates = list(sorted(series.keys()))
-        fig.add_trace(go.Scatter(x=dates, y=[series[d] for d in dates], name=series_name))
-    fig.update_layout(title=title)
+        # Series arrive oldest- or newest-first; timsort handles either run in
+        # O(n). Dates are unique keys, so the values are never compared
+        dates, values = zip(*sorted(series.items()))
+        fig.add_trace(go.Scatter(x=dates, y=values, name=series_name))
+    fig.update_layout(template=CHART_TEMPLATE, title=title)
     return _to_html(fig)
 
 
+_PEER_LAYOUT = dict(
+    template=CHART_TEMPLATE,
+    title="Peer P/E Comparison",
+    xaxis_title="Ticker",
+    yaxis_title="P/E Ratio",
+    showlegend=False,
+)
+
+
+@lru_cache(maxsize=1)
+def _peer_bar():
+    return go.Bar(name="P/E Ratio", texttemplate="%{y:.1f}", textposition="outside")
+
+
 def peer_comparison(peer_metrics, ticker=None):
-    if not HAS_PLOTLY:
+    if not _ensure_plotly():
         return _placeholder()
     if not peer_metrics:
         return "<p class='no-data'>No peer data available.</p>"
@@ -136,35 +320,31 @@ def peer_comparison(peer_metrics, ticker=None):
     # Sort by P/E for better visualization
     valid_peers = sorted(valid_peers, key=lambda x: x.get("pe_ratio") or 0)
     
-    tickers = [item["ticker"] for item in valid_peers]
-    pe_values = [item.get("pe_ratio") for item in valid_peers]
-    
-    # Color the current ticker differently
-    colors = ["#2563eb" if t == ticker else "#64748b" for t in tickers]
-    
-    fig = go.Figure()
-    fig.add_trace(
-        go.Bar(
-            x=tickers,
-            y=pe_values,
-            name="P/E Ratio",
-            marker_color=colors,
-            text=[f"{v:.1f}" if v else "" for v in pe_values],
-            textposition="outside",
-        )
-    )
-    fig.update_layout(
-        title="Peer P/E Comparison",
-        xaxis_title="Ticker",
-        yaxis_title="P/E Ratio",
-        showlegend=False,
-    )
+    # One pass fills every bar column; the current ticker is colored differently
+    n = len(valid_peers)
+    tickers = [None] * n
+    pe_values = [None] * n
+    colors = [None] * n
+    for i, item in enumerate(valid_peers):
+        peer_ticker = item["ticker"]
+        pe = item["pe_ratio"]
+        tickers[i] = peer_ticker
+        pe_values[i] = pe
+        colors[i] = "#2563eb" if peer_ticker == ticker else "#64748b"
+    
+    # Fixed fields come from the prevalidated prototype; only data is set here
+    bar = copy.copy(_peer_bar())
+    bar.x = tickers
+    bar.y = pe_values
+    bar.marker = dict(color=colors)
+    fig = go.Figure(data=[bar], layout=_PEER_LAYOUT)
     return _to_html(fig)
 
 
+
 def sentiment_chart(sentiment_summary):
     """Create a sentiment distribution chart."""
-    if not HAS_PLOTLY:
+    if not _ensure_plotly():
         return _placeholder()
     if not sentiment_summary or not hasattr(sentiment_summary, 'positive_count'):
         return "<p class='no-data'>No sentiment data available.</p>"
@@ -187,6 +367,7 @@ def sentiment_chart(sentiment_summary):
         )
     )
     fig.update_layout(
+        template=CHART_TEMPLATE,
         title="News Sentiment Distribution",
         xaxis_title="Sentiment",
         yaxis_title="Number of Articles",
@@ -196,7 +377,7 @@ def sentiment_chart(sentiment_summary):
 
 
 def recommendation_waterfall(contributions, total_score):
-    if not HAS_PLOTLY:
+    if not _ensure_plotly():
         return _placeholder()
     if not contributions:
         return ""
@@ -218,7 +399,7 @@ def recommendation_waterfall(contributions, total_score):
             connector={"line": {"color": "rgb(63, 63, 63)"}},
         )
     )
-    fig.update_layout(title="Recommendation Score Breakdown")
+    fig.update_layout(template=CHART_TEMPLATE, title="Recommendation Score Breakdown")
     return _to_html(fig)
 
 
@@ -231,23 +412,31 @@ def indices_comparison(ticker_history, indices_data, ticker_symbol="Stock"):
         indices_data: Dict of {index_name: List of PricePoint}
         ticker_symbol: Stock ticker symbol for legend
     """
-    if not HAS_PLOTLY:
+    if not _ensure_plotly():
         return _placeholder()
     if not ticker_history:
         return "<p style='padding: 40px; text-align: center; color: #64748b;'>No price data available</p>"
-    
+    indices = [(name, history) for name, history in indices_data.items() if history]
+    key = (
+        "indices",
+        _fingerprint(ticker_history, ticker_symbol),
+        tuple(_fingerprint(history, name) for name, history in indices),
+    )
+    return _cached_chart(key, _indices_comparison, ticker_history, indices, ticker_symbol)
+
+
+def _indices_comparison(ticker_history, indices, ticker_symbol):
     fig = go.Figure()
     
     # Calculate normalized returns for stock
-    base = ticker_history[0].close
-    stock_returns = [(p.close / base - 1) * 100 for p in ticker_history]
-    dates = [p.date for p in ticker_history]
+    dates, closes = _columns(ticker_history)
+    dates, stock_returns = _thin(dates, (closes / closes[0] - 1) * 100)
     
     # Add stock trace
     fig.add_trace(
-        go.Scatter(
-            x=dates,
-            y=stock_returns,
+        _scatter(
+            dates,
+            stock_returns,
             name=ticker_symbol,
             line=dict(color="#2563eb", width=2.5),
         )
@@ -256,23 +445,22 @@ def indices_comparison(ticker_history, indices_data, ticker_symbol="Stock"):
     # Color palette for indices
     colors = {"S&P 500": "#10b981", "NASDAQ": "#8b5cf6", "DOW": "#f59e0b"}
     
-    # Add index traces
-    for index_name, index_history in indices_data.items():
-        if index_history and len(index_history) > 0:
-            index_base = index_history[0].close
-            index_returns = [(p.close / index_base - 1) * 100 for p in index_history]
-            index_dates = [p.date for p in index_history]
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=index_dates,
-                    y=index_returns,
-                    name=index_name,
-                    line=dict(color=colors.get(index_name, "#64748b"), width=1.5, dash="dot"),
-                )
+    # Add index traces (empty histories were dropped by the caller)
+    for index_name, index_history in indices:
+        index_dates, index_closes = _columns(index_history)
+        index_dates, index_returns = _thin(index_dates, (index_closes / index_closes[0] - 1) * 100)
+        
+        fig.add_trace(
+            _scatter(
+                index_dates,
+                index_returns,
+                name=index_name,
+                line=dict(color=colors.get(index_name, "#64748b"), width=1.5, dash="dot"),
             )
+        )
     
     fig.update_layout(
+        template=CHART_TEMPLATE,
         title=f"{ticker_symbol} vs Major Indices (% Change)",
         xaxis_title="Date",
         yaxis_title="Return (%)",
@@ -287,7 +475,7 @@ def indices_comparison(ticker_history, indices_data, ticker_symbol="Stock"):
         )
     )
     
-    return _to_html(fig)
+    return fig
 
 
 def sentiment_gauge(score, sentiment_label):
@@ -295,7 +483,7 @@ def sentiment_gauge(score, sentiment_label):
     Create a sentiment gauge visualization.
     Score ranges from -100 (bearish) to +100 (bullish).
     """
-    if not HAS_PLOTLY:
+    if not _ensure_plotly():
         return _placeholder()
     
     # Clamp score to valid range
@@ -334,14 +522,14 @@ def sentiment_gauge(score, sentiment_label):
         font=dict(family="-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, Arial, sans-serif"),
     )
     
-    return pio.to_html(fig, full_html=False, include_plotlyjs="cdn")
+    return _to_html(fig)
 
 
 def options_volume_chart(options_data):
     """
     Create a chart showing Call vs Put volume comparison.
     """
-    if not HAS_PLOTLY:
+    if not _ensure_plotly():
         return _placeholder()
     if not options_data or not options_data.get("available"):
         return "<p style='padding: 40px; text-align: center; color: #64748b;'>No options data available</p>"
@@ -359,7 +547,7 @@ def options_volume_chart(options_data):
         x=["Calls", "Puts"],
         y=[call_vol, put_vol],
         marker_color=["#22c55e", "#ef4444"],
-        text=[f"{call_vol:,}", f"{put_vol:,}"],
+        texttemplate="%{y:,}",
         textposition="outside",
     ))
     
@@ -378,14 +566,14 @@ def options_volume_chart(options_data):
         paper_bgcolor="#fff",
     )
     
-    return pio.to_html(fig, full_html=False, include_plotlyjs="cdn")
+    return _to_html(fig)
 
 
 def options_oi_chart(options_data):
     """
     Create a chart showing Call vs Put open interest comparison.
     """
-    if not HAS_PLOTLY:
+    if not _ensure_plotly():
         return _placeholder()
     if not options_data or not options_data.get("available"):
         return "<p style='padding: 40px; text-align: center; color: #64748b;'>No options data available</p>"
@@ -403,7 +591,7 @@ def options_oi_chart(options_data):
         x=["Calls", "Puts"],
         y=[call_oi, put_oi],
         marker_color=["#22c55e", "#ef4444"],
-        text=[f"{call_oi:,}", f"{put_oi:,}"],
+        texttemplate="%{y:,}",
         textposition="outside",
     ))
     
@@ -422,23 +610,29 @@ def options_oi_chart(options_data):
         paper_bgcolor="#fff",
     )
     
-    return pio.to_html(fig, full_html=False, include_plotlyjs="cdn")
+    return _to_html(fig)
 
 
 def sector_heatmap(sector_data):
     """
     Create a sector performance heatmap.
     """
-    if not HAS_PLOTLY:
+    if not _ensure_plotly():
         return _placeholder()
     if not sector_data:
         return "<p style='padding: 40px; text-align: center; color: #64748b;'>No sector data available</p>"
     
-    names = [s["name"] for s in sector_data]
-    changes = [s["weekly_change"] for s in sector_data]
-    
-    # Color scale: red for negative, green for positive
-    colors = ['#ef4444' if c < -1 else '#f97316' if c < 0 else '#84cc16' if c < 1 else '#22c55e' for c in changes]
+    # One pass fills every bar column
+    n = len(sector_data)
+    names = [None] * n
+    changes = [None] * n
+    colors = [None] * n
+    for i, sector in enumerate(sector_data):
+        c = sector["weekly_change"]
+        names[i] = sector["name"]
+        changes[i] = c
+        # Color scale: red for negative, green for positive
+        colors[i] = '#ef4444' if c < -1 else '#f97316' if c < 0 else '#84cc16' if c < 1 else '#22c55e'
     
     fig = go.Figure(data=[
         go.Bar(
@@ -446,7 +640,7 @@ def sector_heatmap(sector_data):
             y=names,
             orientation='h',
             marker_color=colors,
-            text=[f"{c:+.1f}%" for c in changes],
+            texttemplate='%{x:+.1f}%',
             textposition='outside',
             textfont=dict(size=11),
         )
@@ -463,7 +657,7 @@ def sector_heatmap(sector_data):
         paper_bgcolor="#fff",
     )
     
-    return pio.to_html(fig, full_html=False, include_plotlyjs="cdn")
+    return _to_html(fig)
 
 
 def calculate_beta(ticker_history, benchmark_history):
@@ -474,74 +668,142 @@ def calculate_beta(ticker_history, benchmark_history):
     if not ticker_history or not benchmark_history or len(ticker_history) < 30:
         return None
     
-    # Calculate daily returns
-    stock_returns = []
-    bench_returns = []
-    
-    # Align dates
-    stock_dict = {p.date: p.close for p in ticker_history}
-    bench_dict = {p.date: p.close for p in benchmark_history}
-    
-    common_dates = sorted(set(stock_dict.keys()) & set(bench_dict.keys()))
+    # Align on the shared dates; intersect1d returns them sorted along with
+    # where each one sits in either history
+    stock_dates, stock_closes = _columns(ticker_history)
+    bench_dates, bench_closes = _columns(benchmark_history)
+    common_dates, stock_idx, bench_idx = np.intersect1d(
+        np.array(stock_dates), np.array(bench_dates), return_indices=True
+    )
     
     if len(common_dates) < 30:
         return None
     
-    prev_stock = None
-    prev_bench = None
-    for date in common_dates:
-        if prev_stock is not None and prev_bench is not None:
-            stock_ret = (stock_dict[date] / prev_stock) - 1
-            bench_ret = (bench_dict[date] / prev_bench) - 1
-            stock_returns.append(stock_ret)
-            bench_returns.append(bench_ret)
-        prev_stock = stock_dict[date]
-        prev_bench = bench_dict[date]
+    # Daily returns over the shared dates. Fancy indexing already yields
+    # fresh C-contiguous float64 arrays; the returns are formed in place
+    # so each series allocates one array rather than two
+    stock = stock_closes[stock_idx]
+    bench = bench_closes[bench_idx]
+    stock_returns = np.divide(stock[1:], stock[:-1])
+    stock_returns -= 1
+    bench_returns = np.divide(bench[1:], bench[:-1])
+    bench_returns -= 1
     
     if len(stock_returns) < 20:
         return None
     
-    # Calculate covariance and variance
-    n = len(stock_returns)
-    mean_stock = sum(stock_returns) / n
-    mean_bench = sum(bench_returns) / n
-    
-    covariance = sum((s - mean_stock) * (b - mean_bench) for s, b in zip(stock_returns, bench_returns)) / n
-    variance = sum((b - mean_bench) ** 2 for b in bench_returns) / n
-    
-    if variance == 0:
+    # Population covariance over variance; NaN when the benchmark is flat
+    value = beta(stock_returns, bench_returns)
+    if np.isnan(value):
         return None
     
-    return covariance / variance
+    return float(value)
 
 
-def _rolling(price_history, window):
-    closes = [p.close for p in price_history]
-    values = []
-    for idx in range(len(closes)):
-        if idx + 1 < window:
-            values.append(None)
-        else:
-            values.append(sum(closes[idx + 1 - window : idx + 1]) / window)
-    return values
-
-
-def _rolling_vol(price_history, window):
-    closes = [p.close for p in price_history]
-    returns = []
-    for idx in range(1, len(closes)):
-        returns.append((closes[idx] / closes[idx - 1]) - 1)
-    vols = []
-    for idx in range(len(returns)):
-        if idx + 1 < window:
-            vols.append(None)
+# The price charts of one report are built from the same history. The last
+# list seen is remembered with its dates and closes so the columns are
+# extracted once rather than per chart; holding the reference also keeps
+# its id from being reused while it is remembered.
+_last_series = (None, None)
+
+
+def _series(price_history):
+    """(dates, closes) for a price history, reused for the same list."""
+    global _last_series
+    cached_for, series = _last_series
+    if cached_for is not price_history or len(series[0]) != len(price_history):
+        series = _columns(price_history)
+        _last_series = (price_history, series)
+    return series
+
+
+def _columns(price_history):
+    """Dates list and float64 close array for a sequence of PricePoints."""
+    # Plain comprehensions on purpose: PricePoint has __slots__ and 3.11
+    # specializes slot loads, which is ~2x faster than map(attrgetter(...))
+    return [p.date for p in price_history], _closes(price_history)
+
+
+def _scatter(x, y, **kwargs):
+    """Scatter trace, switched to WebGL (Scattergl) for dense series."""
+    trace = go.Scattergl if len(x) > WEBGL_THRESHOLD else go.Scatter
+    return trace(x=x, y=y, **kwargs)
+
+
+def _thin(x, y):
+    """Trace points, LTTB-reduced to DOWNSAMPLE_POINTS for long series."""
+    if len(x) <= DOWNSAMPLE_THRESHOLD:
+        return x, y
+    values = np.asarray(y, dtype=np.float64)  # None padding becomes NaN
+    # Warm-up gaps are dropped; LTTB runs over the plotted points only
+    finite = np.flatnonzero(np.isfinite(values))
+    keep = finite[_lttb(finite.astype(np.float64), values[finite], DOWNSAMPLE_POINTS)]
+    return [x[i] for i in keep], values[keep]
+
+
+def _aggregate_ohlc(opens, highs, lows, closes, size):
+    """
+    Merge every `size` consecutive bars into one: first open, highest high,
+    lowest low, last close. Returns the start index of each merged bar
+    along with its four columns; the final bar may cover fewer days.
+    """
+    starts = np.arange(0, len(closes), size)
+    ends = np.append(starts[1:], len(closes)) - 1
+    return (
+        starts,
+        opens[starts],
+        np.maximum.reduceat(highs, starts),
+        np.minimum.reduceat(lows, starts),
+        closes[ends],
+    )
+
+
+def _lttb(x, y, n_out):
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets.
+    
+    The first and last points are always kept; each bucket in between
+    contributes the point forming the largest triangle with the previously
+    kept point and the average of the next bucket.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+    a = 0
+    for bucket in range(n_out - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        if bucket == n_out - 3:
+            next_x, next_y = x[-1], y[-1]
         else:
-            window_returns = returns[idx + 1 - window : idx + 1]
-            mean = sum(window_returns) / window
-            var = sum((r - mean) ** 2 for r in window_returns) / window
-            vols.append((var**0.5) * (252**0.5))
-    vols.insert(0, None)
-    return vols
+            next_hi = edges[bucket + 2]
+            next_x, next_y = x[hi:next_hi].mean(), y[hi:next_hi].mean()
+        area = np.abs(
+            (x[a] - next_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        keep[bucket + 1] = a
+    return keep
+
+
+def _closes(price_history):
+    """Close prices as a float64 array from a PriceFrame or a list of PricePoints."""
+    if isinstance(price_history, PriceFrame):
+        return price_history.close
+    return np.fromiter((p.close for p in price_history), dtype=np.float64, count=len(price_history))
+
+
+def _rolling(closes, window):
+    """Trailing simple moving average, None until the window fills."""
+    return [None] * min(window - 1, len(closes)) + rolling_mean_kernel(window)(closes).tolist()
+
+
+def _rolling_vol(closes, window):
+    """Annualized trailing volatility of daily returns; None for the return shift and warm-up."""
+    return [None] * min(window, len(closes)) + rolling_vol(closes, window).tolist()
 
 
 def _placeholder():
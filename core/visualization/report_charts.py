@@ -1,25 +1,69 @@
 import base64
+import io
 
-try:
-    import plotly.graph_objects as go
-    import plotly.io as pio
-    HAS_PLOTLY = True
-except ImportError:
-    go = None
-    pio = None
-    HAS_PLOTLY = False
+REPORT_CHART_HEIGHT = 420
 
+# As in plotly_charts, plotly is imported when the first report chart is
+# built, so the CLI doesn't pay for it on runs that write no report
+go = None
+pio = None
+_plotly_loaded = None
 
-def _fig_to_base64(fig):
-    if not HAS_PLOTLY:
-        return None
-    fig.update_layout(template="plotly_dark", height=420, margin=dict(l=40, r=20, t=40, b=40))
-    image_bytes = pio.to_image(fig, format="png", scale=2)
-    return base64.b64encode(image_bytes).decode("utf-8")
+
+def _ensure_plotly():
+    """Import plotly once; False if it isn't installed."""
+    global go, pio, _plotly_loaded
+    if _plotly_loaded is None:
+        try:
+            import plotly.graph_objects as go
+            import plotly.io as pio
+        except ImportError:
+            _plotly_loaded = False
+        else:
+            _plotly_loaded = True
+    return _plotly_loaded
+
+
+def _styled(fig):
+    fig.update_layout(
+        template="plotly_dark", height=REPORT_CHART_HEIGHT, margin=dict(l=40, r=20, t=40, b=40)
+    )
+    return fig
+
+
+def render_all(figs):
+    """
+    Export report figures as base64 PNGs in one Kaleido session.
+    
+    Each pio.to_image() call starts its own browser under Kaleido 1.x, so
+    the figures are written together with pio.write_images(); older
+    plotly/Kaleido without it export one by one. None entries (charts with
+    no data) map to None.
+    """
+    figs = list(figs)
+    images = [None] * len(figs)
+    present = [idx for idx, fig in enumerate(figs) if fig is not None]
+    if not present:
+        return images
+    buffers = [io.BytesIO() for _ in present]
+    try:
+        pio.write_images(
+            [figs[idx] for idx in present],
+            buffers,
+            format="png",
+            scale=2,
+            height=REPORT_CHART_HEIGHT,
+        )
+        image_bytes = [buffer.getvalue() for buffer in buffers]
+    except AttributeError:
+        image_bytes = [pio.to_image(figs[idx], format="png", scale=2) for idx in present]
+    for idx, data in zip(present, image_bytes):
+        images[idx] = base64.b64encode(data).decode("utf-8")
+    return images
 
 
 def price_chart(price_history):
-    if not HAS_PLOTLY:
+    if not _ensure_plotly():
         return None
     if not price_history:
         return None
@@ -36,11 +80,11 @@ def price_chart(price_history):
         ]
     )
     fig.update_layout(title="Price (Candlestick)")
-    return _fig_to_base64(fig)
+    return _styled(fig)
 
 
 def relative_chart(price_history, benchmark_history):
-    if not HAS_PLOTLY:
+    if not _ensure_plotly():
         return None
     if not price_history or not benchmark_history:
         return None
@@ -62,11 +106,11 @@ def relative_chart(price_history, benchmark_history):
         )
     )
     fig.update_layout(title="Relative Performance")
-    return _fig_to_base64(fig)
+    return _styled(fig)
 
 
 def fundamentals_chart(time_series):
-    if not HAS_PLOTLY:
+    if not _ensure_plotly():
         return None
     if not time_series:
         return None
@@ -74,14 +118,14 @@ def fundamentals_chart(time_series):
     for name, series in time_series.items():
         if not series:
             continue
-        dates = list(sorted(series.keys()))
-        fig.add_trace(go.Scatter(x=dates, y=[series[d] for d in dates], name=name))
+        dates, values = zip(*sorted(series.items()))
+        fig.add_trace(go.Scatter(x=dates, y=values, name=name))
     fig.update_layout(title="Fundamental Trends")
-    return _fig_to_base64(fig)
+    return _styled(fig)
 
 
 def peers_chart(peer_metrics):
-    if not HAS_PLOTLY:
+    if not _ensure_plotly():
         return None
     if not peer_metrics:
         return None
@@ -94,11 +138,11 @@ def peers_chart(peer_metrics):
         )
     )
     fig.update_layout(title="Peer P/E Comparison")
-    return _fig_to_base64(fig)
+    return _styled(fig)
 
 
 def sentiment_chart(news_items):
-    if not HAS_PLOTLY:
+    if not _ensure_plotly():
         return None
     if not news_items:
         return None
@@ -111,4 +155,4 @@ def sentiment_chart(news_items):
         )
     )
     fig.update_layout(title="News Volume (Recent)")
-    return _fig_to_base64(fig)
+    return _styled(fig)
@@ -0,0 +1,189 @@
+import unittest
+from datetime import datetime, timedelta
+
+from core.data_service import DataService
+from core.models import TickerContext
+from core.providers.base import RateLimitError
+
+
+class DictCache:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key, ttl_seconds):
+        if key not in self.store:
+            return None, None
+        data, stored_at = self.store[key]
+        if datetime.utcnow() > stored_at + timedelta(seconds=ttl_seconds):
+            return None, None
+        return data, stored_at
+
+    def set(self, key, data):
+        stored_at = datetime.utcnow()
+        self.store[key] = (data, stored_at)
+        return stored_at
+
+
+class TestFetchCached(unittest.TestCase):
+    def setUp(self):
+        self.cache = DictCache()
+        self.service = DataService(provider=object(), cache=self.cache)
+        self.calls = 0
+
+    def _fetcher(self, value):
+        def fetch():
+            self.calls += 1
+            return value
+        return fetch
+
+    def test_empty_result_is_cached(self):
+        self.service._fetch_cached("news", 1800, self._fetcher([]), "AAPL")
+        self.service._fetch_cached("news", 1800, self._fetcher([]), "AAPL")
+        self.assertEqual(self.calls, 1)
+
+    def test_empty_result_uses_full_ttl(self):
+        self.service._fetch_cached("news", 1800, self._fetcher([]), "AAPL")
+        key = next(iter(self.cache.store))
+        data, stored_at = self.cache.store[key]
+        self.cache.store[key] = (data, stored_at - timedelta(minutes=10))
+        self.service._fetch_cached("news", 1800, self._fetcher(["item"]), "AAPL")
+        self.assertEqual(self.calls, 1)
+
+    def test_non_empty_result_uses_full_ttl(self):
+        self.service._fetch_cached("news", 1800, self._fetcher(["item"]), "AAPL")
+        key = next(iter(self.cache.store))
+        data, stored_at = self.cache.store[key]
+        self.cache.store[key] = (data, stored_at - timedelta(minutes=10))
+        result, _ = self.service._fetch_cached("news", 1800, self._fetcher([]), "AAPL")
+        self.assertEqual(result, ["item"])
+        self.assertEqual(self.calls, 1)
+
+
+class BatchProvider:
+    def __init__(self):
+        self.calls = []
+
+    def get_price_histories(self, tickers, start, end, interval):
+        self.calls.append(tuple(tickers))
+        return {ticker: [ticker] for ticker in tickers}
+
+    def get_price_history(self, ticker, start, end, interval):
+        self.calls.append(ticker)
+        return [ticker]
+
+
+class SnapshotProvider(BatchProvider):
+    def get_ticker_context(self, ticker):
+        return TickerContext(
+            ticker=ticker, company_name=ticker, sector=None, industry=None,
+            exchange=None, currency=None, peers=[], benchmark="SPY",
+        )
+
+    def get_fundamentals(self, ticker):
+        return {}
+
+    def get_financial_statements(self, ticker):
+        return {}
+
+    def get_news(self, ticker, start, end):
+        return []
+
+    def get_social_posts(self, ticker, start, end):
+        return []
+
+    def get_peers(self, ticker):
+        return []
+
+    def get_sector_etf(self, ticker):
+        return None
+
+    def get_earnings(self, ticker):
+        return {}
+
+
+class TestGetPriceHistories(unittest.TestCase):
+    def test_only_uncached_tickers_are_batched(self):
+        provider = BatchProvider()
+        service = DataService(provider=provider, cache=DictCache())
+        service.get_price_histories(["AAPL", "SPY"], "2024-01-01", "2024-06-01", "1d")
+        result = service.get_price_histories(["AAPL", "SPY", "QQQ"], "2024-01-01", "2024-06-01", "1d")
+        self.assertEqual(result["QQQ"], ["QQQ"])
+        self.assertEqual(provider.calls, [("AAPL", "SPY"), "QQQ"])
+
+    def test_snapshot_batches_benchmark_for_get_benchmark_prices(self):
+        provider = SnapshotProvider()
+        service = DataService(provider=provider, cache=DictCache())
+        snapshot = service.build_snapshot("AAPL", "2024-01-01", "2024-06-01", "1d")
+        benchmark = service.get_benchmark_prices("SPY", "2024-01-01", "2024-06-01", "1d")
+        self.assertEqual(snapshot.price_history, ["AAPL"])
+        self.assertEqual(benchmark, ["SPY"])
+        self.assertEqual(provider.calls, [("AAPL", "SPY")])
+
+
+class ThrottledProvider(SnapshotProvider):
+    def __init__(self, throttled):
+        super().__init__()
+        self.throttled = throttled
+
+    def get_price_histories(self, tickers, start, end, interval):
+        raise RateLimitError("throttled")
+
+    def get_price_history(self, ticker, start, end, interval):
+        if ticker in self.throttled:
+            raise RateLimitError(f"throttled {ticker}")
+        return [ticker]
+
+
+class TestRateLimitedPrices(unittest.TestCase):
+    def test_throttled_benchmark_degrades_to_empty(self):
+        service = DataService(provider=ThrottledProvider({"SPY"}), cache=DictCache())
+        self.assertEqual(service.get_benchmark_prices("SPY", "2024-01-01", "2024-06-01", "1d"), [])
+        self.assertEqual(service.cache.store, {})
+
+    def test_throttled_secondary_symbols_degrade_to_empty(self):
+        cache = DictCache()
+        service = DataService(provider=ThrottledProvider({"SPY"}), cache=cache)
+        service.get_price_histories(["AAPL"], "2024-01-01", "2024-06-01", "1d")
+        snapshot = service.build_snapshot("AAPL", "2024-01-01", "2024-06-01", "1d")
+        self.assertEqual(snapshot.price_history, ["AAPL"])
+        self.assertEqual(service.get_price_histories(["MSFT", "SPY"], "2024-01-01", "2024-06-01", "1d"),
+                         {"MSFT": [], "SPY": []})
+
+    def test_throttled_ticker_still_raises(self):
+        service = DataService(provider=ThrottledProvider({"AAPL"}), cache=DictCache())
+        with self.assertRaises(RateLimitError):
+            service.build_snapshot("AAPL", "2024-01-01", "2024-06-01", "1d")
+
+
+class PeerProvider:
+    def __init__(self):
+        self.single = []
+
+    def fetch_many(self, tickers, attrs):
+        return {("MSFT", "info"): {"trailingPE": 30.0}, ("ORCL", "info"): None}
+
+    def get_fundamentals(self, ticker, info=None):
+        if info is None:
+            self.single.append(ticker)
+            info = {"trailingPE": 20.0}
+        return {"pe_ratio": info.get("trailingPE")}
+
+
+class TestGetPeerFundamentals(unittest.TestCase):
+    def test_failed_batch_info_falls_back_to_single_fetch(self):
+        provider = PeerProvider()
+        service = DataService(provider=provider, cache=DictCache())
+        result = service.get_peer_fundamentals(["MSFT", "ORCL"])
+        self.assertEqual(result, {"MSFT": {"pe_ratio": 30.0}, "ORCL": {"pe_ratio": 20.0}})
+        self.assertEqual(provider.single, ["ORCL"])
+
+    def test_cached_peers_skip_the_provider(self):
+        provider = PeerProvider()
+        service = DataService(provider=provider, cache=DictCache())
+        service.get_peer_fundamentals(["MSFT", "ORCL"])
+        service.get_peer_fundamentals(["MSFT", "ORCL"])
+        self.assertEqual(provider.single, ["ORCL"])
+
+
+if __name__ == "__main__":
+    unittest.main()
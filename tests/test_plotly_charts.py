@@ -0,0 +1,150 @@
+import re
+import unittest
+
+import numpy as np
+
+from core.models import PricePoint
+from core.visualization import _kernels, plotly_charts
+
+_DIV_ID = re.compile(r"[0-9a-f]{32}")
+
+
+def _points(closes):
+    return [
+        PricePoint(date=f"2024-01-{idx + 1:02d}", open=c, high=c, low=c, close=c, volume=100)
+        for idx, c in enumerate(closes)
+    ]
+
+
+@unittest.skipUnless(plotly_charts._ensure_plotly(), "plotly not installed")
+class TestChartCache(unittest.TestCase):
+    def setUp(self):
+        plotly_charts.clear_chart_cache()
+
+    def test_unchanged_history_reuses_figure(self):
+        first = plotly_charts.volume_chart(_points(range(1, 26)))
+        second = plotly_charts.volume_chart(_points(range(1, 26)))
+        self.assertEqual(len(plotly_charts._chart_cache), 1)
+        self.assertEqual(_DIV_ID.sub("", first), _DIV_ID.sub("", second))
+
+    def test_repeated_chart_gets_fresh_div_id(self):
+        first = plotly_charts.volume_chart(_points(range(1, 26)))
+        second = plotly_charts.volume_chart(_points(range(1, 26)))
+        self.assertNotEqual(_DIV_ID.search(first)[0], _DIV_ID.search(second)[0])
+
+    def test_new_point_rerenders(self):
+        plotly_charts.volume_chart(_points(range(1, 26)))
+        plotly_charts.volume_chart(_points(range(1, 27)))
+        self.assertEqual(len(plotly_charts._chart_cache), 2)
+
+    def test_interior_revision_and_ticker_rerender(self):
+        plotly_charts.volume_chart(_points(range(1, 26)), "AAPL")
+        plotly_charts.volume_chart(_points(range(1, 26)), "MSFT")
+        revised = list(range(1, 26))
+        revised[12] = 99
+        plotly_charts.volume_chart(_points(revised), "AAPL")
+        self.assertEqual(len(plotly_charts._chart_cache), 3)
+
+    def test_cache_size_is_bounded(self):
+        for end in range(26, 26 + plotly_charts.CHART_CACHE_SIZE + 5):
+            plotly_charts.volume_chart(_points(range(1, end)))
+        self.assertEqual(len(plotly_charts._chart_cache), plotly_charts.CHART_CACHE_SIZE)
+
+
+@unittest.skipUnless(plotly_charts._ensure_plotly(), "plotly not installed")
+class TestPriceCandlestick(unittest.TestCase):
+    def _trace_type(self, bars):
+        closes = 100 + np.sin(np.arange(bars))
+        return plotly_charts._price_candlestick(_points(closes), False, False, False).data[0].type
+
+    def test_density_picks_trace(self):
+        self.assertEqual(self._trace_type(250), "candlestick")
+        self.assertEqual(self._trace_type(plotly_charts.OHLC_THRESHOLD), "candlestick")
+        self.assertEqual(self._trace_type(plotly_charts.OHLC_THRESHOLD + 1), "ohlc")
+
+
+class TestLttb(unittest.TestCase):
+    def test_keeps_endpoints_and_extremes(self):
+        y = np.zeros(5000)
+        y[1234] = 10.0
+        keep = plotly_charts._lttb(np.arange(5000.0), y, 100)
+        self.assertEqual(len(keep), 100)
+        self.assertEqual((keep[0], keep[-1]), (0, 4999))
+        self.assertIn(1234, keep)
+        self.assertTrue((np.diff(keep) > 0).all())
+
+    def test_short_series_is_untouched(self):
+        keep = plotly_charts._lttb(np.arange(50.0), np.ones(50), 100)
+        self.assertEqual(keep.tolist(), list(range(50)))
+
+
+class TestAggregateOhlc(unittest.TestCase):
+    def test_buckets_keep_open_extremes_and_close(self):
+        values = np.arange(12.0)
+        starts, opens, highs, lows, closes = plotly_charts._aggregate_ohlc(
+            values, values + 100, values - 100, values + 0.5, 5
+        )
+        self.assertEqual(starts.tolist(), [0, 5, 10])
+        self.assertEqual(opens.tolist(), [0, 5, 10])
+        self.assertEqual(highs.tolist(), [104, 109, 111])
+        self.assertEqual(lows.tolist(), [-100, -95, -90])
+        self.assertEqual(closes.tolist(), [4.5, 9.5, 11.5])
+
+
+class TestChartKernels(unittest.TestCase):
+    def test_loop_and_numpy_kernels_agree(self):
+        rng = np.random.default_rng(0)
+        closes = 100 * np.cumprod(1 + rng.normal(0, 0.02, 300))
+        for window in (2, 5, 20):
+            np.testing.assert_allclose(
+                _kernels._rolling_vol_loop(closes, window),
+                _kernels._rolling_vol_numpy(closes, window),
+                atol=1e-9,
+            )
+        stock, bench = rng.normal(0, 0.02, (2, 250))
+        self.assertAlmostEqual(
+            _kernels._beta_loop(stock, bench), _kernels._beta_numpy(stock, bench), places=12
+        )
+        self.assertTrue(np.isnan(_kernels._beta_loop(stock, np.zeros(250))))
+
+    def test_nan_close_only_blanks_its_windows(self):
+        closes = np.arange(1.0, 61.0)
+        closes[10] = np.nan
+        means = np.array(plotly_charts._rolling(closes, 20), dtype=float)
+        self.assertTrue(np.isnan(means[10:30]).all())
+        np.testing.assert_allclose(means[30:], np.convolve(closes[11:], np.ones(20) / 20, "valid"))
+
+    def test_gap_only_blanks_its_volatility_windows(self):
+        rng = np.random.default_rng(1)
+        closes = 100 * np.cumprod(1 + rng.normal(0, 0.02, 80))
+        clean = _kernels._rolling_vol_numpy(closes, 20)
+        # A NaN close spoils returns 29 and 30; a zero close only return 30
+        # (return 29 is a finite -100%), so fewer windows are blanked
+        for bad, first in ((np.nan, 10), (0.0, 11)):
+            gapped = closes.copy()
+            gapped[30] = bad
+            vols = _kernels._rolling_vol_numpy(gapped, 20)
+            self.assertTrue(np.isnan(vols[first:31]).all())
+            self.assertFalse(np.isnan(vols[:first]).any())
+            np.testing.assert_allclose(vols[:10], clean[:10])
+            np.testing.assert_allclose(vols[31:], clean[31:])
+
+    @unittest.skipUnless(_kernels.HAS_NUMBA, "numba not installed")
+    def test_compiled_kernels_match_numpy(self):
+        rng = np.random.default_rng(2)
+        closes = 100 * np.cumprod(1 + rng.normal(0, 0.02, 300))
+        closes[150] = np.nan
+        for window in (2, 20, 50):
+            np.testing.assert_allclose(
+                _kernels.rolling_vol(closes, window),
+                _kernels._rolling_vol_numpy(closes, window),
+                atol=1e-9,
+            )
+            np.testing.assert_allclose(
+                _kernels.rolling_mean_kernel(window)(closes),
+                _kernels._rolling_mean_numpy(closes, window),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from core import _scoring_kernels, scoring_service
+from core.analysis_models import (
+    AnalysisPack,
+    EarningsSummary,
+    FundamentalAnalytics,
+    PeerComparison,
+    PriceAnalytics,
+    SentimentSummary,
+    TechnicalIndicators,
+)
+from core.scoring_service import ScoringService
+
+
+def _pack(rsi=None, roe=None, pe=None, volatility=None, headline_volume=0, peer_ranks=None):
+    return AnalysisPack(
+        price=PriceAnalytics(0.12, 0.25, -0.2, 1.1, 0.8, {"1m": 0.03, "3m": 0.0}),
+        technicals=TechnicalIndicators(
+            100, 98, 90, rsi, 1.2, 0.9, 110, 90,
+            {"1w": "bullish", "1m": "neutral", "3m": ""},
+        ),
+        fundamentals=FundamentalAnalytics(
+            valuation={"pe_ratio": pe, "forward_pe": 18.0, "peg_ratio": 0},
+            profitability={"roe": roe, "operating_margins": 0.21},
+            growth={"revenue_growth": 0.08, "earnings_growth": None},
+            balance_sheet={},
+            time_series={},
+        ),
+        risk={"volatility": volatility, "beta": 1.3, "max_drawdown": None},
+        peers=PeerComparison([], peer_ranks or {}),
+        sentiment=SentimentSummary(0.1, headline_volume, 0, [], headline_volume, 0),
+        earnings=EarningsSummary(None, []),
+        recommendation=None,
+    )
+
+
+@mock.patch.object(scoring_service, "HAS_MARKET_DATA", False)
+class TestScoreBatch(unittest.TestCase):
+    def test_matches_single_scores(self):
+        analyses = [
+            _pack(),
+            _pack(rsi=25, roe=0.18, pe=22, volatility=0.3, headline_volume=4),
+            _pack(rsi=75, roe=-0.05, pe=60, peer_ranks={"pe_ratio": 20, "roe": None}),
+            _pack(rsi=50, roe=0.4, peer_ranks={"roe": 90, "debt_to_equity": 40}),
+            # Short history: _rsi returns NaN under 14 bars
+            _pack(rsi=float("nan"), roe=0.2),
+        ]
+        quote_types = np.array(["EQUITY", "EQUITY", "ETF", "EQUITY", "EQUITY"])
+        service = ScoringService()
+
+        batch = service.score_batch(analyses, quote_types=quote_types)
+        single = [
+            service.score(analysis, 80, quote_type=quote_type).score
+            for analysis, quote_type in zip(analyses, quote_types)
+        ]
+        self.assertEqual(batch.tolist(), single)
+
+    def test_confidence_matches_single_scores(self):
+        analyses = [_pack(), _pack(rsi=25, roe=0.18, pe=22, volatility=0.3, headline_volume=4)]
+        completeness = [90, 40]
+        service = ScoringService()
+
+        _, confidence = service.score_batch(analyses, completeness=completeness)
+        single = [
+            service.score(analysis, pct).confidence
+            for analysis, pct in zip(analyses, completeness)
+        ]
+        self.assertEqual(confidence.tolist(), single)
+
+    def test_triggers_match_single_scores(self):
+        analyses = [_pack(), _pack(rsi=75, roe=-0.05, pe=60), _pack(rsi=50, roe=0.4)]
+        service = ScoringService()
+
+        _, triggers = service.score_batch(analyses, triggers=True)
+        single = [service.score(analysis, 80).triggers for analysis in analyses]
+        self.assertEqual(triggers, single)
+
+
+@mock.patch.object(scoring_service, "HAS_MARKET_DATA", False)
+class TestScoreCache(unittest.TestCase):
+    def setUp(self):
+        scoring_service._score_cache.clear()
+
+    def test_identical_analysis_reuses_result(self):
+        service = ScoringService()
+        first = service.score(_pack(rsi=45, roe=0.2), 80)
+        with mock.patch.object(service, "_market_score") as market_score:
+            second = service.score(_pack(rsi=45, roe=0.2), 80)
+        market_score.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(len(scoring_service._score_cache), 1)
+
+    def test_callers_get_independent_copies(self):
+        service = ScoringService()
+        first = service.score(_pack(rsi=45, roe=0.2), 80)
+        first.triggers.append("annotated")
+        first.contributions["technical"] = -1
+        second = service.score(_pack(rsi=45, roe=0.2), 80)
+        self.assertNotIn("annotated", second.triggers)
+        self.assertNotEqual(second.contributions["technical"], -1)
+
+    @mock.patch.object(scoring_service, "SCORE_CACHE_SIZE", 2)
+    def test_cache_evicts_least_recently_used(self):
+        service = ScoringService()
+        service.score(_pack(rsi=30), 80)
+        service.score(_pack(rsi=40), 80)
+        service.score(_pack(rsi=30), 80)
+        service.score(_pack(rsi=50), 80)
+        self.assertEqual(len(scoring_service._score_cache), 2)
+        with mock.patch.object(service, "_market_score") as market_score:
+            service.score(_pack(rsi=30), 80)
+        market_score.assert_not_called()
+
+    def test_changed_input_rescores(self):
+        service = ScoringService()
+        first = service.score(_pack(rsi=45, roe=0.2), 80)
+        second = service.score(_pack(rsi=75, roe=0.2), 80)
+        self.assertIsNot(first, second)
+        self.assertEqual(len(scoring_service._score_cache), 2)
+
+
+class TestFormatFactorDetails(unittest.TestCase):
+    def test_numbers_render_lazily(self):
+        details = scoring_service.format_factor_details(
+            {"risk": {"volatility": 0.2345, "beta": None, "explanation": "x"}}
+        )["risk"]
+        self.assertEqual(str(details["volatility"]), "23.4%")
+        self.assertEqual(float(details["volatility"]), 0.2345)
+        self.assertEqual(str(details["beta"]), "N/A")
+        self.assertEqual(details["explanation"], "x")
+
+
+class TestWeightedScoreKernel(unittest.TestCase):
+    def test_loop_and_numpy_kernels_agree(self):
+        rng = np.random.default_rng(0)
+        factors = rng.uniform(-20, 130, size=(50, 8))
+        weights = rng.uniform(0, 0.3, size=(50, 8))
+        loop, loop_contributions = _scoring_kernels._weighted_score_loop(factors, weights, 58, 42)
+        vectorized, contributions = _scoring_kernels._weighted_score_numpy(factors, weights, 58, 42)
+        np.testing.assert_array_equal(loop, vectorized)
+        np.testing.assert_array_equal(loop_contributions, contributions)
+        self.assertTrue(((loop[:, 0] >= 0) & (loop[:, 0] <= 100)).all())
+        self.assertEqual(set(loop[:, 1]) - {0, 1, 2}, set())
+
+
+@mock.patch.object(scoring_service, "HAS_MARKET_DATA", True)
+class TestMarketScore(unittest.TestCase):
+    def setUp(self):
+        scoring_service._market_cache.clear()
+        scoring_service._market_down_until = 0.0
+
+    def tearDown(self):
+        scoring_service._market_cache.clear()
+        scoring_service._market_down_until = 0.0
+
+    def test_upstream_failure_falls_back_to_neutral(self):
+        with mock.patch.object(scoring_service, "analyze_market_sentiment", side_effect=ConnectionError):
+            score, _ = ScoringService()._market_score("Technology")
+        self.assertEqual(score, 50)
+
+    def test_code_errors_propagate(self):
+        with mock.patch.object(scoring_service, "analyze_market_sentiment", side_effect=AttributeError):
+            with self.assertRaises(AttributeError):
+                ScoringService()._market_score("Technology")
+
+
+if __name__ == "__main__":
+    unittest.main()
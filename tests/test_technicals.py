@@ -0,0 +1,45 @@
+import unittest
+
+from core.analytics.technicals import build_technical_indicators
+from core.models import PriceFrame, PricePoint
+
+
+def _points(closes):
+    return [
+        PricePoint(date=f"2024-01-{idx + 1:02d}", open=c, high=c, low=c, close=c, volume=100)
+        for idx, c in enumerate(closes)
+    ]
+
+
+class TestTechnicalIndicators(unittest.TestCase):
+    def test_moving_average_and_bands(self):
+        technicals = build_technical_indicators(_points(range(1, 26)))
+        self.assertAlmostEqual(technicals.ma_20, 15.5)
+        self.assertGreater(technicals.bollinger_upper, technicals.ma_20)
+        self.assertLess(technicals.bollinger_lower, technicals.ma_20)
+        self.assertIsNone(technicals.ma_50)
+        self.assertEqual(technicals.trend_by_horizon["1w"], "bullish")
+
+    def test_revised_interior_bar_is_recomputed(self):
+        closes = list(range(1, 26))
+        first = build_technical_indicators(_points(closes), "AAPL", "1d")
+        closes[12] = 100
+        revised = build_technical_indicators(_points(closes), "AAPL", "1d")
+        self.assertNotEqual(first.ma_20, revised.ma_20)
+
+    def test_cached_result_is_immutable(self):
+        technicals = build_technical_indicators(_points(range(1, 26)))
+        with self.assertRaises(AttributeError):
+            technicals.ma_20 = 0
+        with self.assertRaises(TypeError):
+            technicals.trend_by_horizon["1w"] = "bearish"
+
+    def test_price_frame_sorts_by_date(self):
+        points = _points([1, 2, 3])
+        frame = PriceFrame.from_points(list(reversed(points)))
+        self.assertEqual(list(frame.close), [1.0, 2.0, 3.0])
+        self.assertEqual(len(frame), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
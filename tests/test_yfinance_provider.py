@@ -0,0 +1,40 @@
+import unittest
+from unittest import mock
+
+from core.providers import yfinance_provider
+from core.providers.yfinance_provider import YFinanceProvider
+
+
+class FakeTicker:
+    def __init__(self, symbol):
+        self.info = {"symbol": symbol}
+
+
+class TestInfoCache(unittest.TestCase):
+    def setUp(self):
+        YFinanceProvider._info_cache.clear()
+        YFinanceProvider._ticker_cache.clear()
+
+    def tearDown(self):
+        YFinanceProvider._info_cache.clear()
+        YFinanceProvider._ticker_cache.clear()
+
+    @mock.patch.object(yfinance_provider.yf, "Ticker", side_effect=FakeTicker)
+    def test_info_outlives_the_provider_instance(self, ticker):
+        YFinanceProvider()._safe_get_info("AAPL")
+        info = YFinanceProvider()._safe_get_info("AAPL")
+        self.assertEqual(info, {"symbol": "AAPL"})
+        ticker.assert_called_once_with("AAPL")
+
+    @mock.patch.object(yfinance_provider, "INFO_CACHE_SIZE", 2)
+    @mock.patch.object(yfinance_provider.yf, "Ticker", side_effect=FakeTicker)
+    def test_cache_size_is_bounded(self, _ticker):
+        provider = YFinanceProvider()
+        for symbol in ("AAPL", "MSFT", "NVDA"):
+            provider._safe_get_info(symbol)
+        self.assertEqual(list(YFinanceProvider._info_cache), ["MSFT", "NVDA"])
+        self.assertEqual(len(YFinanceProvider._ticker_cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()